@@ -0,0 +1,746 @@
+"""
+Backend Abstraction Layer — Jacobian coordinates
+
+Same interface as backend_pyecc, but points are kept in Jacobian
+coordinates (X, Y, Z) ↦ (X/Z², Y/Z³), so point additions and doublings
+need no field inversion. Coordinates are the Fq and Fq2 classes of
+fields.py (on gmpy2 integers when available, see bigint.py).
+
+Points are converted to their canonical affine form only at API
+boundaries: equality, hashing, str/repr (which transcripts hash) and
+pairing inputs. str() of a point is identical to the py_ecc tuple the
+affine backend would produce for the same point.
+"""
+
+from py_ecc.fields import (
+    bls12_381_FQ as AffineFQ,
+    bls12_381_FQ2 as AffineFQ2,
+)
+
+from py_ecc.bls12_381.bls12_381_curve import (
+    curve_order,  # The order p of the elliptic curve
+    G1 as _AFFINE_G1,
+    G2 as _AFFINE_G2,
+)
+
+import secrets
+
+from bn254.optim.config import get_optim
+from bn254.optim.wnaf import resolve_window
+
+from . import pairing as _pairing
+from .fields import Fq, Fq2
+from .endomorphism import GLV_BETA, PSI_COEFF_X, PSI_COEFF_Y, glv_mul, glv_split_terms, gls_msm, gls_mul
+from .hash_to_curve import hash_to_g1_affine
+from .gt import GT_ONE, gt_from_bytes, gt_inv, gt_mul, gt_multi_pow, gt_pow, gt_to_bytes
+from .pairing import PreparedG2
+from .msm import PIPPENGER_THRESHOLD, msm_naive, msm_pippenger
+from .precompute import FIXED_BUILD_AFTER, FixedBaseRegistry
+from .subgroup import (
+    G1_CHECK_COST,
+    G1_COFACTOR_MIN_PRIME,
+    G2_CHECK_COST,
+    G2_COFACTOR_MIN_PRIME,
+    SIGMA_BETA,
+    batch_check,
+    g1_check,
+    g2_check,
+)
+
+# -----------------------------------------------
+# Points — Jacobian representation
+
+class JacobianPoint:
+    """
+    A curve point (X : Y : Z) over Fq (G1) or Fq2 (G2).
+
+    Z = 0 encodes the point at infinity. The affine form is computed at
+    most once per object and cached.
+    """
+
+    __slots__ = ("x", "y", "z", "_affine")
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+        self._affine = None
+
+    @classmethod
+    def from_affine(cls, P, field):
+        """Lift an affine py_ecc point (or None) into Jacobian coordinates."""
+        if P is None:
+            return cls(field.one(), field.one(), field.zero())
+        if field is Fq2:
+            x, y = (Fq2(*(int(c) for c in coord.coeffs)) for coord in P)
+        else:
+            x, y = (Fq(int(coord)) for coord in P)
+        return cls(x, y, field.one())
+
+    def is_identity(self) -> bool:
+        return self.z == self.z.zero()
+
+    def affine(self):
+        """
+        Canonical affine coordinates as plain integers.
+
+        Returns:
+            tuple | None: (x, y) for G1, ((x0, x1), (y0, y1)) for G2, None at infinity
+        """
+        if self._affine is None:
+            if self.is_identity():
+                self._affine = ()
+            else:
+                z_inv = self.z.__class__.one() / self.z
+                z_inv2 = z_inv * z_inv
+                x, y = self.x * z_inv2, self.y * z_inv2 * z_inv
+                if isinstance(x, Fq2):
+                    self._affine = (x.coeffs, y.coeffs)
+                else:
+                    self._affine = (int(x), int(y))
+        return self._affine or None
+
+    def to_pyecc(self):
+        """Convert to the affine py_ecc tuple used by backend_pyecc (None at infinity)."""
+        A = self.affine()
+        if A is None:
+            return None
+        if isinstance(A[0], tuple):
+            return (AffineFQ2(list(A[0])), AffineFQ2(list(A[1])))
+        return (AffineFQ(A[0]), AffineFQ(A[1]))
+
+    def __eq__(self, other):
+        if other is None:
+            return self.is_identity()
+        if not isinstance(other, JacobianPoint):
+            return NotImplemented
+        return self.affine() == other.affine()
+
+    def __hash__(self):
+        return hash(self.affine())
+
+    def __bool__(self):
+        return not self.is_identity()
+
+    def __repr__(self):
+        return str(self.to_pyecc())
+
+    __str__ = __repr__
+
+
+def _jac_double(P):
+    """
+    Point doubling for y² = x³ + b (a = 0), dbl-2009-l: 2M + 5S.
+    """
+    if P.is_identity():
+        return P
+    X, Y, Z = P.x, P.y, P.z
+    A = X * X
+    B = Y * Y
+    C = B * B
+    D = X + B
+    D = 2 * (D * D - A - C)
+    E = 3 * A
+    F = E * E
+    X3 = F - 2 * D
+    Y3 = E * (D - X3) - 8 * C
+    Z3 = 2 * Y * Z
+    return JacobianPoint(X3, Y3, Z3)
+
+
+def _jac_add(P, Q):
+    """
+    Point addition, add-2007-bl: 11M + 5S, falls back to doubling for P = Q.
+
+    If one operand is normalized (Z = 1, see batch_normalize) the mixed
+    formula madd-2007-bl is used instead: 7M + 4S.
+    """
+    if P.is_identity():
+        return Q
+    if Q.is_identity():
+        return P
+    if P.z == _ONES[P.z.__class__]:
+        P, Q = Q, P
+    if Q.z == _ONES[Q.z.__class__]:
+        return _jac_madd(P, Q)
+    Z1Z1 = P.z * P.z
+    Z2Z2 = Q.z * Q.z
+    U1 = P.x * Z2Z2
+    U2 = Q.x * Z1Z1
+    S1 = P.y * Q.z * Z2Z2
+    S2 = Q.y * P.z * Z1Z1
+    H = U2 - U1
+    r = 2 * (S2 - S1)
+    zero = H.zero()
+    if H == zero:
+        if r == zero:
+            return _jac_double(P)
+        return JacobianPoint(P.x.one(), P.x.one(), zero)
+    I = 2 * H
+    I = I * I
+    J = H * I
+    V = U1 * I
+    X3 = r * r - J - 2 * V
+    Y3 = r * (V - X3) - 2 * S1 * J
+    Z3 = P.z + Q.z
+    Z3 = (Z3 * Z3 - Z1Z1 - Z2Z2) * H
+    return JacobianPoint(X3, Y3, Z3)
+
+
+def _jac_madd(P, Q):
+    """
+    Mixed addition P + Q for Q with Z = 1, madd-2007-bl: 7M + 4S.
+    """
+    Z1Z1 = P.z * P.z
+    U2 = Q.x * Z1Z1
+    S2 = Q.y * P.z * Z1Z1
+    H = U2 - P.x
+    r = 2 * (S2 - P.y)
+    zero = H.zero()
+    if H == zero:
+        if r == zero:
+            return _jac_double(P)
+        return JacobianPoint(P.x.one(), P.x.one(), zero)
+    HH = H * H
+    I = 4 * HH
+    J = H * I
+    V = P.x * I
+    X3 = r * r - J - 2 * V
+    Y3 = r * (V - X3) - 2 * P.y * J
+    Z3 = P.z + H
+    Z3 = Z3 * Z3 - Z1Z1 - HH
+    return JacobianPoint(X3, Y3, Z3)
+
+
+# Z = 1 marks a normalized point
+_ONES = {Fq: Fq.one(), Fq2: Fq2.one()}
+
+
+def batch_normalize(points) -> list:
+    """
+    Bring points to the normalized form Z = 1 with a single field inversion.
+
+    Montgomery's trick: invert the product z1·…·zn once and peel the
+    individual inverses off with the prefix products, ~3 multiplications
+    per point; the affine form of every point is cached along the way.
+    Normalized points make equality, hashing, str() and pairing inputs free
+    and take the cheaper mixed addition.
+
+    Args:
+        points (List[JacobianPoint | None]): Points of one group
+
+    Returns:
+        List[JacobianPoint | None]: The same points, normalized; identities
+            and None are returned unchanged
+    """
+    out = list(points)
+    todo = [
+        i for i, P in enumerate(out)
+        if P is not None and not P.is_identity() and P.z != _ONES[P.z.__class__]
+    ]  # fmt: skip
+    if not todo:
+        return out
+
+    prefix = []
+    acc = None
+    for i in todo:
+        acc = out[i].z if acc is None else acc * out[i].z
+        prefix.append(acc)
+
+    inv = acc.one() / acc
+    for j in range(len(todo) - 1, -1, -1):
+        P = out[todo[j]]
+        z_inv = inv * prefix[j - 1] if j else inv
+        inv = inv * P.z
+        z_inv2 = z_inv * z_inv
+        x, y = P.x * z_inv2, P.y * z_inv2 * z_inv
+        R = JacobianPoint(x, y, _ONES[x.__class__])
+        R._affine = (x.coeffs, y.coeffs) if isinstance(x, Fq2) else (int(x), int(y))
+        out[todo[j]] = R
+    return out
+
+
+G1 = JacobianPoint.from_affine(_AFFINE_G1, Fq)  # Generator of group G1
+G2 = JacobianPoint.from_affine(_AFFINE_G2, Fq2)  # Generator of group G2
+Z1 = JacobianPoint.from_affine(None, Fq)  # Point at infinity of G1
+Z2 = JacobianPoint.from_affine(None, Fq2)  # Point at infinity of G2
+
+
+# -----------------------------------------------
+# Scalars — Scalar operation functions
+
+def rand_scalar() -> int:
+    """
+    Generate a cryptographically secure random scalar.
+
+    Returns:
+        int: A random scalar in ℤₚ \\ {0}.
+    """
+    return secrets.randbelow(curve_order - 1) + 1
+
+
+# ----------------------------
+# Fixed-base precomputation — Comb tables for repeatedly multiplied bases
+
+_G1_FIXED = FixedBaseRegistry(
+    _jac_add, _jac_double, JacobianPoint.affine, normalize=batch_normalize, build_after=FIXED_BUILD_AFTER
+)
+_G2_FIXED = FixedBaseRegistry(
+    _jac_add, _jac_double, JacobianPoint.affine, normalize=batch_normalize, build_after=FIXED_BUILD_AFTER
+)
+_G1_FIXED.register(G1)
+_G2_FIXED.register(G2)
+
+
+def register_fixed_g1(P):
+    """
+    Register a G1 point as a fixed base.
+
+    Its comb table is built on the FIXED_BUILD_AFTER-th g1_mul with this
+    base; that and every later g1_mul(P, k) run from the table.
+
+    Args:
+        P (JacobianPoint): A point in G1
+    """
+    _G1_FIXED.register(P)
+
+
+def register_fixed_g2(Q):
+    """
+    Register a G2 point (e.g. an issuer public key) as a fixed base.
+
+    Keys are registered when they are generated or decoded, not per
+    verification; the table is built as for register_fixed_g1.
+
+    Args:
+        Q (JacobianPoint): A point in G2
+    """
+    _G2_FIXED.register(Q)
+
+
+# ----------------------------
+# Endomorphisms — GLV map on G1, GLS map ψ on G2
+
+def _endo_g1(P):
+    """φ(X : Y : Z) = (β·X : Y : Z), which acts on G1 as multiplication by GLV_LAMBDA."""
+    return JacobianPoint(P.x * GLV_BETA, P.y, P.z)
+
+
+_PSI_X = Fq2(*PSI_COEFF_X)
+_PSI_Y = Fq2(*PSI_COEFF_Y)
+
+
+def _psi_g2(Q):
+    """
+    ψ(X : Y : Z) = (cx·X̄ : cy·Ȳ : Z̄); Frobenius commutes with the Jacobian
+    scaling, so only X and Y pick up the coefficients.
+    """
+    return JacobianPoint(Q.x.conj() * _PSI_X, Q.y.conj() * _PSI_Y, Q.z.conj())
+
+
+# ----------------------------
+# Group helpers — Group operation helper functions
+
+def g1_mul(P, k: int, window: int | None = None):
+    """
+    Scalar multiplication in group G1.
+
+    Registered fixed bases (g1 included) are multiplied from their comb table,
+    any other base through the GLV split k·P = k1·P + k2·φ(P), with both
+    halves in one width-w NAF loop.
+
+    Args:
+        P (JacobianPoint): A point in G1
+        k (int): A scalar in ℤₚ
+        window (int | None): wNAF width; defaults to get_optim().window
+
+    Returns:
+        JacobianPoint: k · P
+    """
+    k %= curve_order
+    R = _G1_FIXED.mul(P, k)
+    if R is NotImplemented:
+        w = resolve_window(window, get_optim())
+        R = glv_mul(P, k, _jac_add, _jac_double, neg, _endo_g1, w, batch_normalize) if P else None
+    return R if R is not None else Z1
+
+
+def g2_mul(Q, k: int, window: int | None = None):
+    """
+    Scalar multiplication in group G2.
+
+    Registered fixed bases (g2 included) are multiplied from their comb table,
+    any other base through the four-way GLS split on Q, ψ(Q), ψ²(Q), ψ³(Q),
+    interleaved in one width-w NAF loop.
+
+    Args:
+        Q (JacobianPoint): A point in G2
+        k (int): A scalar in ℤₚ
+        window (int | None): wNAF width; defaults to get_optim().window
+
+    Returns:
+        JacobianPoint: k · Q
+    """
+    k %= curve_order
+    R = _G2_FIXED.mul(Q, k)
+    if R is NotImplemented:
+        w = resolve_window(window, get_optim())
+        R = gls_mul(Q, k, _jac_add, _jac_double, neg, _psi_g2, w, batch_normalize) if Q else None
+    return R if R is not None else Z2
+
+
+def msm_g1(bases, scalars):
+    """
+    Multi-scalar multiplication.
+
+    Same dispatch as backend_pyecc.msm_g1: a plain loop below
+    PIPPENGER_THRESHOLD terms, the Pippenger bucket engine above it
+    on the GLV-split terms.
+
+    Args:
+        bases (List[JacobianPoint]): List of G1 points [P1, P2, ..., Pn]
+        scalars (List[int]): List of scalars [k1, k2, ..., kn]
+
+    Returns:
+        JacobianPoint: The result ∑(Pi · ki) ∈ G1
+    """
+    # Drop identity bases and zero scalars; neither contributes to the sum
+    terms = [(B, s % curve_order) for B, s in zip(bases, scalars)]
+    terms = [(B, s) for B, s in terms if B and s]
+    bases = [B for B, _ in terms]
+    scalars = [s for _, s in terms]
+
+    if len(terms) < PIPPENGER_THRESHOLD:
+        R = msm_naive(bases, scalars, _jac_add, g1_mul)
+    else:
+        # Normalized bases make every bucket addition a mixed one
+        bases, scalars = glv_split_terms(batch_normalize(bases), scalars, _endo_g1)
+        R = msm_pippenger(bases, scalars, _jac_add, _jac_double)
+    return R if R is not None else Z1
+
+
+def msm_g2(bases, scalars, window: int | None = None):
+    """
+    Multi-scalar multiplication in G2.
+
+    Same dispatch as backend_pyecc.msm_g2: registered fixed bases use their
+    comb tables, the other terms share one interleaved GLS/wNAF loop.
+
+    Args:
+        bases (List[JacobianPoint]): List of G2 points [Q1, Q2, ..., Qn]
+        scalars (List[int]): List of scalars [k1, k2, ..., kn]
+        window (int | None): wNAF width; defaults to get_optim().window
+
+    Returns:
+        JacobianPoint: The result ∑(Qi · ki) ∈ G2
+    """
+    acc = None
+    rest_bases, rest_scalars = [], []
+    for B, s in zip(bases, scalars):
+        s %= curve_order
+        if not B or not s:
+            continue
+        R = B if s == 1 else _G2_FIXED.mul(B, s)
+        if R is NotImplemented:
+            rest_bases.append(B)
+            rest_scalars.append(s)
+        elif R is not None:
+            acc = ecc_add(acc, R)
+
+    if rest_bases:
+        w = resolve_window(window, get_optim())
+        acc = ecc_add(acc, gls_msm(rest_bases, rest_scalars, _jac_add, _jac_double, neg, _psi_g2, w, batch_normalize))
+    return acc if acc is not None else Z2
+
+
+def ecc_add(P, Q):
+    """
+    Elliptic curve point addition (None is accepted as the identity).
+
+    Args:
+        P (JacobianPoint | None): A point in G1 or G2
+        Q (JacobianPoint | None): A point in the same group
+
+    Returns:
+        JacobianPoint: P + Q
+    """
+    if P is None:
+        return Q
+    if Q is None:
+        return P
+    return _jac_add(P, Q)
+
+
+def _affine(P):
+    """Affine integer form of a point (None stays None), the input format of the pairing engine."""
+    return None if P is None else P.affine()
+
+
+def neg(P):
+    """
+    Point negation, -(X : Y : Z) = (X : -Y : Z).
+
+    Args:
+        P (JacobianPoint | None): A point in G1 or G2
+
+    Returns:
+        JacobianPoint | None: -P
+    """
+    if P is None:
+        return None
+    return JacobianPoint(P.x, -P.y, P.z)
+
+
+def double(P):
+    """
+    Point doubling 2·P (None is accepted as the identity).
+
+    Args:
+        P (JacobianPoint | None): A point in G1 or G2
+
+    Returns:
+        JacobianPoint | None: 2·P
+    """
+    return None if P is None else _jac_double(P)
+
+
+def sub(P, Q):
+    """
+    Point subtraction P - Q: one negation and one addition, instead of a
+    multiplication by r - 1.
+
+    Args:
+        P (JacobianPoint | None): A point in G1 or G2
+        Q (JacobianPoint | None): A point in the same group
+
+    Returns:
+        JacobianPoint | None: P - Q
+    """
+    return ecc_add(P, neg(Q))
+
+
+def is_identity(P) -> bool:
+    """
+    Whether P is the point at infinity (Z = 0 or None).
+    """
+    return P is None or P.is_identity()
+
+
+_IDENTITIES = {"g1": Z1, "g2": Z2}
+
+
+def identity(group: str = "g1") -> JacobianPoint:
+    """
+    The point at infinity of a group.
+
+    Args:
+        group (str): "g1" or "g2"
+
+    Returns:
+        JacobianPoint: Z1 or Z2
+
+    Raises:
+        ValueError: If the group name is unknown
+    """
+    if group not in _IDENTITIES:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    return _IDENTITIES[group]
+
+
+def to_affine(P):
+    """
+    Affine coordinates of a point as plain integers (cached on the point).
+
+    Args:
+        P (JacobianPoint | None): A point in G1 or G2
+
+    Returns:
+        tuple | None: (x, y) for G1, ((x0, x1), (y0, y1)) for G2, None at infinity
+    """
+    return _affine(P)
+
+
+def from_affine(A, group: str = "g1") -> JacobianPoint:
+    """
+    Inverse of to_affine: a normalized point (Z = 1) with its affine form
+    already cached. Curve and subgroup membership are not checked.
+
+    Args:
+        A (tuple | None): Integer affine coordinates, None for the identity
+        group (str): "g1" or "g2"
+
+    Returns:
+        JacobianPoint: The point
+    """
+    if A is None:
+        return identity(group)
+    if group == "g2":
+        R = JacobianPoint(Fq2(*A[0]), Fq2(*A[1]), _ONES[Fq2])
+    else:
+        R = JacobianPoint(Fq(A[0]), Fq(A[1]), _ONES[Fq])
+    R._affine = (tuple(A[0]), tuple(A[1])) if group == "g2" else (A[0], A[1])
+    return R
+
+
+def _g2_arg(Q):
+    """Pairing-engine form of a G2 argument; prepared points pass through."""
+    return Q if isinstance(Q, PreparedG2) else _affine(Q)
+
+
+def prepare_g2(Q) -> PreparedG2:
+    """
+    Precompute the Miller-loop line coefficients of a G2 point.
+
+    Args:
+        Q (JacobianPoint): A point in G2
+
+    Returns:
+        PreparedG2: Q with its line coefficients, accepted by pair() and
+            pairing_product_is_one() in place of Q
+    """
+    return _pairing.prepare_g2(_g2_arg(Q))
+
+
+# g2 appears on one side of every verification equation
+G2_PREPARED = prepare_g2(G2)
+
+
+def pair(P, Q):
+    """
+    Bilinear pairing operation, computed on the affine representatives.
+
+    Args:
+        P (JacobianPoint): A point in G1
+        Q (JacobianPoint | PreparedG2): A point in G2, optionally prepared
+
+    Returns:
+        GT element: The result of e(P, Q) after final exponentiation.
+    """
+    return _pairing.pairing(_affine(P), _g2_arg(Q))
+
+
+def pair_cached(P, Q):
+    """
+    pair(P, Q) through an LRU cache keyed by the affine coordinates.
+
+    For pairings of long-lived points whose powers are taken in GT
+    (gt_pow) instead of pairing again, e.g. e(A, Y)^r = e(A, Y^r).
+
+    Args:
+        P: A point in G1
+        Q: A point in G2 (not prepared)
+
+    Returns:
+        GT element: e(P, Q)
+    """
+    return _pairing.cached_pairing(_affine(P), _affine(Q))
+
+
+def pairing_product(pairs):
+    """
+    ∏ e(Pi, Qi) as a GT element, with a single final exponentiation.
+
+    Args:
+        pairs (List[Tuple[JacobianPoint, JacobianPoint | PreparedG2]]): (G1 point, G2 point) pairs
+
+    Returns:
+        GT element: The product
+    """
+    return _pairing.pairing_product([(_affine(P), _g2_arg(Q)) for P, Q in pairs])
+
+
+def pairing_product_is_one(pairs) -> bool:
+    """
+    Check ∏ e(Pi, Qi) = 1 with a single final exponentiation.
+
+    Args:
+        pairs (List[Tuple[JacobianPoint, JacobianPoint | PreparedG2]]): (G1 point, G2 point) pairs
+
+    Returns:
+        bool: True iff the pairing product is the identity of GT
+    """
+    return _pairing.pairing_product_is_one([(_affine(P), _g2_arg(Q)) for P, Q in pairs])
+
+
+# -----------------------------------------------
+# Subgroup checks — for points decoded from untrusted bytes
+
+def _sigma_g1(P):
+    """σ(X : Y : Z) = (β²·X : Y : Z), which acts on G1 as multiplication by -z²."""
+    return JacobianPoint(P.x * SIGMA_BETA, P.y, P.z)
+
+
+def _check_g1(P) -> bool:
+    return g1_check(P, ecc_add, double, _sigma_g1, is_identity)
+
+
+def _check_g2(Q) -> bool:
+    return g2_check(Q, ecc_add, double, _psi_g2, is_identity)
+
+
+_SUBGROUPS = {
+    "g1": (_check_g1, G1_COFACTOR_MIN_PRIME, G1_CHECK_COST),
+    "g2": (_check_g2, G2_COFACTOR_MIN_PRIME, G2_CHECK_COST),
+}
+
+
+def _subgroup(group: str):
+    if group not in _SUBGROUPS:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    return _SUBGROUPS[group]
+
+
+def in_subgroup(P, group: str = "g1") -> bool:
+    """
+    Exact membership test of one point in G1 or G2 (endomorphism test).
+
+    Args:
+        P: A point on the curve (group "g1") or on the twist ("g2")
+        group (str): "g1" or "g2"
+
+    Returns:
+        bool: True iff P lies in the prime-order subgroup
+
+    Raises:
+        ValueError: If the group name is unknown
+    """
+    check, _, _ = _subgroup(group)
+    return is_identity(P) or check(P)
+
+
+def batch_in_subgroup(points, group: str = "g1") -> bool:
+    """
+    Membership test of a batch of points through random linear
+    combinations, about one group addition per point and round; see
+    subgroup.py for the error bound (2^-SUBGROUP_SECURITY).
+
+    Args:
+        points (List): Points on the curve (group "g1") or on the twist ("g2")
+        group (str): "g1" or "g2"
+
+    Returns:
+        bool: True iff all points lie in the prime-order subgroup
+
+    Raises:
+        ValueError: If the group name is unknown
+    """
+    check, q, cost = _subgroup(group)
+    return batch_check([P for P in points if not is_identity(P)], check, ecc_add, q, cost)
+
+
+# -----------------------------------------------
+# Hashing to G1 — bases without a known discrete logarithm
+
+def hash_to_g1(msg: bytes, dst: bytes):
+    """
+    RFC 9380 hash_to_curve to G1 (BLS12381G1_XMD:SHA-256_SSWU_RO_ with the
+    caller's domain separation tag), see hash_to_curve.py.
+
+    Args:
+        msg (bytes): Message
+        dst (bytes): Domain separation tag
+
+    Returns:
+        A point in G1
+    """
+    return from_affine(hash_to_g1_affine(msg, dst))
@@ -10,16 +10,35 @@ from py_ecc.bls12_381.bls12_381_curve import (
     G1,  # Generator of group G1 (a point on the elliptic curve)
     G2,  # Generator of group G2 (a point on the twisted elliptic curve)
     add,  # Elliptic curve point addition
-    multiply,  # Elliptic curve scalar multiplication
+    double as _ec_double,  # Elliptic curve point doubling
+    neg,  # Elliptic curve point negation
 )
 
-from py_ecc.bls12_381.bls12_381_pairing import (
-    pairing,  # Bilinear pairing e: G1 × G2 → GT
-    final_exponentiate,  # Final exponentiation step for pairings
-)
+from py_ecc.fields import bls12_381_FQ as FQ, bls12_381_FQ2 as FQ2
 
 import secrets
 
+from bn254.optim.config import get_optim
+from bn254.optim.wnaf import resolve_window
+
+from . import pairing as _pairing
+from .endomorphism import GLV_BETA, PSI_COEFF_X, PSI_COEFF_Y, glv_mul, glv_split_terms, gls_msm, gls_mul
+from .hash_to_curve import hash_to_g1_affine
+from .gt import GT_ONE, gt_from_bytes, gt_inv, gt_mul, gt_multi_pow, gt_pow, gt_to_bytes
+from .pairing import PreparedG2
+from .msm import PIPPENGER_THRESHOLD, msm_naive, msm_pippenger
+from .precompute import FIXED_BUILD_AFTER, FixedBaseRegistry
+from .subgroup import (
+    G1_CHECK_COST,
+    G1_COFACTOR_MIN_PRIME,
+    G2_CHECK_COST,
+    G2_COFACTOR_MIN_PRIME,
+    SIGMA_BETA,
+    batch_check,
+    g1_check,
+    g2_check,
+)
+
 # -----------------------------------------------
 # Scalars — Scalar operation functions
 
@@ -33,37 +52,126 @@ def rand_scalar() -> int:
     return secrets.randbelow(curve_order - 1) + 1
 
 
+# ----------------------------
+# Fixed-base precomputation — Comb tables for repeatedly multiplied bases
+
+def _point_key(P):
+    """
+    Canonical hashable key of an affine point.
+
+    py_ecc field elements define __eq__ without __hash__, so points cannot
+    be used as dictionary keys directly.
+    """
+    return tuple(int(c) for coord in P for c in getattr(coord, "coeffs", (coord,)))
+
+
+_G1_FIXED = FixedBaseRegistry(add, _ec_double, _point_key, build_after=FIXED_BUILD_AFTER)
+_G2_FIXED = FixedBaseRegistry(add, _ec_double, _point_key, build_after=FIXED_BUILD_AFTER)
+_G1_FIXED.register(G1)
+_G2_FIXED.register(G2)
+
+
+def register_fixed_g1(P):
+    """
+    Register a G1 point as a fixed base.
+
+    Its comb table is built on the FIXED_BUILD_AFTER-th g1_mul with this
+    base; that and every later g1_mul(P, k) run from the table.
+
+    Args:
+        P (Point2D): A point in G1
+    """
+    _G1_FIXED.register(P)
+
+
+def register_fixed_g2(Q):
+    """
+    Register a G2 point (e.g. an issuer public key) as a fixed base.
+
+    Keys are registered when they are generated or decoded, not per
+    verification; the table is built as for register_fixed_g1.
+
+    Args:
+        Q (Point2D): A point in G2
+    """
+    _G2_FIXED.register(Q)
+
+
+# ----------------------------
+# Endomorphisms — GLV map on G1, GLS map ψ on G2
+
+def _endo_g1(P):
+    """φ(x, y) = (β·x, y), which acts on G1 as multiplication by GLV_LAMBDA."""
+    return (P[0] * GLV_BETA, P[1])
+
+
+_PSI_X = FQ2(list(PSI_COEFF_X))
+_PSI_Y = FQ2(list(PSI_COEFF_Y))
+
+
+def _conj(a):
+    """Fq2 conjugation a0 + a1·i ↦ a0 - a1·i, i.e. the p-power Frobenius."""
+    c0, c1 = a.coeffs
+    return FQ2([int(c0), -int(c1)])
+
+
+def _psi_g2(Q):
+    """ψ(x, y) = (cx·x̄, cy·ȳ), which acts on G2 as multiplication by z."""
+    return (_conj(Q[0]) * _PSI_X, _conj(Q[1]) * _PSI_Y)
+
+
 # ----------------------------
 # Group helpers — Group operation helper functions
 
-def g1_mul(P, k: int):
+def g1_mul(P, k: int, window: int | None = None):
     """
     Scalar multiplication in group G1.
 
     This function takes a point P and a scalar k, and returns P multiplied by k.
+    Registered fixed bases (g1 included) are multiplied from their comb table,
+    any other base through the GLV split k·P = k1·P + k2·φ(P), with both
+    halves in one width-w NAF loop.
 
     Args:
         P (Point2D): A point in G1
         k (int): A scalar in ℤₚ
+        window (int | None): wNAF width; defaults to get_optim().window
 
     Returns:
         Point2D: Coordinates of the resulting point on the elliptic curve
     """
-    return multiply(P, k % curve_order)  # (k mod curve_order) ensures the scalar is in range
+    k %= curve_order  # (k mod curve_order) ensures the scalar is in range
+    R = _G1_FIXED.mul(P, k)
+    if R is not NotImplemented:
+        return R
+    if P is None:
+        return None
+    return glv_mul(P, k, add, _ec_double, neg, _endo_g1, resolve_window(window, get_optim()))
 
 
-def g2_mul(Q, k: int):
+def g2_mul(Q, k: int, window: int | None = None):
     """
     Scalar multiplication in group G2.
 
+    Registered fixed bases (g2 included) are multiplied from their comb table,
+    any other base through the GLS split into four ~64-bit digits on
+    Q, ψ(Q), ψ²(Q), ψ³(Q), interleaved in one width-w NAF loop.
+
     Args:
         Q (Point2D): A point in G2
         k (int): A scalar in ℤₚ
+        window (int | None): wNAF width; defaults to get_optim().window
 
     Returns:
         Point2D: A point in G2
     """
-    return multiply(Q, k % curve_order)
+    k %= curve_order
+    R = _G2_FIXED.mul(Q, k)
+    if R is not NotImplemented:
+        return R
+    if Q is None:
+        return None
+    return gls_mul(Q, k, add, _ec_double, neg, _psi_g2, resolve_window(window, get_optim()))
 
 
 def msm_g1(bases, scalars):
@@ -71,6 +179,10 @@ def msm_g1(bases, scalars):
     Multi-scalar multiplication.
 
     Efficiently compute the sum of products of multiple base points and scalars.
+    Inputs with fewer than PIPPENGER_THRESHOLD non-trivial terms use one
+    scalar multiplication per base; larger inputs go through the
+    Pippenger bucket engine, whose window size is picked from the input length.
+    Before bucketing, every term is GLV-split into two terms with ~128-bit scalars.
 
     Args:
         bases (List[Point2D[Field]]): List of G1 points [P1, P2, ..., Pn]
@@ -79,22 +191,335 @@ def msm_g1(bases, scalars):
     Returns:
         Point2D[Field]: The result ∑(Pi · ki) ∈ G1
     """
+    # Drop identity bases and zero scalars; neither contributes to the sum
+    terms = [(B, s % curve_order) for B, s in zip(bases, scalars)]
+    terms = [(B, s) for B, s in terms if B is not None and s]
+    bases = [B for B, _ in terms]
+    scalars = [s for _, s in terms]
+
+    if len(terms) < PIPPENGER_THRESHOLD:
+        return msm_naive(bases, scalars, add, g1_mul)
+    bases, scalars = glv_split_terms(bases, scalars, _endo_g1)
+    return msm_pippenger(bases, scalars, add, _ec_double)
+
+
+def msm_g2(bases, scalars, window: int | None = None):
+    """
+    Multi-scalar multiplication in G2.
+
+    Registered fixed bases are multiplied from their comb tables (cheaper
+    than any variable-base method). All other terms are GLS-split and run
+    through one interleaved width-w NAF loop (Straus), so their G2
+    doublings are shared instead of repeated per term.
+
+    Args:
+        bases (List[Point2D]): List of G2 points [Q1, Q2, ..., Qn]
+        scalars (List[int]): List of scalars [k1, k2, ..., kn]
+        window (int | None): wNAF width; defaults to get_optim().window
+
+    Returns:
+        Point2D: The result ∑(Qi · ki) ∈ G2
+    """
     acc = None
+    rest_bases, rest_scalars = [], []
     for B, s in zip(bases, scalars):
-        pt = g1_mul(B, s)
-        acc = add(acc, pt) if acc else pt
+        s %= curve_order
+        if B is None or not s:
+            continue
+        R = B if s == 1 else _G2_FIXED.mul(B, s)
+        if R is NotImplemented:
+            rest_bases.append(B)
+            rest_scalars.append(s)
+        elif R is not None:
+            acc = R if acc is None else add(acc, R)
+
+    if rest_bases:
+        w = resolve_window(window, get_optim())
+        R = gls_msm(rest_bases, rest_scalars, add, _ec_double, neg, _psi_g2, w)
+        if R is not None:
+            acc = R if acc is None else add(acc, R)
     return acc
 
 
+def _affine_ints(P):
+    """Affine point as plain integers, the input format of the pairing engine."""
+    if P is None:
+        return None
+    return tuple(
+        tuple(int(c) for c in coord.coeffs) if hasattr(coord, "coeffs") else int(coord)
+        for coord in P
+    )
+
+
+def to_affine(P):
+    """
+    Affine coordinates of a point as plain integers.
+
+    Args:
+        P (Point2D | None): A point in G1 or G2
+
+    Returns:
+        tuple | None: (x, y) for G1, ((x0, x1), (y0, y1)) for G2, None at infinity
+    """
+    return _affine_ints(P)
+
+
+def from_affine(A, group: str = "g1"):
+    """
+    Inverse of to_affine. The coordinates are taken as given; curve and
+    subgroup membership are the caller's business (see serialize.py).
+
+    Args:
+        A (tuple | None): Integer affine coordinates, None for the identity
+        group (str): "g1" or "g2"
+
+    Returns:
+        Point2D | None: The py_ecc point
+    """
+    if A is None:
+        return identity(group)
+    if group == "g2":
+        return (FQ2(list(A[0])), FQ2(list(A[1])))
+    return (FQ(A[0]), FQ(A[1]))
+
+
+def _g2_arg(Q):
+    """Pairing-engine form of a G2 argument; prepared points pass through."""
+    return Q if isinstance(Q, PreparedG2) else _affine_ints(Q)
+
+
+def prepare_g2(Q) -> PreparedG2:
+    """
+    Precompute the Miller-loop line coefficients of a G2 point.
+
+    The result can be passed to pair() and pairing_product_is_one() in place
+    of Q; the G2 arithmetic of the Miller loop is then skipped.
+
+    Args:
+        Q (Point2D): A point in G2
+
+    Returns:
+        PreparedG2: Q with its line coefficients
+    """
+    return _pairing.prepare_g2(_g2_arg(Q))
+
+
+# g2 appears on one side of every verification equation
+G2_PREPARED = prepare_g2(G2)
+
+
 def pair(P, Q):
     """
     Bilinear pairing operation.
 
+    Args:
+        P (Point2D): A point in G1
+        Q (Point2D | PreparedG2): A point in G2, optionally prepared
+
     Returns:
         GT element: The result of e(P, Q) after final exponentiation.
     """
-    return final_exponentiate(pairing(Q, P))
+    return _pairing.pairing(_affine_ints(P), _g2_arg(Q))
+
+
+def pair_cached(P, Q):
+    """
+    pair(P, Q) through an LRU cache keyed by the affine coordinates.
+
+    For pairings of long-lived points whose powers are taken in GT
+    (gt_pow) instead of pairing again, e.g. e(A, Y)^r = e(A, Y^r).
+
+    Args:
+        P: A point in G1
+        Q: A point in G2 (not prepared)
+
+    Returns:
+        GT element: e(P, Q)
+    """
+    return _pairing.cached_pairing(_affine_ints(P), _affine_ints(Q))
+
+
+def pairing_product(pairs):
+    """
+    ∏ e(Pi, Qi) as a GT element, with a single final exponentiation.
+
+    Args:
+        pairs (List[Tuple[Point2D, Point2D | PreparedG2]]): (G1 point, G2 point) pairs
+
+    Returns:
+        GT element: The product
+    """
+    return _pairing.pairing_product([(_affine_ints(P), _g2_arg(Q)) for P, Q in pairs])
+
+
+def pairing_product_is_one(pairs) -> bool:
+    """
+    Check ∏ e(Pi, Qi) = 1.
+
+    The Miller loops are multiplied together and only the product goes
+    through the final exponentiation, so e(A, W) = e(B, g2) costs about
+    half of two pair() calls when written as [(A, W), (neg(B), g2)].
+
+    Args:
+        pairs (List[Tuple[Point2D, Point2D | PreparedG2]]): (G1 point, G2 point) pairs
+
+    Returns:
+        bool: True iff the pairing product is the identity of GT
+    """
+    return _pairing.pairing_product_is_one([(_affine_ints(P), _g2_arg(Q)) for P, Q in pairs])
 
 
 # Alias for addition operation
 ecc_add = add
+
+
+# ----------------------------
+# Group helpers — negation, subtraction, doubling and the identity
+
+# py_ecc represents the point at infinity of both groups by None
+_IDENTITIES = {"g1": None, "g2": None}
+
+
+def double(P):
+    """
+    Point doubling 2·P (None is accepted as the identity).
+    """
+    return None if P is None else _ec_double(P)
+
+
+def sub(P, Q):
+    """
+    Point subtraction P - Q: one negation and one addition, instead of a
+    multiplication by r - 1.
+
+    Args:
+        P (Point2D | None): A point in G1 or G2
+        Q (Point2D | None): A point in the same group
+
+    Returns:
+        Point2D | None: P - Q
+    """
+    return add(P, neg(Q))
+
+
+def batch_normalize(points) -> list:
+    """
+    Normalize a batch of points. Affine py_ecc points already are, so this
+    only returns them as a list; see backend_jacobian.batch_normalize.
+
+    Args:
+        points (List[Point2D | None]): Points of one group
+
+    Returns:
+        List[Point2D | None]: The same points
+    """
+    return list(points)
+
+
+def is_identity(P) -> bool:
+    """
+    Whether P is the point at infinity.
+    """
+    return P is None
+
+
+def identity(group: str = "g1"):
+    """
+    The point at infinity of a group.
+
+    Args:
+        group (str): "g1" or "g2"
+
+    Returns:
+        None: py_ecc's identity of either group
+
+    Raises:
+        ValueError: If the group name is unknown
+    """
+    if group not in _IDENTITIES:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    return _IDENTITIES[group]
+
+
+# ----------------------------
+# Subgroup checks — for points decoded from untrusted bytes
+
+def _sigma_g1(P):
+    """σ(x, y) = (β²·x, y), which acts on G1 as multiplication by -z²."""
+    return (P[0] * SIGMA_BETA, P[1])
+
+
+def _check_g1(P) -> bool:
+    return g1_check(P, add, double, _sigma_g1, is_identity)
+
+
+def _check_g2(Q) -> bool:
+    return g2_check(Q, add, double, _psi_g2, is_identity)
+
+
+_SUBGROUPS = {
+    "g1": (_check_g1, G1_COFACTOR_MIN_PRIME, G1_CHECK_COST),
+    "g2": (_check_g2, G2_COFACTOR_MIN_PRIME, G2_CHECK_COST),
+}
+
+
+def _subgroup(group: str):
+    if group not in _SUBGROUPS:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    return _SUBGROUPS[group]
+
+
+def in_subgroup(P, group: str = "g1") -> bool:
+    """
+    Exact membership test of one point in G1 or G2 (endomorphism test).
+
+    Args:
+        P: A point on the curve (group "g1") or on the twist ("g2")
+        group (str): "g1" or "g2"
+
+    Returns:
+        bool: True iff P lies in the prime-order subgroup
+
+    Raises:
+        ValueError: If the group name is unknown
+    """
+    check, _, _ = _subgroup(group)
+    return is_identity(P) or check(P)
+
+
+def batch_in_subgroup(points, group: str = "g1") -> bool:
+    """
+    Membership test of a batch of points through random linear
+    combinations, about one group addition per point and round; see
+    subgroup.py for the error bound (2^-SUBGROUP_SECURITY).
+
+    Args:
+        points (List): Points on the curve (group "g1") or on the twist ("g2")
+        group (str): "g1" or "g2"
+
+    Returns:
+        bool: True iff all points lie in the prime-order subgroup
+
+    Raises:
+        ValueError: If the group name is unknown
+    """
+    check, q, cost = _subgroup(group)
+    return batch_check([P for P in points if not is_identity(P)], check, add, q, cost)
+
+
+# ----------------------------
+# Hashing to G1 — bases without a known discrete logarithm
+
+def hash_to_g1(msg: bytes, dst: bytes):
+    """
+    RFC 9380 hash_to_curve to G1 (BLS12381G1_XMD:SHA-256_SSWU_RO_ with the
+    caller's domain separation tag), see hash_to_curve.py.
+
+    Args:
+        msg (bytes): Message
+        dst (bytes): Domain separation tag
+
+    Returns:
+        A point in G1
+    """
+    return from_affine(hash_to_g1_affine(msg, dst))
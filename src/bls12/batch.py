@@ -0,0 +1,54 @@
+"""
+Randomized Batch Verification
+
+Helpers shared by the batch verifiers of v1 and v2. A batch of pairing
+equations is combined into one by raising each equation to an independent
+random exponent ρ ∈ [1, 2^BATCH_EXPONENT_BITS) and multiplying: if some
+equation is false, the combination holds with probability at most
+2^-BATCH_EXPONENT_BITS. Short exponents keep the extra G1 and GT work small.
+
+When a combined check fails, bisection isolates the false equations with
+about 2·f·log2(n) combined checks for f failures among n.
+"""
+
+import secrets
+
+# Bit length of the random exponents, i.e. the statistical security of a check
+BATCH_EXPONENT_BITS = 64
+
+
+def batch_exponent() -> int:
+    """A fresh random exponent ρ ∈ [1, 2^BATCH_EXPONENT_BITS)."""
+    return secrets.randbelow((1 << BATCH_EXPONENT_BITS) - 1) + 1
+
+
+def bisect_failures(indices, holds) -> set:
+    """
+    Locate the false equations of a batch.
+
+    Args:
+        indices (Iterable[int]): The items of the batch
+        holds (Callable[[List[int]], bool]): Combined check of a subset, with
+            fresh random exponents on every call
+
+    Returns:
+        Set[int]: Items whose equation does not hold (up to the error of
+            each combined check)
+    """
+    indices = list(indices)
+    failed = set()
+    # Subsets known to hold at least one false equation
+    failing = [indices] if indices and not holds(indices) else []
+    while failing:
+        subset = failing.pop()
+        if len(subset) == 1:
+            failed.add(subset[0])
+            continue
+        left, right = subset[: len(subset) // 2], subset[len(subset) // 2 :]
+        if holds(left):
+            failing.append(right)  # the failure is in the other half
+        else:
+            failing.append(left)
+            if not holds(right):
+                failing.append(right)
+    return failed
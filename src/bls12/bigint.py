@@ -0,0 +1,64 @@
+"""
+Big-Integer Layer
+
+The field arithmetic of fields.py (and through it the pairing engine, GT
+and the Jacobian backend) runs on the integer type chosen here: gmpy2's
+mpz when gmpy2 is importable, plain Python ints otherwise. At 381 bits
+mpz multiplication and reduction are several times faster than CPython's.
+
+Setting BLS12_BIGINT=int forces the plain-int path even when gmpy2 is
+installed (e.g. to compare both in a benchmark).
+
+Values leave this layer as plain ints wherever they reach py_ecc, str(),
+bytes or user code, so results are identical on both paths.
+"""
+
+import os
+
+try:
+    import gmpy2
+except ImportError:  # Optional dependency
+    gmpy2 = None
+
+if gmpy2 is not None and os.getenv("BLS12_BIGINT", "auto") != "int":
+    BIGINT_BACKEND = "gmpy2"
+    mpz = gmpy2.mpz
+
+    def invert(a, m) -> int:
+        """Modular inverse a⁻¹ mod m."""
+        return int(gmpy2.invert(a, m))
+
+else:
+    BIGINT_BACKEND = "int"
+    mpz = int
+
+    def invert(a, m) -> int:
+        """Modular inverse a⁻¹ mod m."""
+        return pow(a, -1, m)
+
+
+def batch_invert(values, m) -> list[int]:
+    """
+    Modular inverses of several nonzero values with a single inversion
+    (Montgomery's trick): three multiplications per value instead of one
+    inversion each.
+
+    Args:
+        values (List[int]): Values invertible modulo m
+        m (int): Modulus
+
+    Returns:
+        List[int]: [v⁻¹ mod m for v in values]
+    """
+    values = [mpz(v) % m for v in values]
+    prefix = []
+    acc = mpz(1)
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % m
+    acc = invert(acc, m)
+    out = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        out[i] = int(acc * prefix[i] % m)
+        acc = acc * values[i] % m
+    return out
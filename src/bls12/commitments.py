@@ -0,0 +1,68 @@
+"""
+Message Commitment Cache
+
+A signature is A = U^(1/(x + e)) (v2: 1/(x + y·r)) for the message
+commitment U = g1 · ∏ hᵢ^mᵢ (v2 also · h0^r). When an issuer changes some
+attributes of a credential it issued, U' = U · ∏_{i changed} hᵢ^(m'ᵢ - mᵢ),
+so the update costs an MSM over the changed indices and one scalar
+multiplication instead of re-hashing every attribute and a full MSM.
+
+U must come from the issuer itself: recomputing it from a presented A
+would let the holder of a valid signature on other messages have those
+updated instead. The cache keeps U for the signatures the issuer produced
+(signers take it as ``cache=``), keyed by the signature.
+"""
+
+import threading
+from collections import OrderedDict
+
+from .params import to_affine
+
+# Signatures whose commitment is kept
+COMMITMENT_CACHE_SIZE = 1 << 16
+
+
+class CommitmentCache:
+    """
+    Bounded LRU map from issued signatures to their message commitments.
+    """
+
+    def __init__(self, maxsize: int = COMMITMENT_CACHE_SIZE):
+        """
+        Args:
+            maxsize (int): Maximum number of signatures kept
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(sig):
+        A, e = sig
+        return to_affine(A), int(e)
+
+    def get(self, sig):
+        """The commitment U of an issued signature, or None if unknown."""
+        k = self._key(sig)
+        with self._lock:
+            U = self._entries.get(k)
+            if U is not None:
+                self._entries.move_to_end(k)
+            return U
+
+    def put(self, sig, U) -> None:
+        """Remember the commitment U of a signature the issuer just produced."""
+        k = self._key(sig)
+        with self._lock:
+            self._entries[k] = U
+            self._entries.move_to_end(k)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, sig) -> None:
+        """Forget a signature, e.g. once it has been superseded by an update."""
+        with self._lock:
+            self._entries.pop(self._key(sig), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,184 @@
+"""
+Endomorphism-Accelerated Scalar Multiplication
+
+BLS12-381 G1 has the endomorphism φ(x, y) = (β·x, y), β a primitive cube
+root of unity in Fq, which acts on G1 as multiplication by λ = z² - 1.
+Because λ² + λ + 1 = r exactly, every k < r splits as k = k1 + k2·λ with
+k1 = k mod λ and k2 = ⌊k / λ⌋, both about 128 bits, so k·P = k1·P + k2·φ(P)
+needs half the doublings of plain double-and-add.
+
+On G2 the untwist-Frobenius-twist map ψ acts as multiplication by z, so
+writing k in base |z| gives four ~64-bit digits and
+k·Q = a0·Q - a1·ψ(Q) + a2·ψ²(Q) - a3·ψ³(Q) (GLS).
+
+glv_mul and gls_mul run the split scalars through one interleaved wNAF
+chain; glv_split_terms instead rewrites an MSM as twice as many 128-bit
+terms for the Pippenger engine.
+"""
+
+from py_ecc.bls12_381.bls12_381_curve import curve_order
+
+from bn254.optim.wnaf import DEFAULT_WINDOW, odd_multiples, wnaf_interleaved
+
+# BLS12-381 curve parameter z (negative)
+BLS_X = -0xD201000000010000
+
+# Eigenvalue of φ on G1: φ(P) = λ·P
+GLV_LAMBDA = BLS_X * BLS_X - 1
+
+# Cube root of unity in Fq paired with GLV_LAMBDA
+GLV_BETA = 0x1A0111EA397FE699EC02408663D4DE85AA0D857D89759AD4897D29650FB85F9B409427EB4F49FFFD8BFD00000000AAAC
+
+# ψ(x, y) = (PSI_COEFF_X·x̄, PSI_COEFF_Y·ȳ), x̄ the Fq2 conjugate; the
+# coefficients are 1/ξ^((p-1)/3) and 1/ξ^((p-1)/2) for ξ = 1 + i, as (c0, c1)
+PSI_COEFF_X = (
+    0,
+    0x1A0111EA397FE699EC02408663D4DE85AA0D857D89759AD4897D29650FB85F9B409427EB4F49FFFD8BFD00000000AAAD,
+)
+PSI_COEFF_Y = (
+    0x135203E60180A68EE2E9C448D77A2CD91C3DEDD930B1CF60EF396489F61EB45E304466CF3E67FA0AF1EE7B04121BDEA2,
+    0x06AF0E0437FF400B6831E36D6BD17FFE48395DABC2D3435E77F76E17009241C5EE67992F72EC05F4C81084FBEDE3CC09,
+)
+
+
+def glv_decompose(k: int) -> tuple[int, int]:
+    """
+    Split k into (k1, k2) with k ≡ k1 + k2·λ (mod r) and 0 ≤ k1, k2 ≤ λ.
+
+    Args:
+        k (int): Scalar, reduced modulo r first
+
+    Returns:
+        Tuple[int, int]: (k1, k2)
+    """
+    k2, k1 = divmod(k % curve_order, GLV_LAMBDA)
+    return k1, k2
+
+
+def glv_mul(P, k: int, add, double, neg, endo, w: int = DEFAULT_WINDOW, normalize=None):
+    """
+    G1 scalar multiplication k·P through the GLV decomposition.
+
+    Both halves run through one interleaved width-w NAF loop; the table of
+    φ(P) is the image of the table of P, so it costs no group operations.
+
+    Args:
+        P (Point): A point in G1 (not the identity)
+        k (int): Scalar
+        add (Callable): Group addition
+        double (Callable): Group doubling
+        neg (Callable): Group negation
+        endo (Callable): φ, mapping (x, y) to (β·x, y)
+        w (int): wNAF window
+        normalize (Callable | None): Batch normalization for the table
+
+    Returns:
+        Point | None: k·P, or None when k ≡ 0 (mod r)
+    """
+    k1, k2 = glv_decompose(k)
+    table = odd_multiples(P, w, add, double, normalize)
+    tables = [table, [endo(T) for T in table]]
+    return wnaf_interleaved(tables, [k1, k2], add, double, neg, w)
+
+
+def glv_split_terms(bases, scalars, endo):
+    """
+    Rewrite an MSM ∑ ki·Pi as ∑ (k1i·Pi + k2i·φ(Pi)) with ~128-bit scalars.
+
+    Args:
+        bases (List[Point]): G1 points
+        scalars (List[int]): Scalars
+        endo (Callable): φ
+
+    Returns:
+        Tuple[List[Point], List[int]]: Twice as many bases and half-length scalars
+    """
+    out_bases, out_scalars = [], []
+    for P, k in zip(bases, scalars):
+        k1, k2 = glv_decompose(k)
+        if k1:
+            out_bases.append(P)
+            out_scalars.append(k1)
+        if k2:
+            out_bases.append(endo(P))
+            out_scalars.append(k2)
+    return out_bases, out_scalars
+
+
+def gls_decompose(k: int) -> list[int]:
+    """
+    Write k (mod r) in base |z|: k = a0 + a1·|z| + a2·|z|² + a3·|z|³.
+
+    r < z⁴, so four digits, each below 2^64, always suffice.
+
+    Args:
+        k (int): Scalar
+
+    Returns:
+        List[int]: [a0, a1, a2, a3]
+    """
+    k %= curve_order
+    digits = []
+    for _ in range(4):
+        k, a = divmod(k, -BLS_X)
+        digits.append(a)
+    return digits
+
+
+def gls_mul(Q, k: int, add, double, neg, psi, w: int = DEFAULT_WINDOW, normalize=None):
+    """
+    G2 scalar multiplication k·Q through the four-way GLS split.
+
+    Since ψ acts as z = -|z|, |z|^i·Q = (-1)^i·ψ^i(Q): the four ~64-bit
+    digits run through one interleaved width-w NAF loop on Q, ψ(Q), ψ²(Q),
+    ψ³(Q) with alternating signs. Only the table of Q costs group
+    operations; the other three are its images under ψ.
+
+    Args:
+        Q (Point): A point in G2 (not the identity)
+        k (int): Scalar
+        add (Callable): Group addition
+        double (Callable): Group doubling
+        neg (Callable): Group negation
+        psi (Callable): The endomorphism ψ
+        w (int): wNAF window
+        normalize (Callable | None): Batch normalization for the table
+
+    Returns:
+        Point | None: k·Q, or None when k ≡ 0 (mod r)
+    """
+    return gls_msm([Q], [k], add, double, neg, psi, w, normalize)
+
+
+def gls_msm(points, scalars, add, double, neg, psi, w: int = DEFAULT_WINDOW, normalize=None):
+    """
+    ∑ ki·Qi in G2 with simultaneous (Straus) multi-exponentiation.
+
+    Every term is GLS-split into four ~64-bit digits, and all 4n digit
+    streams share one chain of 64 doublings.
+
+    Args:
+        points (List[Point]): G2 points, none the identity
+        scalars (List[int]): Scalars
+        add, double, neg, psi (Callable): Group law and ψ
+        w (int): wNAF window
+        normalize (Callable | None): Batch normalization, applied once to the
+            tables of all the Qi together
+
+    Returns:
+        Point | None: ∑ ki·Qi, or None when the sum vanishes trivially
+    """
+    base_tables = [odd_multiples(Q, w, add, double) for Q in points]
+    if normalize is not None and base_tables:
+        size = len(base_tables[0])
+        flat = normalize([T for table in base_tables for T in table])
+        base_tables = [flat[i : i + size] for i in range(0, len(flat), size)]
+
+    tables, digits = [], []
+    for table, k in zip(base_tables, scalars):
+        a0, a1, a2, a3 = gls_decompose(k)
+        for a in (a0, -a1, a2, -a3):
+            tables.append(table)
+            digits.append(a)
+            table = [psi(T) for T in table]
+    return wnaf_interleaved(tables, digits, add, double, neg, w)
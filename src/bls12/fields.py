@@ -0,0 +1,606 @@
+"""
+BLS12-381 Extension Field Tower
+
+    Fq2  = Fq[i]  / (i² + 1)
+    Fq6  = Fq2[v] / (v³ - ξ),  ξ = 1 + i
+    Fq12 = Fq6[w] / (w² - v)
+
+Elements are flat tuples of integers: (a0, a1) for a0 + a1·i, six
+integers (three Fq2 coefficients of 1, v, v²) for Fq6, and twelve
+integers (the Fq6 coefficients of 1 and w) for Fq12. Multiplication is
+Karatsuba at every level, Fq6 squaring is Chung–Hasan SQR2, Fq12
+squaring is the complex method, and products are reduced lazily: the
+Fq2 and Fq6 sub-products stay unreduced Python integers and every output
+coefficient is reduced modulo p exactly once.
+
+py_ecc represents Fq12 as Fq[w]/(w¹² - 2w⁶ + 2), i.e. the same field with
+w⁶ = ξ. fq12_from_pyecc / fq12_to_pyecc convert between the two bases,
+so results are bit-identical to py_ecc's.
+
+The Fq and Fq2 classes wrap the same arithmetic with operators, for point
+formulas written against field objects (Jacobian coordinates).
+
+Integers are those of bigint.py: gmpy2 mpz when available, plain ints
+otherwise. Everything handed back to py_ecc or callers (py_ecc
+coefficients, Fq2.coeffs, int(Fq)) is a plain int.
+"""
+
+from py_ecc.optimized_bls12_381 import field_modulus
+
+from .bigint import invert, mpz
+
+P = mpz(field_modulus)
+
+
+# -----------------------------------------------
+# Fq2 — pairs (a0, a1)
+
+FQ2_ZERO = (0, 0)
+FQ2_ONE = (1, 0)
+
+
+def fq2_add(a, b):
+    return ((a[0] + b[0]) % P, (a[1] + b[1]) % P)
+
+
+def fq2_sub(a, b):
+    return ((a[0] - b[0]) % P, (a[1] - b[1]) % P)
+
+
+def fq2_neg(a):
+    return (-a[0] % P, -a[1] % P)
+
+
+def fq2_mul(a, b):
+    """Karatsuba: 3 base-field multiplications, 2 reductions."""
+    a0, a1 = a
+    b0, b1 = b
+    t0 = a0 * b0
+    t1 = a1 * b1
+    return ((t0 - t1) % P, ((a0 + a1) * (b0 + b1) - t0 - t1) % P)
+
+
+def fq2_sqr(a):
+    """(a0 + a1·i)² = (a0 + a1)(a0 - a1) + 2·a0·a1·i: 2 multiplications."""
+    a0, a1 = a
+    return ((a0 + a1) * (a0 - a1) % P, 2 * a0 * a1 % P)
+
+
+def fq2_mul_fq(a, k: int):
+    return (a[0] * k % P, a[1] * k % P)
+
+
+def fq2_mul_nr(a):
+    """Multiplication by the non-residue ξ = 1 + i."""
+    a0, a1 = a
+    return ((a0 - a1) % P, (a0 + a1) % P)
+
+
+def fq2_conj(a):
+    """a0 - a1·i, which is also the p-power Frobenius of Fq2."""
+    return (a[0], -a[1] % P)
+
+
+def fq2_inv(a):
+    a0, a1 = a
+    t = invert(a0 * a0 + a1 * a1, P)
+    return (a0 * t % P, -a1 * t % P)
+
+
+def fq2_pow(a, e: int):
+    R = FQ2_ONE
+    for bit in bin(e)[2:]:
+        R = fq2_sqr(R)
+        if bit == "1":
+            R = fq2_mul(R, a)
+    return R
+
+
+# -----------------------------------------------
+# Square roots — for point decompression, p ≡ 3 (mod 4)
+
+_SQRT_EXP = (field_modulus + 1) // 4
+_HALF = (field_modulus + 1) // 2  # 1/2 mod p
+
+
+def fq_sqrt(a: int):
+    """A square root a^((p+1)/4) of a ∈ Fq, or None if a is not a square."""
+    a %= P
+    y = pow(a, _SQRT_EXP, P)
+    return y if y * y % P == a else None
+
+
+def fq2_sqrt(a):
+    """
+    A square root of a ∈ Fq2, or None if a is not a square.
+
+    Through the norm: if x = x0 + x1·i with x² = a, then x0² = (a0 ± √N(a))/2
+    and x1 = a1 / 2x0, so two Fq square roots and one inversion suffice.
+    """
+    a0, a1 = a[0] % P, a[1] % P
+    if not a1:
+        s = fq_sqrt(a0)
+        if s is not None:
+            return (s, 0)
+        s = fq_sqrt(-a0)  # -1 is a non-square, so -a0 is a square
+        return None if s is None else (0, s)
+    n = fq_sqrt(a0 * a0 + a1 * a1)
+    if n is None:
+        return None
+    x0 = fq_sqrt((a0 + n) * _HALF)
+    if x0 is None:
+        x0 = fq_sqrt((a0 - n) * _HALF)
+    if x0 is None:
+        return None
+    x = (x0, a1 * invert(2 * x0, P) % P)
+    return x if fq2_sqr(x) == (a0, a1) else None
+
+
+# -----------------------------------------------
+# Fq6 — (c0, c1, c2) ∈ Fq2³ flattened to six integers
+
+
+def _fq6_mul_u(a, b):
+    """
+    Unreduced Karatsuba product in Fq6 (18 base-field multiplications).
+
+    Inputs may themselves be unreduced; the outputs are reduced by the caller.
+    """
+    a0, a1, a2, a3, a4, a5 = a
+    b0, b1, b2, b3, b4, b5 = b
+
+    # Ti = Ai·Bi in Fq2
+    s, t = a0 * b0, a1 * b1
+    t00, t01 = s - t, (a0 + a1) * (b0 + b1) - s - t
+    s, t = a2 * b2, a3 * b3
+    t10, t11 = s - t, (a2 + a3) * (b2 + b3) - s - t
+    s, t = a4 * b4, a5 * b5
+    t20, t21 = s - t, (a4 + a5) * (b4 + b5) - s - t
+
+    # c0 = T0 + ξ·((A1 + A2)(B1 + B2) - T1 - T2)
+    x0, x1, y0, y1 = a2 + a4, a3 + a5, b2 + b4, b3 + b5
+    s, t = x0 * y0, x1 * y1
+    u0 = s - t - t10 - t20
+    u1 = (x0 + x1) * (y0 + y1) - s - t - t11 - t21
+    c0, c1 = t00 + u0 - u1, t01 + u0 + u1
+
+    # c1 = (A0 + A1)(B0 + B1) - T0 - T1 + ξ·T2
+    x0, x1, y0, y1 = a0 + a2, a1 + a3, b0 + b2, b1 + b3
+    s, t = x0 * y0, x1 * y1
+    c2 = s - t - t00 - t10 + t20 - t21
+    c3 = (x0 + x1) * (y0 + y1) - s - t - t01 - t11 + t20 + t21
+
+    # c2 = (A0 + A2)(B0 + B2) - T0 - T2 + T1
+    x0, x1, y0, y1 = a0 + a4, a1 + a5, b0 + b4, b1 + b5
+    s, t = x0 * y0, x1 * y1
+    c4 = s - t - t00 - t20 + t10
+    c5 = (x0 + x1) * (y0 + y1) - s - t - t01 - t21 + t11
+
+    return (c0, c1, c2, c3, c4, c5)
+
+
+def fq6_mul(a, b):
+    return tuple(c % P for c in _fq6_mul_u(a, b))
+
+
+def fq6_sqr(a):
+    """Chung–Hasan SQR2: 2 Fq2 squarings and 3 Fq2 multiplications."""
+    a0, a1, a2, a3, a4, a5 = a
+    # s0 = A0², s1 = 2·A0·A1, s2 = (A0 - A1 + A2)², s3 = 2·A1·A2, s4 = A2²
+    s00, s01 = (a0 + a1) * (a0 - a1), 2 * a0 * a1
+    s, t = a0 * a2, a1 * a3
+    s10, s11 = 2 * (s - t), 2 * ((a0 + a1) * (a2 + a3) - s - t)
+    x0, x1 = a0 - a2 + a4, a1 - a3 + a5
+    s20, s21 = (x0 + x1) * (x0 - x1), 2 * x0 * x1
+    s, t = a2 * a4, a3 * a5
+    s30, s31 = 2 * (s - t), 2 * ((a2 + a3) * (a4 + a5) - s - t)
+    s40, s41 = (a4 + a5) * (a4 - a5), 2 * a4 * a5
+    return (
+        (s00 + s30 - s31) % P,  # c0 = s0 + ξ·s3
+        (s01 + s30 + s31) % P,
+        (s10 + s40 - s41) % P,  # c1 = s1 + ξ·s4
+        (s11 + s40 + s41) % P,
+        (s10 + s20 + s30 - s00 - s40) % P,  # c2 = s1 + s2 + s3 - s0 - s4
+        (s11 + s21 + s31 - s01 - s41) % P,
+    )
+
+
+def fq6_inv(a):
+    A0, A1, A2 = a[0:2], a[2:4], a[4:6]
+    t0 = fq2_sub(fq2_sqr(A0), fq2_mul_nr(fq2_mul(A1, A2)))
+    t1 = fq2_sub(fq2_mul_nr(fq2_sqr(A2)), fq2_mul(A0, A1))
+    t2 = fq2_sub(fq2_sqr(A1), fq2_mul(A0, A2))
+    den = fq2_add(fq2_mul(A0, t0), fq2_mul_nr(fq2_add(fq2_mul(A2, t1), fq2_mul(A1, t2))))
+    d = fq2_inv(den)
+    return fq2_mul(t0, d) + fq2_mul(t1, d) + fq2_mul(t2, d)
+
+
+# -----------------------------------------------
+# Fq12 — (c0, c1) ∈ Fq6² flattened to twelve integers
+
+FQ12_ONE = (1,) + (0,) * 11
+
+
+def _mul_by_v(c):
+    """(c0 + c1·v + c2·v²)·v = ξ·c2 + c0·v + c1·v², on unreduced coefficients."""
+    return (c[4] - c[5], c[4] + c[5], c[0], c[1], c[2], c[3])
+
+
+def fq12_mul(a, b):
+    """Karatsuba over Fq6: 3 unreduced Fq6 products, 12 reductions."""
+    a0, a1 = a[:6], a[6:]
+    b0, b1 = b[:6], b[6:]
+    t0 = _fq6_mul_u(a0, b0)
+    t1 = _fq6_mul_u(a1, b1)
+    t2 = _fq6_mul_u(
+        tuple(x + y for x, y in zip(a0, a1)), tuple(x + y for x, y in zip(b0, b1))
+    )
+    vt1 = _mul_by_v(t1)
+    return tuple((x + y) % P for x, y in zip(t0, vt1)) + tuple(
+        (z - x - y) % P for x, y, z in zip(t0, t1, t2)
+    )
+
+
+def fq12_sqr(a):
+    """Complex squaring: (a0 + a1·w)² with 2 Fq6 products."""
+    a0, a1 = a[:6], a[6:]
+    ab = _fq6_mul_u(a0, a1)
+    t = _fq6_mul_u(
+        tuple(x + y for x, y in zip(a0, a1)), tuple(x + y for x, y in zip(a0, _mul_by_v(a1)))
+    )
+    vab = _mul_by_v(ab)
+    return tuple((x - y - z) % P for x, y, z in zip(t, ab, vab)) + tuple(2 * x % P for x in ab)
+
+
+def _fq6_mul_by_01_u(a, x0, x1, y0, y1):
+    """Unreduced A·(x + y·v) for x, y ∈ Fq2: 5 Fq2 products instead of 6."""
+    a0, a1, a2, a3, a4, a5 = a
+    s, t = a0 * x0, a1 * x1
+    t00, t01 = s - t, (a0 + a1) * (x0 + x1) - s - t
+    s, t = a2 * y0, a3 * y1
+    t10, t11 = s - t, (a2 + a3) * (y0 + y1) - s - t
+    # ξ·A2·y
+    s, t = a4 * y0, a5 * y1
+    u0, u1 = s - t, (a4 + a5) * (y0 + y1) - s - t
+    # (A0 + A1)(x + y) - T0 - T1
+    b0, b1, c0, c1 = a0 + a2, a1 + a3, x0 + y0, x1 + y1
+    s, t = b0 * c0, b1 * c1
+    v0, v1 = s - t - t00 - t10, (b0 + b1) * (c0 + c1) - s - t - t01 - t11
+    # A2·x
+    s, t = a4 * x0, a5 * x1
+    w0, w1 = s - t, (a4 + a5) * (x0 + x1) - s - t
+    return (t00 + u0 - u1, t01 + u0 + u1, v0, v1, t10 + w0, t11 + w1)
+
+
+def fq12_mul_by_023(f, c, l, d: int):
+    """
+    f · (c + l·w² + d·w³) for c, l ∈ Fq2 and d ∈ Fq, the shape of a Miller
+    line (see pairing.PreparedG2).
+
+    In the tower the line is L0 + L1·w with L0 = c + l·v and L1 = d·v, so
+
+        f·L = (A·L0 + d·v²·B) + (B·L0 + d·v·A)·w
+
+    for f = A + B·w: two sparse Fq6 products and two scalings by d, i.e.
+    10 Fq2 products and 12 base-field ones instead of 18 Fq2 products.
+    """
+    a0, a1, a2, a3, a4, a5, b0, b1, b2, b3, b4, b5 = f
+    (c0, c1), (l0, l1) = c, l
+    x0, x1, x2, x3, x4, x5 = _fq6_mul_by_01_u(f[:6], c0, c1, l0, l1)
+    y0, y1, y2, y3, y4, y5 = _fq6_mul_by_01_u(f[6:], c0, c1, l0, l1)
+    return (
+        # A·L0 + d·(ξ·B1, ξ·B2, B0)
+        (x0 + d * (b2 - b3)) % P, (x1 + d * (b2 + b3)) % P,
+        (x2 + d * (b4 - b5)) % P, (x3 + d * (b4 + b5)) % P,
+        (x4 + d * b0) % P, (x5 + d * b1) % P,
+        # B·L0 + d·(ξ·A2, A0, A1)
+        (y0 + d * (a4 - a5)) % P, (y1 + d * (a4 + a5)) % P,
+        (y2 + d * a0) % P, (y3 + d * a1) % P,
+        (y4 + d * a2) % P, (y5 + d * a3) % P,
+    )  # fmt: skip
+
+
+def fq12_conj(a):
+    """a0 - a1·w, the p⁶-power Frobenius (the inverse on the cyclotomic subgroup)."""
+    return a[:6] + tuple(-x % P for x in a[6:])
+
+
+def fq12_inv(a):
+    a0, a1 = a[:6], a[6:]
+    t = tuple((x - y) % P for x, y in zip(fq6_sqr(a0), _mul_by_v(fq6_sqr(a1))))
+    t = fq6_inv(t)
+    return fq6_mul(a0, t) + tuple(-x % P for x in fq6_mul(a1, t))
+
+
+def fq12_pow(a, e: int):
+    R = FQ12_ONE
+    for bit in bin(e)[2:]:
+        R = fq12_sqr(R)
+        if bit == "1":
+            R = fq12_mul(R, a)
+    return R
+
+
+# The Fq2 coefficients of an Fq12 element sit on w^0, w^2, w^4, w^1, w^3, w^5
+_BASIS_EXP = (0, 2, 4, 1, 3, 5)
+
+# (w^j)^(p^k) = w^j · ξ^(j·(p^k - 1)/6), indexed [k][coefficient]
+_FROB_COEFFS = {
+    k: [fq2_pow((1, 1), j * (field_modulus**k - 1) // 6) for j in _BASIS_EXP] for k in (1, 2, 3)
+}
+
+
+def fq12_frobenius(a, k: int = 1):
+    """a^(p^k) for k = 1, 2, 3: conjugate the Fq2 coefficients k times, scale by constants."""
+    out = ()
+    for idx, g in enumerate(_FROB_COEFFS[k]):
+        c = (a[2 * idx], a[2 * idx + 1])
+        if k & 1:
+            c = fq2_conj(c)
+        out += fq2_mul(c, g)
+    return out
+
+
+# -----------------------------------------------
+# Cyclotomic subgroup and final exponentiation
+
+# BLS12-381 curve parameter z (negative) and the exponent (z - 1)² / 3 of the
+# hard part, see final_exponentiation
+_Z = -0xD201000000010000
+_HARD_E1 = (_Z - 1) ** 2 // 3
+
+
+def _fq4_sqr_u(a0, a1, b0, b1):
+    """(a + b·s)² in Fq4 = Fq2[s]/(s² - ξ), unreduced: (a² + ξ·b², (a + b)² - a² - b²)."""
+    t00, t01 = (a0 + a1) * (a0 - a1), 2 * a0 * a1
+    t10, t11 = (b0 + b1) * (b0 - b1), 2 * b0 * b1
+    x0, x1 = a0 + b0, a1 + b1
+    return (
+        t00 + t10 - t11,
+        t01 + t10 + t11,
+        (x0 + x1) * (x0 - x1) - t00 - t10,
+        2 * x0 * x1 - t01 - t11,
+    )
+
+
+def fq12_cyclotomic_sqr(a):
+    """
+    Granger–Scott squaring, valid only in the cyclotomic subgroup (the image
+    of the easy part of the final exponentiation).
+
+    Fq12 is viewed as Fq4³ over the pairs (z0, z1), (z2, z3), (z4, z5) of Fq2
+    coefficients; a square costs three Fq4 squarings, i.e. 6 Fq2 squarings
+    instead of 2 Fq6 products.
+    """
+    z0, z0i, z4, z4i, z3, z3i, z2, z2i, z1, z1i, z5, z5i = a
+
+    t0, t0i, t1, t1i = _fq4_sqr_u(z0, z0i, z1, z1i)
+    c00, c00i = 3 * t0 - 2 * z0, 3 * t0i - 2 * z0i
+    c11, c11i = 3 * t1 + 2 * z1, 3 * t1i + 2 * z1i
+
+    t0, t0i, t1, t1i = _fq4_sqr_u(z2, z2i, z3, z3i)
+    c01, c01i = 3 * t0 - 2 * z4, 3 * t0i - 2 * z4i
+    c12, c12i = 3 * t1 + 2 * z5, 3 * t1i + 2 * z5i
+
+    t2, t2i, t3, t3i = _fq4_sqr_u(z4, z4i, z5, z5i)
+    t3, t3i = t3 - t3i, t3 + t3i  # ξ·t3
+    c10, c10i = 3 * t3 + 2 * z2, 3 * t3i + 2 * z2i
+    c02, c02i = 3 * t2 - 2 * z3, 3 * t2i - 2 * z3i
+
+    return (
+        c00 % P, c00i % P, c01 % P, c01i % P, c02 % P, c02i % P,
+        c10 % P, c10i % P, c11 % P, c11i % P, c12 % P, c12i % P,
+    )  # fmt: skip
+
+
+def fq12_cyclotomic_pow(a, e: int):
+    """a^e for a in the cyclotomic subgroup and e ≥ 0; negative exponents conjugate."""
+    if e < 0:
+        return fq12_conj(fq12_cyclotomic_pow(a, -e))
+    R = FQ12_ONE
+    for bit in bin(e)[2:]:
+        R = fq12_cyclotomic_sqr(R)
+        if bit == "1":
+            R = fq12_mul(R, a)
+    return R
+
+
+def final_exponentiation(f):
+    """
+    f^((p¹² - 1) / r).
+
+    The easy part f^((p⁶ - 1)(p² + 1)) costs one inversion and Frobenius
+    maps and lands in the cyclotomic subgroup, where inversion is
+    conjugation and squaring is Granger–Scott. The hard part uses
+
+        (p⁴ - p² + 1) / r = (z - 1)²/3 · (z + p) · (z² + p² - 1) + 1
+
+    so it is three short exponentiations (by (z - 1)²/3 and twice by z)
+    plus Frobenius maps, ~320 cyclotomic squarings in total instead of a
+    generic 1270-bit exponentiation. The exponent is exactly py_ecc's, so
+    the result is bit-identical.
+    """
+    f = fq12_mul(fq12_conj(f), fq12_inv(f))
+    f = fq12_mul(fq12_frobenius(f, 2), f)
+
+    a = fq12_cyclotomic_pow(f, _HARD_E1)
+    # b = a^(z + p)
+    b = fq12_mul(fq12_cyclotomic_pow(a, _Z), fq12_frobenius(a, 1))
+    # c = b^(z² + p² - 1)
+    c = fq12_mul(
+        fq12_cyclotomic_pow(fq12_cyclotomic_pow(b, _Z), _Z),
+        fq12_mul(fq12_frobenius(b, 2), fq12_conj(b)),
+    )
+    return fq12_mul(c, f)
+
+
+# -----------------------------------------------
+# Conversion to and from py_ecc's Fq[w] / (w¹² - 2w⁶ + 2) basis
+
+
+def fq12_from_pyecc(f):
+    """
+    Tower form of a py_ecc FQ12 (any flavour: coefficients may be FQ or int).
+
+    With i = w⁶ - 1, the Fq2 coefficient a + b·i on w^j is (a - b)·w^j + b·w^(j+6).
+    """
+    c = [int(x) for x in f.coeffs]
+    out = ()
+    for j in _BASIS_EXP:
+        out += ((c[j] + c[j + 6]) % P, c[j + 6] % P)
+    return out
+
+
+def fq12_to_pyecc_coeffs(a) -> list[int]:
+    """The twelve py_ecc coefficients of a tower element, as plain ints."""
+    c = [0] * 12
+    for idx, j in enumerate(_BASIS_EXP):
+        x0, x1 = a[2 * idx], a[2 * idx + 1]
+        c[j] = int((x0 - x1) % P)
+        c[j + 6] = int(x1)
+    return c
+
+
+# -----------------------------------------------
+# Fq and Fq2 with operators, for point formulas written against field objects
+
+
+class Fq:
+    """
+    Element of Fq, a drop-in for py_ecc's optimized FQ on the bigint.py
+    integer type.
+    """
+
+    __slots__ = ("n",)
+
+    def __init__(self, n):
+        self.n = n % P
+
+    @classmethod
+    def zero(cls) -> "Fq":
+        return cls(0)
+
+    @classmethod
+    def one(cls) -> "Fq":
+        return cls(1)
+
+    def __add__(self, other):
+        return Fq(self.n + (other if isinstance(other, int) else other.n))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return Fq(self.n - (other if isinstance(other, int) else other.n))
+
+    def __rsub__(self, other):
+        return Fq(other - self.n)
+
+    def __neg__(self):
+        return Fq(-self.n)
+
+    def __mul__(self, other):
+        return Fq(self.n * (other if isinstance(other, int) else other.n))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return Fq(self.n * invert(other if isinstance(other, int) else other.n, P))
+
+    def inv(self) -> "Fq":
+        return Fq(invert(self.n, P))
+
+    def __eq__(self, other):
+        if isinstance(other, int):
+            return self.n == other % P
+        if not isinstance(other, Fq):
+            return NotImplemented
+        return self.n == other.n
+
+    def __hash__(self):
+        return hash(int(self.n))
+
+    def __int__(self):
+        return int(self.n)
+
+    def __repr__(self):
+        return f"Fq({int(self.n)})"
+
+
+class Fq2:
+    """
+    Element c0 + c1·i of Fq2, with the Karatsuba arithmetic above.
+
+    Supports +, -, * (by Fq2 or int), /, unary -, == and hashing, plus the
+    zero()/one() constructors the point formulas use.
+    """
+
+    __slots__ = ("c0", "c1")
+
+    def __init__(self, c0: int, c1: int = 0):
+        self.c0 = c0 % P
+        self.c1 = c1 % P
+
+    @classmethod
+    def zero(cls) -> "Fq2":
+        return cls(0, 0)
+
+    @classmethod
+    def one(cls) -> "Fq2":
+        return cls(1, 0)
+
+    @property
+    def coeffs(self) -> tuple[int, int]:
+        return (int(self.c0), int(self.c1))
+
+    def __add__(self, other):
+        if isinstance(other, int):
+            return Fq2(self.c0 + other, self.c1)
+        return Fq2(self.c0 + other.c0, self.c1 + other.c1)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, int):
+            return Fq2(self.c0 - other, self.c1)
+        return Fq2(self.c0 - other.c0, self.c1 - other.c1)
+
+    def __neg__(self):
+        return Fq2(-self.c0, -self.c1)
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return Fq2(self.c0 * other, self.c1 * other)
+        a0, a1, b0, b1 = self.c0, self.c1, other.c0, other.c1
+        t0 = a0 * b0
+        t1 = a1 * b1
+        return Fq2(t0 - t1, (a0 + a1) * (b0 + b1) - t0 - t1)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, int):
+            return self * invert(other, P)
+        return self * other.inv()
+
+    def square(self) -> "Fq2":
+        a0, a1 = self.c0, self.c1
+        return Fq2((a0 + a1) * (a0 - a1), 2 * a0 * a1)
+
+    def inv(self) -> "Fq2":
+        return Fq2(*fq2_inv((self.c0, self.c1)))
+
+    def conj(self) -> "Fq2":
+        return Fq2(self.c0, -self.c1)
+
+    def __eq__(self, other):
+        if isinstance(other, int):
+            return self.c1 == 0 and self.c0 == other % P
+        if not isinstance(other, Fq2):
+            return NotImplemented
+        return self.c0 == other.c0 and self.c1 == other.c1
+
+    def __hash__(self):
+        return hash(self.coeffs)
+
+    def __repr__(self):
+        return f"Fq2({int(self.c0)}, {int(self.c1)})"
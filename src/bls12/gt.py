@@ -0,0 +1,159 @@
+"""
+GT Arithmetic
+
+GT is the order-r subgroup of Fq12* that pairings land in. Its elements
+are the py_ecc optimized FQ12 values returned by pair(); the arithmetic
+runs in the tower of fields.py.
+
+GT lies in the cyclotomic subgroup, so inversion is the conjugation
+a0 + a1·w ↦ a0 - a1·w and squaring is Granger–Scott. Moreover p ≡ z
+(mod r), so the p-power Frobenius acts on GT as z, exactly like ψ on G2:
+exponentiation reuses the four-way GLS split of endomorphism.py and needs
+64 squarings instead of 255. A product ∏ e(Pi, Qi)^ki of cached pairing
+values is therefore much cheaper than fresh pairings.
+
+Compression (torus T2): a unitary a = g + h·w (g, h ∈ Fq6, g² - v·h² = 1)
+is determined by c = (1 + g) / h ∈ Fq6 through a = (c + w) / (c - w).
+c = 0 would decode to -1 ∉ GT, so it encodes the identity, the only
+element with h = 0. The encoding is the six Fq coefficients of c, 48
+bytes big-endian each: 288 bytes instead of 576.
+"""
+
+from py_ecc.optimized_bls12_381 import FQ12, curve_order
+
+from .endomorphism import gls_msm
+from .fields import (
+    FQ12_ONE,
+    P,
+    fq6_inv,
+    fq6_mul,
+    fq12_conj,
+    fq12_cyclotomic_pow,
+    fq12_cyclotomic_sqr,
+    fq12_frobenius,
+    fq12_from_pyecc,
+    fq12_inv,
+    fq12_mul,
+    fq12_to_pyecc_coeffs,
+)
+
+GT_ONE = FQ12.one()  # Identity of GT
+
+# Size of the compressed encoding
+GT_BYTES = 288
+
+# Window of the GT exponentiation, see bn254/optim/wnaf.py
+GT_WINDOW = 4
+
+
+def _to_gt(a) -> FQ12:
+    return FQ12(fq12_to_pyecc_coeffs(a))
+
+
+def _frobenius(a):
+    return fq12_frobenius(a, 1)
+
+
+def gt_mul(a: FQ12, b: FQ12) -> FQ12:
+    """
+    Product of two GT elements.
+    """
+    return _to_gt(fq12_mul(fq12_from_pyecc(a), fq12_from_pyecc(b)))
+
+
+def gt_inv(a: FQ12) -> FQ12:
+    """
+    Inverse of a GT element, a conjugation.
+    """
+    return _to_gt(fq12_conj(fq12_from_pyecc(a)))
+
+
+def gt_pow(a: FQ12, k: int) -> FQ12:
+    """
+    a^k for a ∈ GT.
+
+    Args:
+        a (FQ12): A GT element (the result of a pairing)
+        k (int): Exponent, any integer (reduced modulo r)
+
+    Returns:
+        FQ12: a^k
+    """
+    R = gls_msm(
+        [fq12_from_pyecc(a)], [k], fq12_mul, fq12_cyclotomic_sqr, fq12_conj, _frobenius, GT_WINDOW
+    )
+    return GT_ONE if R is None else _to_gt(R)
+
+
+def gt_multi_pow(elements, exponents) -> FQ12:
+    """
+    ∏ ai^ki for ai ∈ GT, with one shared chain of cyclotomic squarings.
+
+    Args:
+        elements (List[FQ12]): GT elements
+        exponents (List[int]): Exponents (reduced modulo r)
+
+    Returns:
+        FQ12: The product
+    """
+    elements = list(elements)
+    if not elements:
+        return GT_ONE
+    R = gls_msm(
+        [fq12_from_pyecc(a) for a in elements],
+        list(exponents),
+        fq12_mul,
+        fq12_cyclotomic_sqr,
+        fq12_conj,
+        _frobenius,
+        GT_WINDOW,
+    )
+    return GT_ONE if R is None else _to_gt(R)
+
+
+def gt_to_bytes(a: FQ12) -> bytes:
+    """
+    Compressed 288-byte encoding of a GT element, e.g. for transcripts.
+
+    Args:
+        a (FQ12): A GT element
+
+    Returns:
+        bytes: The six Fq coefficients of (1 + g) / h, or zeros for the identity
+    """
+    t = fq12_from_pyecc(a)
+    g, h = t[:6], t[6:]
+    if not any(h):
+        return bytes(GT_BYTES)
+    c = fq6_mul(((g[0] + 1) % P,) + g[1:], fq6_inv(h))
+    return b"".join(int(x).to_bytes(48, "big") for x in c)
+
+
+def gt_from_bytes(data: bytes) -> FQ12:
+    """
+    Decode gt_to_bytes, checking that the result lies in GT.
+
+    Args:
+        data (bytes): 288-byte encoding
+
+    Returns:
+        FQ12: The GT element
+
+    Raises:
+        ValueError: If the encoding is malformed or not an element of GT
+    """
+    if len(data) != GT_BYTES:
+        raise ValueError(f"GT encoding must be {GT_BYTES} bytes, got {len(data)}")
+    c = tuple(int.from_bytes(data[i : i + 48], "big") for i in range(0, GT_BYTES, 48))
+    if any(x >= P for x in c):
+        raise ValueError("GT encoding has a coefficient outside Fq")
+    if not any(c):
+        return GT_ONE
+    zero = (0,) * 6
+    a = fq12_mul(c + (1,) + zero[1:], fq12_inv(c + (P - 1,) + zero[1:]))
+    # a is unitary by construction; GT also needs a^(p⁴ - p² + 1) = 1 and a^r = 1
+    if fq12_mul(fq12_frobenius(fq12_frobenius(a, 2), 2), a) != fq12_frobenius(a, 2):
+        raise ValueError("GT encoding is not in the cyclotomic subgroup")
+    if fq12_cyclotomic_pow(a, curve_order) != FQ12_ONE:
+        raise ValueError("GT encoding is not in the order-r subgroup")
+    return _to_gt(a)
@@ -0,0 +1,188 @@
+"""
+Hashing to G1
+
+RFC 9380 hash_to_curve for BLS12-381 G1, suite BLS12381G1_XMD:SHA-256_SSWU_RO_:
+
+    u0, u1 = hash_to_field(msg, 2)            expand_message_xmd, SHA-256
+    Qi     = iso_map(sswu(ui))                simplified SWU on the 11-isogenous
+                                              curve E', then the isogeny to E1
+    P      = h_eff · (Q0 + Q1)                h_eff = 1 - z, a 64-bit scalar
+
+The discrete logarithm of the result is unknown to everyone, unlike g1·H(m),
+and the cost is one field exponentiation and two inversions per map plus a
+64-bit multiplication, instead of a 255-bit one.
+
+Everything runs on integers of the bigint layer, the cofactor clearing in
+Jacobian coordinates without the point classes of the backends, and the
+result is an affine point that the backends wrap (backend hash_to_g1).
+"""
+
+from py_ecc.bls.hash import expand_message_xmd
+from py_ecc.optimized_bls12_381.constants import (
+    ISO_11_A,
+    ISO_11_B,
+    ISO_11_MAP_COEFFICIENTS,
+    ISO_11_Z,
+    SQRT_MINUS_11_CUBED,
+)
+import hashlib
+
+from .bigint import invert
+from .fields import P, _SQRT_EXP
+from .endomorphism import BLS_X
+
+# Length of each hash_to_field output in bytes, ceil((381 + 128) / 8)
+HASH_TO_FIELD_L = 64
+
+_A = int(ISO_11_A)
+_B = int(ISO_11_B)
+_Z = int(ISO_11_Z)
+_SQRT_MINUS_Z3 = int(SQRT_MINUS_11_CUBED)  # √(-Z³)
+_MINUS_B_OVER_A = -_B * invert(_A, P) % P
+_B_OVER_ZA = _B * invert(_Z * _A, P) % P
+
+# Isogeny polynomials x_num, x_den, y_num, y_den, coefficients by ascending degree
+_ISO_MAP = tuple(tuple(int(k) for k in poly) for poly in ISO_11_MAP_COEFFICIENTS)
+
+
+def hash_to_field_fq(msg: bytes, count: int, dst: bytes) -> list[int]:
+    """
+    RFC 9380 hash_to_field to Fq with expand_message_xmd (SHA-256).
+
+    Args:
+        msg (bytes): Message
+        count (int): Number of field elements
+        dst (bytes): Domain separation tag
+
+    Returns:
+        List[int]: count elements of Fq
+    """
+    uniform = expand_message_xmd(msg, dst, count * HASH_TO_FIELD_L, hashlib.sha256)
+    return [
+        int.from_bytes(uniform[i : i + HASH_TO_FIELD_L], "big") % P
+        for i in range(0, count * HASH_TO_FIELD_L, HASH_TO_FIELD_L)
+    ]
+
+
+def _sswu(u: int):
+    """Simplified SWU map Fq → E': y² = x³ + A'·x + B' (affine)."""
+    zu2 = _Z * u * u % P
+    tv1 = (zu2 * zu2 + zu2) % P
+    x1 = _MINUS_B_OVER_A * (1 + invert(tv1, P)) % P if tv1 else _B_OVER_ZA
+    gx1 = (x1 * x1 * x1 + _A * x1 + _B) % P
+    # p ≡ 3 (mod 4): c = gx1^((p+1)/4) is √gx1 if gx1 is a square and √(-gx1)
+    # otherwise, when gx2 = Z³u⁶·gx1 has the root u³·c·√(-Z³) at x2 = Z·u²·x1
+    c = pow(gx1, _SQRT_EXP, P)
+    if c * c % P == gx1:
+        x, y = x1, c
+    else:
+        x, y = zu2 * x1 % P, c * u * u * u * _SQRT_MINUS_Z3 % P
+    if (u & 1) != (y & 1):
+        y = P - y
+    return x, y
+
+
+def _horner(poly, x: int) -> int:
+    acc = 0
+    for k in reversed(poly):
+        acc = (acc * x + k) % P
+    return acc
+
+
+def map_to_curve_g1(u: int):
+    """
+    RFC 9380 map_to_curve for G1: simplified SWU followed by the 11-isogeny.
+
+    Args:
+        u (int): An element of Fq
+
+    Returns:
+        Tuple[int, int]: Affine point of E1 (not yet in G1), or None at the
+            identity (u on the kernel of the isogeny)
+    """
+    x, y = _sswu(u)
+    x_num, x_den, y_num, y_den = (_horner(poly, x) for poly in _ISO_MAP)
+    den = x_den * y_den % P
+    if not den:
+        return None
+    inv = invert(den, P)
+    return int(x_num * y_den * inv % P), int(y * y_num * x_den * inv % P)
+
+
+# Jacobian arithmetic on E1 (a = 0), Z = 0 at infinity
+
+def _jac_double(X, Y, Z):
+    """dbl-2009-l."""
+    A = X * X % P
+    B = Y * Y % P
+    C = B * B % P
+    D = 2 * ((X + B) * (X + B) - A - C) % P
+    E = 3 * A % P
+    X3 = (E * E - 2 * D) % P
+    return X3, (E * (D - X3) - 8 * C) % P, 2 * Y * Z % P
+
+
+def _jac_madd(X, Y, Z, x2: int, y2: int):
+    """madd-2007-bl: (X : Y : Z) + (x2, y2), with the exceptional cases."""
+    if not Z:
+        return x2, y2, 1
+    ZZ = Z * Z % P
+    H = (x2 * ZZ - X) % P
+    r = 2 * (y2 * Z * ZZ - Y) % P
+    if not H:
+        return _jac_double(X, Y, Z) if not r else (1, 1, 0)
+    HH = H * H % P
+    I = 4 * HH % P
+    J = H * I % P
+    V = X * I % P
+    X3 = (r * r - J - 2 * V) % P
+    return X3, (r * (V - X3) - 2 * Y * J) % P, ((Z + H) * (Z + H) - ZZ - HH) % P
+
+
+def _jac_to_affine(X, Y, Z):
+    if not Z:
+        return None
+    zi = invert(Z, P)
+    zi2 = zi * zi % P
+    return int(X * zi2 % P), int(Y * zi2 * zi % P)
+
+
+def clear_cofactor_g1(A):
+    """
+    h_eff·A = |z|·A + A for an affine point of E1 (z < 0).
+
+    Args:
+        A (Tuple[int, int] | None): Affine point on the curve, None at infinity
+
+    Returns:
+        Tuple[int, int] | None: Affine point in G1
+    """
+    if A is None:
+        return None
+    x, y = A
+    R = (x, y, 1)
+    for bit in bin(-BLS_X)[3:]:
+        R = _jac_double(*R)
+        if bit == "1":
+            R = _jac_madd(*R, x, y)
+    return _jac_to_affine(*_jac_madd(*R, x, y))
+
+
+def hash_to_g1_affine(msg: bytes, dst: bytes):
+    """
+    RFC 9380 hash_to_curve to G1 as an affine point.
+
+    Args:
+        msg (bytes): Message
+        dst (bytes): Domain separation tag
+
+    Returns:
+        Tuple[int, int] | None: Affine point in G1 (None at the identity,
+            which happens with negligible probability)
+    """
+    Q = (1, 1, 0)
+    for u in hash_to_field_fq(msg, 2, dst):
+        A = map_to_curve_g1(u)
+        if A is not None:
+            Q = _jac_madd(*Q, *A)
+    return clear_cofactor_g1(_jac_to_affine(*Q))
@@ -0,0 +1,120 @@
+"""
+Multi-Scalar Multiplication Engine
+
+Backend-agnostic bucket (Pippenger) multi-scalar multiplication.
+The group law is passed in by the caller, so the same engine serves
+every curve backend. ``None`` is used internally as the empty
+accumulator and is never handed to the group operations.
+
+The other engines of this package (precompute, endomorphism, subgroup,
+and the wNAF module shared with bn254) follow the same convention: they
+take add/double/neg and any endomorphism as arguments and never import a
+backend, and ``None`` stands for the identity.
+"""
+
+# Scalars are reduced modulo the group order, which is below 2^255
+SCALAR_BITS = 255
+
+# Below this many (non-zero) terms the plain per-base loop (GLV scalar
+# multiplications) is cheaper than buckets over the GLV-split terms;
+# crossover measured by tests/benchmark_msm.py on both backends
+PIPPENGER_THRESHOLD = 4
+
+
+def pippenger_window(n: int, bits: int = SCALAR_BITS) -> int:
+    """
+    Pick the bucket window size for an MSM of n terms.
+
+    Cost model: ceil(bits / c) windows, each costing n bucket additions
+    plus about 2 * 2^c additions for the running-sum reduction.
+
+    Args:
+        n (int): Number of terms
+        bits (int): Bit length of the largest scalar
+
+    Returns:
+        int: Window size c ≥ 1
+    """
+    best_c, best_cost = 1, None
+    for c in range(1, 17):
+        cost = -(-bits // c) * (n + (2 << c))
+        if best_cost is None or cost < best_cost:
+            best_c, best_cost = c, cost
+    return best_c
+
+
+def msm_naive(bases, scalars, add, mul):
+    """
+    Reference MSM: one full scalar multiplication per base.
+
+    Args:
+        bases (List[Point]): Points [P1, ..., Pn]
+        scalars (List[int]): Scalars [k1, ..., kn]
+        add (Callable): Group addition
+        mul (Callable): Scalar multiplication mul(P, k)
+
+    Returns:
+        Point | None: ∑(Pi · ki), or None for an empty input
+    """
+    acc = None
+    for B, s in zip(bases, scalars):
+        pt = mul(B, s)
+        acc = add(acc, pt) if acc is not None else pt
+    return acc
+
+
+def msm_pippenger(bases, scalars, add, double, window: int | None = None):
+    """
+    Bucket-method multi-scalar multiplication.
+
+    Every scalar is cut into c-bit digits. For each digit position the
+    bases are dropped into 2^c - 1 buckets by digit value, and the
+    buckets are combined as ∑ j·B_j with two running sums. Windows are
+    processed from the most significant one down, with c doublings of
+    the accumulator between them.
+
+    Args:
+        bases (List[Point]): Points [P1, ..., Pn]
+        scalars (List[int]): Non-negative scalars [k1, ..., kn]
+        add (Callable): Group addition
+        double (Callable): Group doubling
+        window (int | None): Window size; picked from n when omitted
+
+    Returns:
+        Point | None: ∑(Pi · ki), or None if every term vanishes
+    """
+    bits = max((s.bit_length() for s in scalars), default=0)
+    if bits == 0:
+        return None
+
+    c = window or pippenger_window(len(bases), bits)
+    mask = (1 << c) - 1
+    terms = list(zip(bases, scalars))
+
+    result = None
+    for shift in range(((bits - 1) // c) * c, -1, -c):
+        if result is not None:
+            for _ in range(c):
+                result = double(result)
+
+        # Bucket j - 1 collects every base whose current digit is j
+        buckets = [None] * mask
+        for P, k in terms:
+            d = (k >> shift) & mask
+            if d:
+                b = buckets[d - 1]
+                buckets[d - 1] = P if b is None else add(b, P)
+
+        # ∑ j·B_j = B_top + (B_top + B_top-1) + ... via running sums
+        running = None
+        window_sum = None
+        for b in reversed(buckets):
+            if b is not None:
+                running = b if running is None else add(running, b)
+            if running is not None:
+                window_sum = running if window_sum is None else add(window_sum, running)
+
+        if window_sum is not None:
+            result = window_sum if result is None else add(result, window_sum)
+
+    return result
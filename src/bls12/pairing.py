@@ -0,0 +1,199 @@
+"""
+Pairing Engine
+
+Miller loop and final exponentiation as separate steps, so a product of
+pairings ∏ e(Pi, Qi) runs one shared Miller loop (the squarings of the
+accumulator are done once for all pairs) and a single final
+exponentiation. Verification equations e(A, W) = e(B, g2) are checked as
+e(A, W) · e(-B, g2) = 1.
+
+The loop is the optimal ate loop over |z| (64 iterations, 5 additions)
+and walks the G2 point in affine coordinates on the twist. All the G2
+arithmetic only depends on Q, so it is done once by PreparedG2, which
+stores the two Fq2 coefficients of every line; evaluating a line at P is
+then one Fq2-by-Fq multiplication, and the line enters the accumulator
+through a sparse (0, 2, 3) multiplication. The final exponentiation
+squares in the cyclotomic subgroup (Granger–Scott).
+
+All field arithmetic runs in the lazy-reduction tower of fields.py; the
+result is converted to py_ecc's basis once, at the end, and is
+bit-identical to py_ecc's pairing.
+
+Both backends hand points in as canonical affine integer tuples:
+(x, y) for G1 and ((x0, x1), (y0, y1)) for G2, None for the identity.
+GT elements are py_ecc optimized FQ12 values.
+"""
+
+from functools import lru_cache
+
+from py_ecc.optimized_bls12_381 import FQ12
+
+from .fields import (
+    FQ12_ONE,
+    P as field_modulus,
+    final_exponentiation,
+    fq2_inv,
+    fq2_mul,
+    fq2_mul_fq,
+    fq2_sqr,
+    fq2_sub,
+    fq12_mul_by_023,
+    fq12_sqr,
+    fq12_to_pyecc_coeffs,
+)
+
+# Number of pairing values kept by cached_pairing
+PAIRING_CACHE_SIZE = 256
+
+# |z| for BLS12-381; the Miller loop runs over its bits below the leading one
+ATE_LOOP_COUNT = 0xD201000000010000
+_LOOP_BITS = bin(ATE_LOOP_COUNT)[3:]
+
+
+class PreparedG2:
+    """
+    A G2 point with its Miller-loop line coefficients precomputed.
+
+    With Q untwisted to (x·w⁻², y·w⁻³), the line through T with slope λ
+    evaluated at P = (xP, yP) is, up to a factor w³ that the final
+    exponentiation removes,
+
+        l(P) = (yT - λ·xT) + (λ·xP)·w² - yP·w³
+
+    so each line is stored as the pair (λ, yT - λ·xT) ∈ Fq2².
+    """
+
+    __slots__ = ("point", "lines")
+
+    def __init__(self, Q):
+        """
+        Args:
+            Q (tuple | None): Affine G2 point as integers
+        """
+        self.point = Q
+        self.lines = None if Q is None else _line_coefficients(Q)
+
+
+def _line_coefficients(Q) -> list:
+    """Walk T = Q, 2Q, ... through the ate loop and record every line."""
+    xQ, yQ = Q
+    xT, yT = xQ, yQ
+    lines = []
+    for bit in _LOOP_BITS:
+        # Tangent at T, T ← 2T
+        lam = fq2_mul(fq2_mul_fq(fq2_sqr(xT), 3), fq2_inv(fq2_mul_fq(yT, 2)))
+        lines.append((lam, fq2_sub(yT, fq2_mul(lam, xT))))
+        x3 = fq2_sub(fq2_sqr(lam), fq2_mul_fq(xT, 2))
+        xT, yT = x3, fq2_sub(fq2_mul(lam, fq2_sub(xT, x3)), yT)
+        if bit == "1":
+            # Chord through T and Q, T ← T + Q
+            lam = fq2_mul(fq2_sub(yQ, yT), fq2_inv(fq2_sub(xQ, xT)))
+            lines.append((lam, fq2_sub(yT, fq2_mul(lam, xT))))
+            x3 = fq2_sub(fq2_sub(fq2_sqr(lam), xT), xQ)
+            xT, yT = x3, fq2_sub(fq2_mul(lam, fq2_sub(xT, x3)), yT)
+    return lines
+
+
+def _mul_line(f, line, xP: int, neg_yP: int) -> tuple:
+    """
+    f · l(P) with the sparse multiplication: l(P) only has the coefficients
+    of 1, w² and w³.
+    """
+    (lam0, lam1), c = line
+    return fq12_mul_by_023(f, c, (lam0 * xP % field_modulus, lam1 * xP % field_modulus), neg_yP)
+
+
+def prepare_g2(Q) -> PreparedG2:
+    """
+    Precompute the line coefficients of a G2 point.
+
+    Args:
+        Q (tuple | PreparedG2 | None): Affine G2 point as integers
+
+    Returns:
+        PreparedG2: Q with its lines; an already prepared Q is returned as is
+    """
+    if isinstance(Q, PreparedG2):
+        return Q
+    return PreparedG2(Q)
+
+
+def _miller_loop(pairs) -> tuple:
+    """
+    Multi-Miller loop ∏ f_Qi(Pi), without final exponentiation.
+
+    Args:
+        pairs (Iterable[tuple]): (P, Q) with P an affine integer G1 point and
+            Q an affine integer G2 point or a PreparedG2
+
+    Returns:
+        tuple: The product of the Miller functions in tower form, 1 if no
+            pair is non-trivial
+    """
+    terms = []
+    for P, Q in pairs:
+        Q = prepare_g2(Q)
+        if P is not None and Q.lines is not None:
+            terms.append((P[0] % field_modulus, -P[1] % field_modulus, Q.lines))
+
+    f = FQ12_ONE
+    if not terms:
+        return f
+
+    idx = 0
+    for bit in _LOOP_BITS:
+        f = fq12_sqr(f)
+        for xP, neg_yP, lines in terms:
+            f = _mul_line(f, lines[idx], xP, neg_yP)
+        idx += 1
+        if bit == "1":
+            for xP, neg_yP, lines in terms:
+                f = _mul_line(f, lines[idx], xP, neg_yP)
+            idx += 1
+    return f
+
+
+def miller_loop(pairs) -> FQ12:
+    """
+    Multi-Miller loop ∏ f_Qi(Pi) as a py_ecc FQ12, see _miller_loop.
+    """
+    return FQ12(fq12_to_pyecc_coeffs(_miller_loop(pairs)))
+
+
+def pairing(P, Q) -> FQ12:
+    """
+    Reduced pairing e(P, Q) = f_Q(P)^((p^12 - 1) / r).
+    """
+    return pairing_product([(P, Q)])
+
+
+@lru_cache(maxsize=PAIRING_CACHE_SIZE)
+def cached_pairing(P, Q) -> FQ12:
+    """
+    pairing(P, Q) memoised on the affine integer coordinates.
+
+    Meant for pairings of long-lived points, such as e(A, Y) for a signature
+    A and a public key Y, whose powers are then taken in GT (gt.gt_pow)
+    instead of pairing again.
+    """
+    return pairing(P, Q)
+
+
+def pairing_product(pairs) -> FQ12:
+    """
+    ∏ e(Pi, Qi) with a single final exponentiation.
+
+    Args:
+        pairs (Iterable[tuple]): (P, Q) pairs, Q optionally a PreparedG2
+
+    Returns:
+        FQ12: The product in GT
+    """
+    return FQ12(fq12_to_pyecc_coeffs(final_exponentiation(_miller_loop(pairs))))
+
+
+def pairing_product_is_one(pairs) -> bool:
+    """
+    Check ∏ e(Pi, Qi) = 1 with a single final exponentiation.
+    """
+    return final_exponentiation(_miller_loop(pairs)) == FQ12_ONE
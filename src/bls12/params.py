@@ -2,18 +2,98 @@
 Re-Exports for the core library so the rest of the code remains backend-agnostic.
 """
 
-from .backend_pyecc import (
-    rand_scalar,
-    g1_mul,
-    g2_mul,
-    msm_g1,
-    pair,
-    ecc_add as add,
-    G1,
-    G2,
-    curve_order,  # Order of the group
-)
+import os
 
-# Canonical generators (tuples from py-ecc)
+from .bigint import BIGINT_BACKEND, batch_invert, invert  # gmpy2 when importable, plain ints otherwise
+from bn254.optim.config import OptimConfig, set_optim, get_optim  # shared with bn254
+
+# Selectable backend: "pyecc" (affine py_ecc points) / "jacobian" (inversion-free Jacobian points)
+BACKEND = os.getenv("BLS12_BACKEND", "pyecc")
+
+if BACKEND == "jacobian":
+    from .backend_jacobian import (
+        rand_scalar,
+        g1_mul,
+        g2_mul,
+        msm_g1,
+        msm_g2,
+        register_fixed_g1,
+        register_fixed_g2,
+        pair,
+        pair_cached,
+        pairing_product,
+        pairing_product_is_one,
+        prepare_g2,
+        neg,
+        sub,
+        double,
+        is_identity,
+        identity,
+        batch_normalize,
+        to_affine,
+        from_affine,
+        in_subgroup,
+        batch_in_subgroup,
+        hash_to_g1,
+        ecc_add as add,
+        G1,
+        G2,
+        G2_PREPARED,
+        curve_order,  # Order of the group
+        GT_ONE,
+        gt_mul,
+        gt_inv,
+        gt_pow,
+        gt_multi_pow,
+        gt_to_bytes,
+        gt_from_bytes,
+    )
+    BACKEND_NAME = "jacobian"
+else:
+    from .backend_pyecc import (
+        rand_scalar,
+        g1_mul,
+        g2_mul,
+        msm_g1,
+        msm_g2,
+        register_fixed_g1,
+        register_fixed_g2,
+        pair,
+        pair_cached,
+        pairing_product,
+        pairing_product_is_one,
+        prepare_g2,
+        neg,
+        sub,
+        double,
+        is_identity,
+        identity,
+        batch_normalize,
+        to_affine,
+        from_affine,
+        in_subgroup,
+        batch_in_subgroup,
+        hash_to_g1,
+        ecc_add as add,
+        G1,
+        G2,
+        G2_PREPARED,
+        curve_order,  # Order of the group
+        GT_ONE,
+        gt_mul,
+        gt_inv,
+        gt_pow,
+        gt_multi_pow,
+        gt_to_bytes,
+        gt_from_bytes,
+    )
+    BACKEND_NAME = "pyecc"
+
+# Canonical generators of the selected backend
 g1 = G1  # Generator of group G1
 g2 = G2  # Generator of group G2
+g2_prepared = G2_PREPARED  # g2 with its Miller-loop lines precomputed
+
+
+def _debug_backend():
+    print(f"[bls12.params] Using backend: {BACKEND_NAME} (big integers: {BIGINT_BACKEND})")
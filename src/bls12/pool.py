@@ -0,0 +1,106 @@
+"""
+Offline/Online Signing Pool
+
+Part of a BBS+ signature depends only on the signer's randomness, not on
+the messages: in v1 the pair (e, 1/(x + e)), in v2 (r, 1/(x + y·r)) together
+with g1·h0^r. A pool computes such items ahead of time ("offline"), so the
+online signing path is left with hashing the attributes and one MSM.
+
+A background thread keeps the pool filled to its target depth. When a burst
+drains it, take() falls back to computing the item inline, so signing never
+blocks on the pool. The thread shares the interpreter with the signers; it
+refills between bursts rather than speeding up a saturated process.
+"""
+
+import hashlib
+import hmac
+import queue
+import threading
+
+# Items kept ready by default
+DEFAULT_POOL_DEPTH = 64
+
+
+def key_fingerprint(*secret: int) -> bytes:
+    """
+    SHA-256 tag of a private key, so that a pool names its key without holding it.
+
+    Args:
+        *secret (int): The private scalars (sk in v1, x and y in v2)
+
+    Returns:
+        bytes: 32-byte fingerprint
+    """
+    h = hashlib.sha256(b"BBS+ signing pool owner")
+    for s in secret:
+        h.update(s.to_bytes(32, "big"))
+    return h.digest()
+
+
+class RandomnessPool:
+    """
+    Bounded pool of precomputed signing randomness for one key.
+    """
+
+    def __init__(self, produce, owner: bytes, depth: int = DEFAULT_POOL_DEPTH, background: bool = True):
+        """
+        Args:
+            produce (Callable[[], Any]): Computes one item
+            owner (bytes): key_fingerprint of the key the items belong to
+            depth (int): Target number of ready items
+            background (bool): Start the refill thread
+        """
+        self._produce = produce
+        self.owner = owner
+        self.depth = depth
+        self._items = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._refill, name="bbs-signing-pool", daemon=True)
+            self._thread.start()
+
+    def _refill(self):
+        while not self._stop.is_set():
+            item = self._produce()
+            while not self._stop.is_set():
+                try:
+                    self._items.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def belongs_to(self, owner: bytes) -> bool:
+        """Whether the pool was built for the key with this fingerprint (constant time)."""
+        return hmac.compare_digest(self.owner, owner)
+
+    def fill(self) -> None:
+        """Top the pool up to its depth in the calling thread (e.g. at startup)."""
+        while True:
+            try:
+                self._items.put_nowait(self._produce())
+            except queue.Full:
+                return
+
+    def take(self):
+        """A precomputed item, or a freshly computed one when the pool is empty."""
+        try:
+            return self._items.get_nowait()
+        except queue.Empty:
+            return self._produce()
+
+    def close(self) -> None:
+        """Stop the refill thread; items already in the pool stay usable."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __len__(self) -> int:
+        return self._items.qsize()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,233 @@
+"""
+Fixed-Base Precomputation
+
+Lim–Lee comb tables for bases that are multiplied over and over
+(generators, issuer public keys). A table is built once per base and
+turns every later scalar multiplication into about 2·⌈255/t⌉ group
+operations instead of ~380 for double-and-add.
+
+FixedBaseRegistry decides which bases get a table: a base is tabled once
+it has been seen FIXED_BUILD_AFTER times, and at most MAX_FIXED_BASES
+tables are kept, so one-off bases never pay for a build.
+"""
+
+import threading
+from collections import OrderedDict
+
+from .msm import SCALAR_BITS
+
+# Comb width t: the table holds 2^t - 1 points and a multiplication costs
+# ⌈255/t⌉ - 1 doublings plus at most ⌈255/t⌉ additions
+COMB_TEETH = 8
+
+# Upper bound on the number of bases with a table, per registry
+MAX_FIXED_BASES = 32
+
+# Multiplications of a registered base before its table is built by the
+# backends: a table costs several variable-base multiplications, so a key
+# that is only used once (e.g. one of many issuers) never gets one
+FIXED_BUILD_AFTER = 2
+
+
+class CombTable:
+    """
+    Comb table for one fixed base P.
+
+    With t teeth spaced d = ⌈bits/t⌉ apart, entry j holds
+    ∑_{i : bit i of j} 2^{i·d}·P for j = 1 .. 2^t - 1.
+    """
+
+    __slots__ = ("teeth", "spacing", "points")
+
+    def __init__(self, base, add, double, teeth: int = COMB_TEETH, bits: int = SCALAR_BITS, normalize=None):
+        """
+        Args:
+            base (Point): The fixed base P
+            add (Callable): Group addition
+            double (Callable): Group doubling
+            teeth (int): Comb width t
+            bits (int): Scalar bit length covered by the table
+            normalize (Callable | None): Optional batch normalization applied
+                to the finished table (see backend_jacobian.batch_normalize)
+        """
+        self.teeth = teeth
+        self.spacing = -(-bits // teeth)
+
+        # Row generators 2^{i·d}·P
+        rows = [base]
+        for _ in range(1, teeth):
+            R = rows[-1]
+            for _ in range(self.spacing):
+                R = double(R)
+            rows.append(R)
+
+        # Every subset sum of the rows, indexed by its bit mask
+        points = [None] * (1 << teeth)
+        for i, R in enumerate(rows):
+            step = 1 << i
+            points[step] = R
+            for j in range(1, step):
+                points[step + j] = add(points[j], R)
+        if normalize is not None:
+            points[1:] = normalize(points[1:])
+        self.points = points
+
+    def mul(self, k: int, add, double):
+        """
+        Scalar multiplication k·P from the table.
+
+        Args:
+            k (int): Scalar in [0, 2^(t·d))
+            add (Callable): Group addition
+            double (Callable): Group doubling
+
+        Returns:
+            Point | None: k·P, or None when k = 0
+        """
+        d, points = self.spacing, self.points
+        chunk_mask = (1 << d) - 1
+        chunks = [(k >> (i * d)) & chunk_mask for i in range(self.teeth)]
+
+        R = None
+        for col in range(d - 1, -1, -1):
+            if R is not None:
+                R = double(R)
+            idx = 0
+            for i, chunk in enumerate(chunks):
+                idx |= ((chunk >> col) & 1) << i
+            if idx:
+                R = points[idx] if R is None else add(R, points[idx])
+        return R
+
+
+def comb_msm(tables, scalars, add, double):
+    """
+    Fixed-base MSM ∑ ki·Pi from comb tables of the same shape.
+
+    All terms share one chain of d - 1 doublings, so n terms cost
+    d - 1 doublings and at most n·d additions.
+
+    Args:
+        tables (List[CombTable]): Tables of the bases, all with the same teeth
+        scalars (List[int]): Scalars in [0, 2^(t·d))
+        add (Callable): Group addition
+        double (Callable): Group doubling
+
+    Returns:
+        Point | None: The sum, or None when it vanishes trivially
+    """
+    if not tables:
+        return None
+    teeth, d = tables[0].teeth, tables[0].spacing
+    chunk_mask = (1 << d) - 1
+    chunks = [[(k >> (i * d)) & chunk_mask for i in range(teeth)] for k in scalars]
+
+    R = None
+    for col in range(d - 1, -1, -1):
+        if R is not None:
+            R = double(R)
+        for table, term in zip(tables, chunks):
+            idx = 0
+            for i, chunk in enumerate(term):
+                idx |= ((chunk >> col) & 1) << i
+            if idx:
+                R = table.points[idx] if R is None else add(R, table.points[idx])
+    return R
+
+
+class FixedBaseRegistry:
+    """
+    Registry of bases that get a comb table.
+
+    Registering a base is cheap; its table is only built once the base has
+    been multiplied ``build_after`` times since registration (the earlier
+    multiplications fall back to the variable-base path). At most
+    ``max_bases`` tables are kept, the least recently used one is dropped
+    when the limit is exceeded.
+    """
+
+    def __init__(
+        self,
+        add,
+        double,
+        key,
+        teeth: int = COMB_TEETH,
+        max_bases: int = MAX_FIXED_BASES,
+        normalize=None,
+        build_after: int = 1,
+    ):
+        """
+        Args:
+            add (Callable): Group addition
+            double (Callable): Group doubling
+            key (Callable): Maps a point to a hashable, canonical key
+            teeth (int): Comb width t of every table
+            max_bases (int): Maximum number of registered bases
+            normalize (Callable | None): Batch normalization for finished tables
+            build_after (int): Multiplications of a base before its table is built
+        """
+        self._add = add
+        self._double = double
+        self._key = key
+        self._normalize = normalize
+        self.teeth = teeth
+        self.max_bases = max_bases
+        self.build_after = build_after
+        self._tables = OrderedDict()  # key → CombTable, or None until built
+        self._uses = {}  # key → multiplications so far of bases not yet built
+        self._lock = threading.Lock()
+
+    def register(self, P) -> None:
+        """Mark P as a fixed base; its table is built lazily."""
+        if P is None:
+            return
+        k = self._key(P)
+        with self._lock:
+            if k in self._tables:
+                self._tables.move_to_end(k)
+                return
+            self._tables[k] = None
+            while len(self._tables) > self.max_bases:
+                self._uses.pop(self._tables.popitem(last=False)[0], None)
+
+    def table(self, P) -> CombTable | None:
+        """
+        Return the table of P (building it when due), or None if P is not
+        registered or has not been multiplied often enough yet.
+        """
+        if P is None:
+            return None
+        k = self._key(P)
+        with self._lock:
+            if k not in self._tables:
+                return None
+            self._tables.move_to_end(k)
+            table = self._tables[k]
+            if table is None:
+                uses = self._uses.get(k, 0) + 1
+                if uses < self.build_after:
+                    self._uses[k] = uses
+                    return None
+                self._uses.pop(k, None)
+        if table is None:
+            # Built outside the lock; two racing builders produce the same table
+            table = CombTable(P, self._add, self._double, self.teeth, normalize=self._normalize)
+            with self._lock:
+                if k in self._tables:
+                    self._tables[k] = table
+        return table
+
+    def mul(self, P, k: int):
+        """
+        Multiply a registered base from its table.
+
+        Returns:
+            Point | None: k·P, or NotImplemented when P has no table (yet)
+        """
+        table = self.table(P)
+        if table is None:
+            return NotImplemented
+        return table.mul(k, self._add, self._double)
+
+    def __len__(self) -> int:
+        return len(self._tables)
@@ -0,0 +1,344 @@
+"""
+Point and Scalar Serialization
+
+Compressed point encodings in the ZCash BLS12-381 format used by the IETF
+BLS/BBS drafts:
+
+    G1: 48 bytes, x big-endian
+    G2: 96 bytes, x.c1 ∥ x.c0 (imaginary part first)
+
+The top three bits of the first byte are flags: 0x80 = compressed (always
+set), 0x40 = point at infinity (all other bits zero), 0x20 = y is the
+lexicographically larger of ±y (for Fq2: compare c1, then c0 if c1 = 0).
+Scalars are 32 bytes big-endian, the width the transcripts already use.
+
+Decoding recomputes y = √(x³ + b), which costs a field exponentiation, so
+it goes through an LRU cache keyed by the encoding: a long-lived issuer key
+received with every credential is decompressed once. Decoding checks the
+encoding and that the point is on the curve, and then that it lies in G1
+or G2 (subgroup.py) unless the caller passes trusted=True for bytes from
+its own issuer. Multi-point decoders (lists, key/signature/proof layouts,
+decode_all) collect their points and check each group in one batch.
+
+The key, signature and proof layouts built on top of these live in
+v1/serialize.py and v2/serialize_v2.py.
+"""
+
+from functools import lru_cache
+
+from .fields import P, fq2_sqr, fq2_sqrt, fq_sqrt
+from .params import batch_in_subgroup, batch_normalize, curve_order, from_affine, to_affine
+
+G1_BYTES = 48
+G2_BYTES = 96
+SCALAR_BYTES = 32
+
+# Distinct encodings kept decompressed, per group
+DECOMPRESS_CACHE_SIZE = 1024
+
+_FLAG_COMPRESSED = 0x80
+_FLAG_INFINITY = 0x40
+_FLAG_SIGN = 0x20
+_FLAGS = _FLAG_COMPRESSED | _FLAG_INFINITY | _FLAG_SIGN
+
+_B1 = 4  # E1: y² = x³ + 4
+_B2 = (4, 4)  # E2: y² = x³ + 4(1 + i)
+_HALF_P = (int(P) - 1) // 2
+
+
+def _with_flags(x: int, size: int, sign: bool) -> bytes:
+    data = bytearray(x.to_bytes(size, "big"))
+    data[0] |= _FLAG_COMPRESSED | (_FLAG_SIGN if sign else 0)
+    return bytes(data)
+
+
+def _infinity(size: int) -> bytes:
+    return bytes([_FLAG_COMPRESSED | _FLAG_INFINITY]) + bytes(size - 1)
+
+
+def _split_flags(data: bytes, size: int, group: str):
+    """Check length and flags; returns (x as an integer, sign bit), or None at infinity."""
+    if len(data) != size:
+        raise ValueError(f"{group} encoding must be {size} bytes, got {len(data)}")
+    flags = data[0] & _FLAGS
+    if not flags & _FLAG_COMPRESSED:
+        raise ValueError(f"{group} encoding is not compressed")
+    x = int.from_bytes(bytes([data[0] & ~_FLAGS & 0xFF]) + data[1:], "big")
+    if flags & _FLAG_INFINITY:
+        if flags & _FLAG_SIGN or x:
+            raise ValueError(f"{group} encoding of infinity has stray bits")
+        return None
+    return x, bool(flags & _FLAG_SIGN)
+
+
+# -----------------------------------------------
+# G1
+
+def _g1_encode(A) -> bytes:
+    if A is None:
+        return _infinity(G1_BYTES)
+    x, y = A
+    return _with_flags(x, G1_BYTES, y > _HALF_P)
+
+
+def g1_to_bytes(Pt) -> bytes:
+    """
+    Compressed 48-byte encoding of a G1 point.
+
+    Args:
+        Pt: A point in G1 (either backend, identity included)
+
+    Returns:
+        bytes: ZCash-format encoding
+    """
+    return _g1_encode(to_affine(Pt))
+
+
+@lru_cache(maxsize=DECOMPRESS_CACHE_SIZE)
+def _g1_decompress(data: bytes):
+    split = _split_flags(data, G1_BYTES, "G1")
+    if split is None:
+        return None
+    x, sign = split
+    if x >= P:
+        raise ValueError("G1 encoding has x outside Fq")
+    y = fq_sqrt(x * x * x + _B1)
+    if y is None:
+        raise ValueError("G1 encoding is not on the curve")
+    y = int(y)
+    if (y > _HALF_P) != sign:
+        y = int(P) - y
+    return (x, y)
+
+
+def g1_from_bytes(data: bytes, trusted: bool = False):
+    """
+    Decode g1_to_bytes (cached, see DECOMPRESS_CACHE_SIZE).
+
+    Args:
+        data (bytes): 48-byte encoding
+        trusted (bool): Skip the subgroup check (bytes from our own issuer)
+
+    Returns:
+        A point in G1 of the selected backend
+
+    Raises:
+        ValueError: If the encoding is malformed, not on the curve or not in G1
+    """
+    return decode_all([data], ByteReader.g1, trusted)[0]
+
+
+# -----------------------------------------------
+# G2
+
+def _fq2_sign(y) -> bool:
+    return y[1] > _HALF_P if y[1] else y[0] > _HALF_P
+
+
+def _g2_encode(A) -> bytes:
+    if A is None:
+        return _infinity(G2_BYTES)
+    (x0, x1), y = A
+    return _with_flags(x1 * (1 << 384) + x0, G2_BYTES, _fq2_sign(y))
+
+
+def g2_to_bytes(Q) -> bytes:
+    """
+    Compressed 96-byte encoding of a G2 point.
+
+    Args:
+        Q: A point in G2 (either backend, identity included)
+
+    Returns:
+        bytes: ZCash-format encoding
+    """
+    return _g2_encode(to_affine(Q))
+
+
+@lru_cache(maxsize=DECOMPRESS_CACHE_SIZE)
+def _g2_decompress(data: bytes):
+    split = _split_flags(data, G2_BYTES, "G2")
+    if split is None:
+        return None
+    x_int, sign = split
+    x = (x_int & ((1 << 384) - 1), x_int >> 384)
+    if x[0] >= P or x[1] >= P:
+        raise ValueError("G2 encoding has x outside Fq2")
+    x3 = fq2_sqr(x)
+    x3 = ((x3[0] * x[0] - x3[1] * x[1] + _B2[0]) % P, (x3[0] * x[1] + x3[1] * x[0] + _B2[1]) % P)
+    y = fq2_sqrt(x3)
+    if y is None:
+        raise ValueError("G2 encoding is not on the curve")
+    y = (int(y[0]), int(y[1]))
+    if _fq2_sign(y) != sign:
+        y = (-y[0] % int(P), -y[1] % int(P))
+    return (x, y)
+
+
+def g2_from_bytes(data: bytes, trusted: bool = False):
+    """
+    Decode g2_to_bytes (cached, see DECOMPRESS_CACHE_SIZE).
+
+    Args:
+        data (bytes): 96-byte encoding
+        trusted (bool): Skip the subgroup check (bytes from our own issuer)
+
+    Returns:
+        A point in G2 of the selected backend
+
+    Raises:
+        ValueError: If the encoding is malformed, not on the curve or not in G2
+    """
+    return decode_all([data], ByteReader.g2, trusted)[0]
+
+
+# -----------------------------------------------
+# Batches and scalars
+
+def g1_list_to_bytes(points) -> bytes:
+    """
+    Concatenated encodings of G1 points, normalized with one shared inversion.
+    """
+    return b"".join(_g1_encode(to_affine(Pt)) for Pt in batch_normalize(points))
+
+
+def g1_list_from_bytes(data: bytes, trusted: bool = False) -> list:
+    """
+    Decode g1_list_to_bytes, with one batched subgroup check.
+
+    Raises:
+        ValueError: If the length is not a multiple of 48 or an encoding is invalid
+    """
+    if len(data) % G1_BYTES:
+        raise ValueError(f"G1 list length {len(data)} is not a multiple of {G1_BYTES}")
+    chunks = [data[i : i + G1_BYTES] for i in range(0, len(data), G1_BYTES)]
+    return decode_all(chunks, ByteReader.g1, trusted)
+
+
+def scalar_to_bytes(k: int) -> bytes:
+    """32-byte big-endian encoding of a scalar, reduced modulo r."""
+    return (int(k) % curve_order).to_bytes(SCALAR_BYTES, "big")
+
+
+def scalar_from_bytes(data: bytes) -> int:
+    """
+    Decode scalar_to_bytes.
+
+    Raises:
+        ValueError: If the length is wrong or the value is not below r
+    """
+    if len(data) != SCALAR_BYTES:
+        raise ValueError(f"Scalar encoding must be {SCALAR_BYTES} bytes, got {len(data)}")
+    k = int.from_bytes(data, "big")
+    if k >= curve_order:
+        raise ValueError("Scalar encoding is not reduced modulo r")
+    return k
+
+
+def u16_to_bytes(n: int) -> bytes:
+    """Two-byte big-endian length or index field of the layouts."""
+    return n.to_bytes(2, "big")
+
+
+class SubgroupBatch:
+    """
+    Decoded points awaiting their subgroup check, one list per group.
+    """
+
+    __slots__ = ("g1", "g2")
+
+    def __init__(self):
+        self.g1 = []
+        self.g2 = []
+
+    def verify(self):
+        """
+        Check every collected point, one batch per group.
+
+        Raises:
+            ValueError: If some point is not in G1 or G2
+        """
+        if not batch_in_subgroup(self.g1, "g1"):
+            raise ValueError("Decoded G1 point is not in the prime-order subgroup")
+        if not batch_in_subgroup(self.g2, "g2"):
+            raise ValueError("Decoded G2 point is not in the prime-order subgroup")
+
+
+class ByteReader:
+    """
+    Sequential decoder for the fixed layouts: each read consumes its field
+    and raises ValueError on truncated input; finish() rejects trailing bytes.
+    Decoded points are only checked to be on the curve and are added to
+    ``pending`` for a later subgroup check (see decode_all).
+    """
+
+    __slots__ = ("data", "pos", "pending")
+
+    def __init__(self, data: bytes, pending: SubgroupBatch | None = None):
+        self.data = bytes(data)
+        self.pos = 0
+        self.pending = pending
+
+    def raw(self, n: int) -> bytes:
+        if self.pos + n > len(self.data):
+            raise ValueError(f"Encoding truncated at byte {self.pos}, {n} more expected")
+        out = self.data[self.pos : self.pos + n]
+        self.pos += n
+        return out
+
+    def u16(self) -> int:
+        return int.from_bytes(self.raw(2), "big")
+
+    def u32(self) -> int:
+        return int.from_bytes(self.raw(4), "big")
+
+    def scalar(self) -> int:
+        return scalar_from_bytes(self.raw(SCALAR_BYTES))
+
+    def g1(self):
+        Pt = from_affine(_g1_decompress(self.raw(G1_BYTES)), "g1")
+        if self.pending is not None:
+            self.pending.g1.append(Pt)
+        return Pt
+
+    def g2(self):
+        Q = from_affine(_g2_decompress(self.raw(G2_BYTES)), "g2")
+        if self.pending is not None:
+            self.pending.g2.append(Q)
+        return Q
+
+    def finish(self):
+        if self.pos != len(self.data):
+            raise ValueError(f"{len(self.data) - self.pos} trailing bytes after the encoding")
+
+
+def decode_all(blobs, read, trusted: bool = False) -> list:
+    """
+    Decode several encodings and subgroup-check all their points together.
+
+    Args:
+        blobs (Iterable[bytes]): Encodings, each consumed entirely
+        read (Callable[[ByteReader], Any]): Layout decoder
+        trusted (bool): Skip the subgroup checks (bytes from our own issuer)
+
+    Returns:
+        list: read(...) of every encoding
+
+    Raises:
+        ValueError: If an encoding is malformed or a point is not in G1/G2
+    """
+    pending = None if trusted else SubgroupBatch()
+    out = []
+    for data in blobs:
+        reader = ByteReader(data, pending)
+        out.append(read(reader))
+        reader.finish()
+    if pending is not None:
+        pending.verify()
+    return out
+
+
+def decompress_cache_clear():
+    """Empty the decompression caches (e.g. after rotating issuer keys)."""
+    _g1_decompress.cache_clear()
+    _g2_decompress.cache_clear()
@@ -0,0 +1,140 @@
+"""
+Subgroup Membership Checks
+
+A point decoded from the wire is only known to lie on the curve, i.e. in
+E(Fq) = G1 × (cofactor part) or E'(Fq2) = G2 × (cofactor part). Pairing
+equations with points outside G1/G2 are unsound, so untrusted points need a
+membership check. Multiplying by r costs a full 255-bit scalar
+multiplication; the endomorphism tests (Scott, "A note on group membership
+tests for G1, G2 and GT on BLS pairing-friendly curves") are exact and much
+cheaper:
+
+    G1:  σ(P) = -z²·P   for σ(x, y) = (β²·x, y)       two |z|-multiplications
+    G2:  ψ(Q) = z·Q                                      one |z|-multiplication
+
+Batches go through a random linear combination: S = ∑ ρi·Pi with ρi drawn
+uniformly from [0, q), q the smallest prime factor of the cofactor, and S
+is tested once. If some Pi has a non-trivial cofactor component, of order
+at least q, S passes with probability at most 1/q, so the round is repeated
+until the error is below 2^-SUBGROUP_SECURITY: 41 rounds on G1, 18 on G2.
+A round costs one (mixed) addition per point, as ρi·Pi goes into bucket
+ρi, while an individual test costs as much as ~90 (G1) or ~45 (G2) such
+additions, so large batches are checked 2-3x faster than point by point,
+and 4-10x faster than by multiplying every point by r.
+
+Unlike msm.py, the checks hand ``None`` (the identity) to the group
+operations, so the backend's add/double must accept it.
+"""
+
+import math
+import secrets
+
+from py_ecc.optimized_bls12_381 import field_modulus
+
+from .endomorphism import BLS_X, GLV_BETA
+
+# Statistical security of the batched checks, in bits
+SUBGROUP_SECURITY = 64
+
+# Smallest prime factors of the cofactors
+# h1 = 3 · 11² · 10177² · 859267² · 52437899²
+# h2 = 13² · 23² · 2713 · 11953 · 262069 · (a 448-bit prime)
+G1_COFACTOR_MIN_PRIME = 3
+G2_COFACTOR_MIN_PRIME = 13
+
+# σ = φ²: (x, y) ↦ (β²·x, y), which acts on G1 as λ² ≡ -z² (mod r)
+SIGMA_BETA = GLV_BETA * GLV_BETA % field_modulus
+
+# Cost of one individual test in bucket additions (measured on both
+# backends), for choosing between the paths
+G1_CHECK_COST = 90
+G2_CHECK_COST = 45
+
+
+def _mul_abs_z(P, add, double):
+    """|z|·P by double-and-add; |z| = 0xd201000000010000 has six set bits."""
+    R = P
+    for bit in bin(-BLS_X)[3:]:
+        R = double(R)
+        if bit == "1":
+            R = add(R, P)
+    return R
+
+
+def g1_check(P, add, double, sigma, is_identity) -> bool:
+    """
+    Exact G1 membership test σ(P) = -z²·P for a point on E(Fq).
+
+    Args:
+        P (Point): A point on the curve
+        add, double (Callable): Group law (None-tolerant)
+        sigma (Callable): (x, y) ↦ (β²·x, y), the cube-root endomorphism
+            with eigenvalue -z² on G1
+        is_identity (Callable): Identity predicate
+
+    Returns:
+        bool: True iff P ∈ G1
+    """
+    return is_identity(add(_mul_abs_z(_mul_abs_z(P, add, double), add, double), sigma(P)))
+
+
+def g2_check(Q, add, double, psi, is_identity) -> bool:
+    """
+    Exact G2 membership test ψ(Q) = z·Q = -|z|·Q for a point on E'(Fq2).
+
+    Args:
+        Q (Point): A point on the twist
+        add, double (Callable): Group law (None-tolerant)
+        psi (Callable): The endomorphism ψ
+        is_identity (Callable): Identity predicate
+
+    Returns:
+        bool: True iff Q ∈ G2
+    """
+    return is_identity(add(_mul_abs_z(Q, add, double), psi(Q)))
+
+
+def batch_rounds(q: int, security: int = SUBGROUP_SECURITY) -> int:
+    """Random-combination rounds for an error below 2^-security with coefficients in [0, q)."""
+    return math.ceil(security / math.log2(q))
+
+
+def batch_check(points, check, add, q: int, check_cost: int, security: int = SUBGROUP_SECURITY) -> bool:
+    """
+    Check that every point lies in the prime-order subgroup.
+
+    Small batches are tested point by point; larger ones through random
+    linear combinations (see the module docstring).
+
+    Args:
+        points (List[Point]): Points on the curve
+        check (Callable): Exact test of a single point, e.g. g1_check bound to a backend
+        add (Callable): Group addition (None-tolerant)
+        q (int): Smallest prime factor of the cofactor
+        check_cost (int): Cost of one call to check, in additions
+        security (int): Bits of statistical security
+
+    Returns:
+        bool: True if all points are members (up to a 2^-security error);
+            False if some point is certainly not
+    """
+    points = list(points)
+    n = len(points)
+    rounds = batch_rounds(q, security)
+    if rounds * (n + 2 * q + check_cost) >= n * check_cost:
+        return all(check(P) for P in points)
+
+    for _ in range(rounds):
+        buckets = [None] * q
+        for P in points:
+            rho = secrets.randbelow(q)
+            if rho:
+                buckets[rho] = add(buckets[rho], P)
+        # ∑ ρ·bucket_ρ through running sums
+        running = S = None
+        for rho in range(q - 1, 0, -1):
+            running = add(running, buckets[rho])
+            S = add(S, running)
+        if S is not None and not check(S):
+            return False
+    return True
@@ -1,14 +1,42 @@
+from ..commitments import CommitmentCache
 from .keygen import KeyPair
-from .signer import sign, update_attributes, re_randomise
-from .verifier import verify
+from .signer import sign, signing_pool, update_attributes, re_randomise
+from .verifier import verify, verify_batch
 from .zkproof import prove_disclosure, verify_disclosure
+from .serialize import (
+    public_key_to_bytes,
+    public_key_from_bytes,
+    keypair_to_bytes,
+    keypair_from_bytes,
+    signature_to_bytes,
+    signature_from_bytes,
+    signatures_to_bytes,
+    signatures_from_bytes,
+    proof_to_bytes,
+    proof_from_bytes,
+    proofs_from_bytes,
+)
 
 __all__ = [
+    "CommitmentCache",
     "KeyPair",
     "sign",
+    "signing_pool",
     "verify",
+    "verify_batch",
     "update_attributes",
     "re_randomise",
     "prove_disclosure",
     "verify_disclosure",
+    "public_key_to_bytes",
+    "public_key_from_bytes",
+    "keypair_to_bytes",
+    "keypair_from_bytes",
+    "signature_to_bytes",
+    "signature_from_bytes",
+    "signatures_to_bytes",
+    "signatures_from_bytes",
+    "proof_to_bytes",
+    "proof_from_bytes",
+    "proofs_from_bytes",
 ]
@@ -0,0 +1,88 @@
+"""
+Message Bases
+
+The v1 message bases are fixed points hᵢ = g1^(i+2), i = 0, 1, …, shared by
+every key. They are computed once per process and kept here instead of
+being rebuilt with one scalar multiplication each on every call: h₀ = 2·g1
+and hᵢ₊₁ = hᵢ + g1, so growing the table costs one addition per base plus
+one shared normalization.
+
+The table holds at least V1_PRELOAD_BASES bases after first use and grows
+on demand. It only ever grows; readers get the current tuple without
+locking, growth is serialized by a lock.
+"""
+
+import threading
+
+from ..params import add, batch_normalize, double, g1
+
+# Bases built on first use; larger requests grow the table
+V1_PRELOAD_BASES = 32
+
+
+class BasisRegistry:
+    """
+    Process-wide table of the bases hᵢ = g1^(i+2).
+    """
+
+    def __init__(self, preload: int = V1_PRELOAD_BASES):
+        """
+        Args:
+            preload (int): Number of bases built on first use
+        """
+        self.preload = preload
+        self._bases = ()
+        self._lock = threading.Lock()
+
+    def _grow(self, n: int) -> tuple:
+        with self._lock:
+            bases = self._bases
+            if len(bases) >= n:
+                return bases
+            # Grow geometrically, so a sequence of growing requests stays linear
+            target = max(n, self.preload, 2 * len(bases))
+            h = bases[-1] if bases else double(g1)
+            new = [] if bases else [h]
+            while len(bases) + len(new) < target:
+                h = add(h, g1)
+                new.append(h)
+            self._bases = bases + tuple(batch_normalize(new))
+            return self._bases
+
+    def get(self, n: int) -> list:
+        """
+        The first n bases [h₀, …, hₙ₋₁].
+
+        Args:
+            n (int): Number of bases
+
+        Returns:
+            List[Point2D]: Bases in G1
+        """
+        bases = self._bases
+        if len(bases) < n:
+            bases = self._grow(n)
+        return list(bases[:n])
+
+    def select(self, indices) -> list:
+        """
+        The bases at the given positions.
+
+        Args:
+            indices (Iterable[int]): Base indices
+
+        Returns:
+            List[Point2D]: [h_i for i in indices]
+        """
+        indices = list(indices)
+        bases = self._bases
+        if indices and len(bases) <= max(indices):
+            bases = self._grow(max(indices) + 1)
+        return [bases[i] for i in indices]
+
+    def __len__(self) -> int:
+        return len(self._bases)
+
+
+# Shared by every v1 entry point
+BASES = BasisRegistry()
@@ -0,0 +1,129 @@
+"""
+Byte layouts for v1 keys, signatures and proofs.
+
+All integers are big-endian; points use the compressed encodings of
+bls12/serialize.py (G1 48 bytes, G2 96 bytes, scalars 32 bytes).
+
+    public key   pk (G2)                                             96
+    KeyPair      sk ∥ pk                                            128
+    signature    A (G1) ∥ e                                          80
+    proof        A ∥ e ∥ c ∥ commit (G1)
+                 ∥ u16 |H| ∥ (u16 i ∥ sᵢ)_{i∈H}
+                 ∥ u16 |D| ∥ (u16 i ∥ mᵢ)_{i∈D}            192 + 34·ℓ
+
+Decoders check that every point lies in G1/G2, in one batch per call (the
+plural decoders batch across all their inputs); trusted=True skips the
+checks for bytes from our own issuer.
+"""
+
+from ..params import batch_normalize
+from ..serialize import (
+    G1_BYTES,
+    SCALAR_BYTES,
+    ByteReader,
+    decode_all,
+    g1_to_bytes,
+    g2_to_bytes,
+    scalar_to_bytes,
+    u16_to_bytes,
+)
+from .keygen import KeyPair
+
+SIGNATURE_BYTES = G1_BYTES + SCALAR_BYTES
+
+
+def public_key_to_bytes(pk) -> bytes:
+    return g2_to_bytes(pk)
+
+
+def public_key_from_bytes(data: bytes, trusted: bool = False):
+    return decode_all([data], ByteReader.g2, trusted)[0]
+
+
+def keypair_to_bytes(kp: KeyPair) -> bytes:
+    return scalar_to_bytes(kp.sk) + g2_to_bytes(kp.pk)
+
+
+def _read_keypair(reader: ByteReader) -> KeyPair:
+    return KeyPair(reader.scalar(), reader.g2())
+
+
+def keypair_from_bytes(data: bytes, trusted: bool = False) -> KeyPair:
+    return decode_all([data], _read_keypair, trusted)[0]
+
+
+def signature_to_bytes(sig) -> bytes:
+    A, e = sig
+    return g1_to_bytes(A) + scalar_to_bytes(e)
+
+
+def _read_signature(reader: ByteReader):
+    return (reader.g1(), reader.scalar())
+
+
+def signature_from_bytes(data: bytes, trusted: bool = False):
+    return decode_all([data], _read_signature, trusted)[0]
+
+
+def signatures_to_bytes(sigs) -> bytes:
+    """
+    Concatenated signature encodings; the A points of the whole batch are
+    normalized with one shared inversion.
+    """
+    sigs = list(sigs)
+    points = batch_normalize([A for A, _ in sigs])
+    return b"".join(signature_to_bytes((A, e)) for A, (_, e) in zip(points, sigs))
+
+
+def signatures_from_bytes(data: bytes, trusted: bool = False) -> list:
+    if len(data) % SIGNATURE_BYTES:
+        raise ValueError(f"Signature batch length {len(data)} is not a multiple of {SIGNATURE_BYTES}")
+    chunks = [data[i : i + SIGNATURE_BYTES] for i in range(0, len(data), SIGNATURE_BYTES)]
+    return decode_all(chunks, _read_signature, trusted)
+
+
+def proof_to_bytes(proof: dict) -> bytes:
+    """
+    Encode a prove_disclosure proof. The order of the hidden and disclosed
+    entries is kept.
+    """
+    parts = [
+        g1_to_bytes(proof["A"]),
+        scalar_to_bytes(proof["e"]),
+        scalar_to_bytes(proof["c"]),
+        g1_to_bytes(proof["commit"]),
+    ]
+    for entries in (proof["s"], proof["disclosed"]):
+        parts.append(u16_to_bytes(len(entries)))
+        for i, k in entries.items():
+            parts.append(u16_to_bytes(i) + scalar_to_bytes(k))
+    return b"".join(parts)
+
+
+def _read_proof(reader: ByteReader) -> dict:
+    proof = {"A": reader.g1(), "e": reader.scalar(), "c": reader.scalar(), "commit": reader.g1()}
+    for key in ("s", "disclosed"):
+        proof[key] = {reader.u16(): reader.scalar() for _ in range(reader.u16())}
+    return {k: proof[k] for k in ("A", "e", "c", "s", "commit", "disclosed")}
+
+
+def proof_from_bytes(data: bytes, trusted: bool = False) -> dict:
+    """
+    Decode proof_to_bytes.
+
+    Raises:
+        ValueError: If the encoding is truncated, has trailing bytes or
+            contains an invalid point or scalar
+    """
+    return decode_all([data], _read_proof, trusted)[0]
+
+
+def proofs_from_bytes(blobs, trusted: bool = False) -> list:
+    """
+    Decode many proof_to_bytes encodings; the A and commit points of all of
+    them are subgroup-checked in one batch.
+
+    Raises:
+        ValueError: If any encoding is invalid
+    """
+    return decode_all(blobs, _read_proof, trusted)
@@ -1,67 +1,150 @@
-from ..params import rand_scalar, g1_mul, g2_mul, msm_g1, pair, g1, g2, add, curve_order
+from ..params import rand_scalar, g1_mul, g2_mul, msm_g1, pair, g1, g2, add, curve_order, invert
+from ..commitments import CommitmentCache
+from ..pool import DEFAULT_POOL_DEPTH, RandomnessPool, key_fingerprint
+from .bases import BASES
 from .utils import encode_attributes
 
 
 # Internal ------------------------------------------------------------------ #
-def _compute_A(x, e, h_bases, m_scalars):
+def _commitment(h_bases, m_scalars):
+    """
+    Message commitment U = g1 · ∏ hᵢ^mᵢ, the point that A is a root of.
+
+    Args:
+        h_bases (Point2D): Deterministic base points
+        m_scalars (list[int]): Encoded message scalars
+    """
+    h_part = msm_g1(h_bases, m_scalars) if m_scalars else None
+    return add(g1, h_part) if h_part else g1
+
+
+def _compute_A(x, e, U):
     """
     Compute parameter A for subsequent signing and verification.
 
-    Formula: A = (g1 * h0)
+    Formula: A = U^(1/(x + e)), U = g1 · ∏ hᵢ^mᵢ
 
     Args:
         x (int): Private key
         e (int): Randomly chosen integer
-        h_bases (Point2D): Deterministic base points
-        m_scalars (): Encoded message scalars
+        U (Point2D): Message commitment, see _commitment
     """
-    denom_inv = pow(x + e, -1, curve_order)  # Compute: 1 / (x + e) % curve_order
-    h_part = msm_g1(h_bases, m_scalars) if m_scalars else None
-    sum_pt = add(g1, h_part) if h_part else g1
-    return g1_mul(sum_pt, denom_inv)
+    denom_inv = invert(x + e, curve_order)  # Compute: 1 / (x + e) % curve_order
+    return g1_mul(U, denom_inv)
+
+
+def _offline_part(x):
+    """
+    Message-independent part of a signature: (e, 1/(x + e), g1^(1/(x + e))).
+    """
+    e = rand_scalar()
+    inv = invert(x + e, curve_order)
+    return e, inv, g1_mul(g1, inv)
 
 
 # Public API ---------------------------------------------------------------- #
-def sign(sk: int, messages: list[str]):
+def signing_pool(sk: int, depth: int = DEFAULT_POOL_DEPTH, background: bool = True) -> RandomnessPool:
+    """
+    Pool of precomputed signing randomness for sign(..., pool=...).
+
+    Args:
+        sk (int): Private key the pool signs for
+        depth (int): Number of items kept ready
+        background (bool): Refill from a background thread
+
+    Returns:
+        RandomnessPool: The pool; close() it when done
+    """
+    return RandomnessPool(lambda: _offline_part(sk), key_fingerprint(sk), depth, background)
+
+
+def sign(sk: int, messages: list[str], pool: RandomnessPool | None = None, cache: CommitmentCache | None = None):
     """
     Signature algorithm.
 
+    With a pool (see signing_pool), e, 1/(x + e) and g1^(1/(x + e)) come
+    precomputed and A = g1^(1/(x + e)) · ∏ hᵢ^(mᵢ/(x + e)) is one MSM.
+
     Args:
         sk (int): Private key
         messages (list[str]): Messages to be signed
+        pool (RandomnessPool | None): Precomputed randomness for this key
+        cache (CommitmentCache | None): Keeps the message commitment for
+            incremental update_attributes
 
     Returns:
         A (Point2D): A point on the elliptic curve used for subsequent signing and verification
         e (int): Random integer
     """
-    h_bases = [g1_mul(g1, i + 2) for i in range(len(messages))]  # Deterministic base points
+    h_bases = BASES.get(len(messages))  # Deterministic base points
     m_scalars = encode_attributes(messages)
+    if pool is not None:
+        if not pool.belongs_to(key_fingerprint(sk)):
+            raise ValueError("Signing pool belongs to a different key")
+        e, inv, A = pool.take()
+        if m_scalars:
+            A = add(A, msm_g1(h_bases, [m * inv % curve_order for m in m_scalars]))
+        if cache is not None:
+            cache.put((A, e), g1_mul(A, sk + e))  # U = A^(x + e)
+        return A, e
     e = rand_scalar()
-    A = _compute_A(sk, e, h_bases, m_scalars)
+    U = _commitment(h_bases, m_scalars)
+    A = _compute_A(sk, e, U)
+    if cache is not None:
+        cache.put((A, e), U)
     return A, e
 
 
-def update_attributes(sk: int, sig, messages_old: list[str], updates: dict[int, str]):
+def update_attributes(
+    sk: int,
+    sig,
+    messages_old: list[str],
+    updates: dict[int, str],
+    commitment=None,
+    cache: CommitmentCache | None = None,
+):
     """
     Update message attributes in an existing signature.
 
+    When the message commitment U of sig is known (passed as commitment,
+    or found in cache), only the changed attributes are hashed:
+    U' = U · ∏_{i changed} hᵢ^(m'ᵢ - mᵢ) and A' = U'^(1/(x + e)).
+    Otherwise U' is rebuilt from all messages.
+
     Args:
         sk (int): Private key
         sig: Existing signature (A, e)
         messages_old (list[str]): Original messages
         updates (dict[int, str]): Mapping of message indices to updated values
+        commitment (Point2D | None): U of sig, from the issuer's own records
+        cache (CommitmentCache | None): Issuer cache to read U from and to
+            store U' of the new signature in
 
     Returns:
         A_new (Point2D): Updated elliptic curve point
         e (int): Same random integer as in the original signature
     """
     A_old, e = sig
-    messages_new = messages_old[:]
-    for idx, v in updates.items():
-        messages_new[idx] = v
-    h_bases = [g1_mul(g1, i + 2) for i in range(len(messages_new))]
-    m_scalars = encode_attributes(messages_new)
-    A_new = _compute_A(sk, e, h_bases, m_scalars)
+    U = commitment
+    if U is None and cache is not None:
+        U = cache.get(sig)
+
+    if U is None:
+        messages_new = messages_old[:]
+        for idx, v in updates.items():
+            messages_new[idx] = v
+        U = _commitment(BASES.get(len(messages_new)), encode_attributes(messages_new))
+    else:
+        changed = sorted(i for i, v in updates.items() if v != messages_old[i])
+        if changed:
+            new_scalars = encode_attributes([updates[i] for i in changed])
+            old_scalars = encode_attributes([messages_old[i] for i in changed])
+            deltas = [m_new - m_old for m_new, m_old in zip(new_scalars, old_scalars)]
+            U = add(U, msm_g1(BASES.select(changed), deltas))
+
+    A_new = _compute_A(sk, e, U)
+    if cache is not None:
+        cache.put((A_new, e), U)
     return A_new, e
 
 
@@ -1,6 +1,8 @@
 from hashlib import sha256
 
-from ..params import rand_scalar, g1_mul, g2_mul, msm_g1, add, g1, g2, pair, curve_order
+from ..params import rand_scalar, g1_mul, msm_g1, msm_g2, add, neg, sub, g1, g2, g2_prepared, pairing_product_is_one, curve_order
+from ..serialize import g1_to_bytes, g2_to_bytes
+from .bases import BASES
 from .utils import encode_attributes
 
 
@@ -43,16 +45,16 @@ def prove_disclosure(pk, sig, messages, disclose_idx):
 
     transcript = b"".join(
         [
-            bytes(str(A), "utf8"),
+            g1_to_bytes(A),
             *[int(disclosed[i]).to_bytes(32, "big") for i in disclose_idx],
-            bytes(str(pk), "utf8"),
+            g2_to_bytes(pk),
         ]
     )
     c = _hash_fs(transcript)
     s_vec = {i: (r_vec[i] + c * m_scalars[i]) % curve_order for i in hidden_idx}
 
     commit_scalars = [r_vec[i] for i in hidden_idx]
-    commit_bases = [g1_mul(g1, i + 2) for i in hidden_idx]
+    commit_bases = BASES.select(hidden_idx)
     commit = msm_g1(commit_bases, commit_scalars)
 
     return {
@@ -76,7 +78,7 @@ def verify_disclosure(pk, proof, total_attrs):
         C = g₁ · ∏_{i∈D} hᵢ^{mᵢ} · ∏_{i∈H} hᵢ^{sᵢ} · A^{-c}
 
     Step 2 – Pairing check
-        e(A , pk·g₂ᵉ)  ==  e(C , g₂)
+        e(A^c , pk·g₂ᵉ) · e(C⁻¹ , g₂)  ==  1
 
     Step 3 – Fiat–Shamir consistency
         c == Hₚ(A ∥ {mᵢ}_{i∈D} ∥ pk)
@@ -90,7 +92,7 @@ def verify_disclosure(pk, proof, total_attrs):
     commit = proof["commit"]
     disclosed = proof["disclosed"]
 
-    h_bases = [g1_mul(g1, i + 2) for i in range(total_attrs)]
+    h_bases = BASES.get(total_attrs)
 
     msg_commit = g1_mul(g1, c)
     disclosed_scalars = [
@@ -102,22 +104,19 @@ def verify_disclosure(pk, proof, total_attrs):
 
     hidden_scalars = [s for s in s_vec.values()]
     hidden_bases = [h_bases[i] for i in s_vec.keys()]
-    msg_commit = add(
-        msg_commit,
-        add(msm_g1(hidden_bases, hidden_scalars), g1_mul(commit, curve_order - 1)),
-    )
-
-    lhs = pair(g1_mul(A, c), add(pk, g2_mul(g2, e)))
-    rhs = pair(msg_commit, g2)
+    msg_commit = add(msg_commit, sub(msm_g1(hidden_bases, hidden_scalars), commit))
 
     transcript = b"".join(
-        [bytes(str(A), "utf8")]
+        [g1_to_bytes(A)]
         + [int(disclosed[i]).to_bytes(32, "big") for i in sorted(disclosed)]
-        + [bytes(str(pk), "utf8")]
+        + [g2_to_bytes(pk)]
     )
 
     if c != _hash_fs(transcript):
         print("Challenge Reconstruction Failure!")
         return False
 
-    return lhs == rhs
+    # e(A^c, pk·g2^e) == e(C, g2), checked as a product with one final exponentiation
+    return pairing_product_is_one(
+        [(g1_mul(A, c), msm_g2([pk, g2], [1, e])), (neg(msg_commit), g2_prepared)]
+    )
@@ -1,14 +1,44 @@
+from ..commitments import CommitmentCache
 from .keygen_v2 import KeyPair
-from .signer_v2 import sign, update_attributes, re_randomise
-from .verifier_v2 import verify
-from .zkproof_v2 import prove_disclosure, verify_disclosure
+from .signer_v2 import sign, sign_batch, signing_pool, update_attributes, re_randomise
+from .verifier_v2 import verify, verify_batch
+from .zkproof_v2 import prove_disclosure, verify_disclosure, verify_disclosure_batch
+from .serialize_v2 import (
+    public_key_to_bytes,
+    public_key_from_bytes,
+    keypair_to_bytes,
+    keypair_from_bytes,
+    signature_to_bytes,
+    signature_from_bytes,
+    signatures_to_bytes,
+    signatures_from_bytes,
+    proof_to_bytes,
+    proof_from_bytes,
+    proofs_from_bytes,
+)
 
 __all__ = [
+    "CommitmentCache",
     "KeyPair",
     "sign",
+    "sign_batch",
+    "signing_pool",
     "verify",
+    "verify_batch",
     "update_attributes",
     "re_randomise",
     "prove_disclosure",
     "verify_disclosure",
+    "verify_disclosure_batch",
+    "public_key_to_bytes",
+    "public_key_from_bytes",
+    "keypair_to_bytes",
+    "keypair_from_bytes",
+    "signature_to_bytes",
+    "signature_from_bytes",
+    "signatures_to_bytes",
+    "signatures_from_bytes",
+    "proof_to_bytes",
+    "proof_from_bytes",
+    "proofs_from_bytes",
 ]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from py_ecc.typing import Point2D
 
-from ..params import g2_mul, rand_scalar, g2
+from ..params import batch_normalize, g2_mul, rand_scalar, g2, register_fixed_g2
 from .utils_v2 import hash_to_g1
 
 
@@ -45,6 +45,10 @@ class KeyPair:
         X = g2_mul(g2, x)
         Y = g2_mul(g2, y)
 
+        # X and Y are multiplied by fresh scalars in every proof and verification
+        register_fixed_g2(X)
+        register_fixed_g2(Y)
+
         # Generate message base points, (L+1) in total
         h_bases = []
 
@@ -61,6 +65,10 @@ class KeyPair:
                 hash_to_g1(label)
             )  # Hash mapping to the G1 group yields independent reference points
 
+        # One shared inversion puts every base in affine form, ready for
+        # serialization, hashing and mixed additions in the MSMs
+        h_bases = batch_normalize(h_bases)
+
         return cls(x, y, X, Y, h_bases)
 
     def get_pk(self):
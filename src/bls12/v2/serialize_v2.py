@@ -0,0 +1,225 @@
+"""
+Byte layouts for v2 keys, signatures and proofs.
+
+All integers are big-endian; points use the compressed encodings of
+bls12/serialize.py (G1 48 bytes, G2 96 bytes, scalars 32 bytes).
+
+    public key   X (G2) ∥ Y (G2) ∥ u16 n ∥ h₀ … h_{n-1} (G1)     194 + 48·n
+    KeyPair      x ∥ y ∥ public key                               258 + 48·n
+    signature    A (G1) ∥ r                                               80
+    proof        A (G1) ∥ T₁ (G1) ∥ T₂ (G2) ∥ c ∥ ẑ_r ∥ u16 ℓ
+                 ∥ u16 |H| ∥ (u16 j ∥ ẑ_{m_j})_{j∈H}
+                 ∥ u16 |D| ∥ (u16 i ∥ u32 len ∥ UTF-8 mᵢ)_{i∈D}
+
+Decoders check that every point lies in G1/G2, in one batch per call (the
+plural decoders batch across all their inputs); trusted=True skips the
+checks for bytes from our own issuer. Decoded issuer keys are registered as
+fixed bases, like freshly generated ones.
+"""
+
+from typing import Any, Dict
+
+from ..params import batch_normalize, register_fixed_g2
+from ..serialize import (
+    G1_BYTES,
+    SCALAR_BYTES,
+    ByteReader,
+    decode_all,
+    g1_list_to_bytes,
+    g1_to_bytes,
+    g2_to_bytes,
+    scalar_to_bytes,
+    u16_to_bytes,
+)
+from .keygen_v2 import KeyPair
+
+SIGNATURE_BYTES = G1_BYTES + SCALAR_BYTES
+
+
+def _pk_parts(X, Y, h_bases) -> bytes:
+    return g2_to_bytes(X) + g2_to_bytes(Y) + u16_to_bytes(len(h_bases)) + g1_list_to_bytes(h_bases)
+
+
+def _read_pk(reader: ByteReader):
+    X, Y = reader.g2(), reader.g2()
+    h_bases = [reader.g1() for _ in range(reader.u16())]
+    return X, Y, h_bases
+
+
+def _register(X, Y):
+    # Only after the subgroup check: X and Y get comb tables
+    register_fixed_g2(X)
+    register_fixed_g2(Y)
+
+
+def public_key_to_bytes(pk: Dict) -> bytes:
+    """
+    Encode the public key dictionary of KeyPair.get_pk().
+    """
+    return _pk_parts(pk["X"], pk["Y"], pk["h_bases"])
+
+
+def public_key_from_bytes(data: bytes, trusted: bool = False) -> Dict:
+    """
+    Decode public_key_to_bytes into a {X, Y, h_bases} dictionary.
+
+    Args:
+        data (bytes): Encoding
+        trusted (bool): Skip the subgroup checks (our own issuer's key)
+
+    Raises:
+        ValueError: If the encoding is malformed or a point is not in G1/G2
+    """
+    X, Y, h_bases = decode_all([data], _read_pk, trusted)[0]
+    _register(X, Y)
+    return {"X": X, "Y": Y, "h_bases": h_bases}
+
+
+def keypair_to_bytes(kp: KeyPair) -> bytes:
+    """
+    Encode a key pair, secret scalars first.
+    """
+    return scalar_to_bytes(kp.x) + scalar_to_bytes(kp.y) + _pk_parts(kp.X, kp.Y, kp.h_bases)
+
+
+def _read_keypair(reader: ByteReader) -> KeyPair:
+    x, y = reader.scalar(), reader.scalar()
+    return KeyPair(x, y, *_read_pk(reader))
+
+
+def keypair_from_bytes(data: bytes, trusted: bool = False) -> KeyPair:
+    """
+    Decode keypair_to_bytes.
+
+    Args:
+        data (bytes): Encoding
+        trusted (bool): Skip the subgroup checks
+
+    Raises:
+        ValueError: If the encoding is malformed or a point is not in G1/G2
+    """
+    kp = decode_all([data], _read_keypair, trusted)[0]
+    _register(kp.X, kp.Y)
+    return kp
+
+
+def signature_to_bytes(sig) -> bytes:
+    """
+    Encode a signature σ = (A, r).
+    """
+    A, r = sig
+    return g1_to_bytes(A) + scalar_to_bytes(r)
+
+
+def _read_signature(reader: ByteReader):
+    return (reader.g1(), reader.scalar())
+
+
+def signature_from_bytes(data: bytes, trusted: bool = False):
+    """
+    Decode signature_to_bytes.
+
+    Raises:
+        ValueError: If the encoding is malformed or A is not in G1
+    """
+    return decode_all([data], _read_signature, trusted)[0]
+
+
+def signatures_to_bytes(sigs) -> bytes:
+    """
+    Concatenated signature encodings; the A points of the whole batch are
+    normalized with one shared inversion.
+    """
+    sigs = list(sigs)
+    points = batch_normalize([A for A, _ in sigs])
+    return b"".join(signature_to_bytes((A, r)) for A, (_, r) in zip(points, sigs))
+
+
+def signatures_from_bytes(data: bytes, trusted: bool = False) -> list:
+    """
+    Decode signatures_to_bytes, with one batched subgroup check for all A.
+
+    Raises:
+        ValueError: If the length is not a multiple of 80 or an encoding is invalid
+    """
+    if len(data) % SIGNATURE_BYTES:
+        raise ValueError(f"Signature batch length {len(data)} is not a multiple of {SIGNATURE_BYTES}")
+    chunks = [data[i : i + SIGNATURE_BYTES] for i in range(0, len(data), SIGNATURE_BYTES)]
+    return decode_all(chunks, _read_signature, trusted)
+
+
+def proof_to_bytes(proof: Dict[str, Any]) -> bytes:
+    """
+    Encode a prove_disclosure proof. Hidden responses follow hidden_indices,
+    disclosed messages follow disclosed_indices.
+    """
+    parts = [
+        g1_to_bytes(proof["A"]),
+        g1_to_bytes(proof["T1"]),
+        g2_to_bytes(proof["T2"]),
+        scalar_to_bytes(proof["c"]),
+        scalar_to_bytes(proof["z_r"]),
+        u16_to_bytes(proof["total_messages"]),
+        u16_to_bytes(len(proof["hidden_indices"])),
+    ]
+    for j in proof["hidden_indices"]:
+        parts.append(u16_to_bytes(j) + scalar_to_bytes(proof["z_m"][j]))
+    parts.append(u16_to_bytes(len(proof["disclosed_indices"])))
+    for i in proof["disclosed_indices"]:
+        msg = proof["disclosed_messages"][i].encode()
+        parts.append(u16_to_bytes(i) + len(msg).to_bytes(4, "big") + msg)
+    return b"".join(parts)
+
+
+def _read_proof(reader: ByteReader) -> Dict[str, Any]:
+    A, T1, T2 = reader.g1(), reader.g1(), reader.g2()
+    c, z_r = reader.scalar(), reader.scalar()
+    total_messages = reader.u16()
+
+    z_m = {}
+    for _ in range(reader.u16()):
+        j = reader.u16()
+        z_m[j] = reader.scalar()
+
+    disclosed_messages = {}
+    for _ in range(reader.u16()):
+        i = reader.u16()
+        try:
+            disclosed_messages[i] = reader.raw(reader.u32()).decode()
+        except UnicodeDecodeError as exc:
+            raise ValueError(f"Disclosed message {i} is not valid UTF-8") from exc
+
+    return {
+        "A": A,
+        "T1": T1,
+        "T2": T2,
+        "c": c,
+        "z_r": z_r,
+        "z_m": z_m,
+        "disclosed_indices": list(disclosed_messages),
+        "disclosed_messages": disclosed_messages,
+        "hidden_indices": list(z_m),
+        "total_messages": total_messages,
+    }
+
+
+def proof_from_bytes(data: bytes, trusted: bool = False) -> Dict[str, Any]:
+    """
+    Decode proof_to_bytes into the dictionary prove_disclosure returns.
+
+    Raises:
+        ValueError: If the encoding is truncated, has trailing bytes or
+            contains an invalid point, scalar or UTF-8 message
+    """
+    return decode_all([data], _read_proof, trusted)[0]
+
+
+def proofs_from_bytes(blobs, trusted: bool = False) -> list:
+    """
+    Decode many proof_to_bytes encodings; A, T₁ and T₂ of all of them are
+    subgroup-checked in one batch per group.
+
+    Raises:
+        ValueError: If any encoding is invalid
+    """
+    return decode_all(blobs, _read_proof, trusted)
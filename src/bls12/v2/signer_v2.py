@@ -1,6 +1,66 @@
 from .keygen_v2 import KeyPair
-from ..params import curve_order, g1, msm_g1, g1_mul, rand_scalar
-from .utils_v2 import encode_attributes
+from ..params import (
+    add,
+    batch_invert,
+    batch_normalize,
+    curve_order,
+    double,
+    g1,
+    g1_mul,
+    invert,
+    msm_g1,
+    rand_scalar,
+    to_affine,
+)
+from ..commitments import CommitmentCache
+from ..pool import DEFAULT_POOL_DEPTH, RandomnessPool, key_fingerprint
+from ..precompute import FixedBaseRegistry, comb_msm
+from .utils_v2 import encode_attributes, hash_to_scalar
+
+# Batches of at least this many signatures run from comb tables of the
+# bases [g1, h0, ..., hL]; building the tables costs about as much as
+# a dozen signatures
+SIGN_BATCH_TABLE_MIN = 16
+
+# Comb tables of issuer bases, kept across sign_batch calls (a few keys'
+# worth; about 255 points per base)
+_ISSUER_TABLES = FixedBaseRegistry(add, double, to_affine, max_bases=128, normalize=batch_normalize)
+
+
+def _commitment(r, h_bases, m_scalars):
+    """
+    Message commitment U = g1 * h0^r * ∏_{i=1}^L h_i^m_i, the point that A is a root of
+
+    Args:
+        r (int): Randomization factor
+        h_bases (List[Point2D]): Base sequence[h0, h1, h2, ..., hL]
+        m_scalars (int): message scalars[m1, m2, ..., mL]
+
+    Returns:
+        Point2D: U ∈ G1
+    """
+
+    # Calculate the input for multi-scalar multiplication
+    # e.g., g1 * h0^r * ∏_{i=1}^L h_i^m_i
+    scalars = [1, r] + m_scalars  # exponential sequence: [1, r, m1, m2, ..., mL]
+    bases = [g1, h_bases[0]] + h_bases[
+        1 : len(m_scalars) + 1
+    ]  # Base points sequence: [g1, h0, h1, ..., hL]
+
+    return msm_g1(bases, scalars)
+
+
+def _root(x, y, r, U):
+    """
+    A = U^(1/(x + y * r))
+    """
+
+    # Calculate the reciprocal of the denominator 1/(x + y*r)
+    # e.g., denom = (x + y*r) mod p，denom_inv = denom^(-1) mod p
+    denom = (x + y * r) % curve_order
+    denom_inv = invert(denom, curve_order)
+
+    return g1_mul(U, denom_inv)
 
 
 def _compute_A(x, y, r, h_bases, m_scalars):
@@ -20,31 +80,54 @@ def _compute_A(x, y, r, h_bases, m_scalars):
         Point2D: A ∈ G1
     """
 
-    # Calculate the reciprocal of the denominator 1/(x + y*r)
-    # e.g., denom = (x + y*r) mod p，denom_inv = denom^(-1) mod p
-    denom = (x + y * r) % curve_order
-    denom_inv = pow(denom, -1, curve_order)
+    return _root(x, y, r, _commitment(r, h_bases, m_scalars))
+
+
+def _offline_part(x, y, h0):
+    """
+    Message-independent part of a signature: (r, 1/(x + y·r), (g1 · h0^r)^(1/(x + y·r))).
+    """
+    r = rand_scalar()
+    inv = invert((x + y * r) % curve_order, curve_order)
+    return r, inv, msm_g1([g1, h0], [inv, r * inv % curve_order])
 
-    # Calculate the input for multi-scalar multiplication
-    # e.g., g1 * h0^r * ∏_{i=1}^L h_i^m_i
-    scalars = [1, r] + m_scalars  # exponential sequence: [1, r, m1, m2, ..., mL]
-    bases = [g1, h_bases[0]] + h_bases[
-        1 : len(m_scalars) + 1
-    ]  # Base points sequence: [g1, h0, h1, ..., hL]
 
-    sum_pt = msm_g1(bases, scalars)
+def signing_pool(keypair: KeyPair, depth: int = DEFAULT_POOL_DEPTH, background: bool = True) -> RandomnessPool:
+    """
+    Pool of precomputed signing randomness for sign(..., pool=...)
+
+    Args:
+        keypair (KeyPair): Key pair the pool signs for
+        depth (int): Number of items kept ready
+        background (bool): Refill from a background thread
 
-    # Returns: A = sum_pt^denom_inv
-    return g1_mul(sum_pt, denom_inv)
+    Returns:
+        RandomnessPool: The pool; close() it when done
+    """
+    x, y, h0 = keypair.x, keypair.y, keypair.h_bases[0]
+    return RandomnessPool(lambda: _offline_part(x, y, h0), key_fingerprint(x, y), depth, background)
 
 
-def sign(keypair: KeyPair, messages: list[str]):
+def sign(
+    keypair: KeyPair,
+    messages: list[str],
+    pool: RandomnessPool | None = None,
+    cache: CommitmentCache | None = None,
+):
     """
     BBS+ Signature Algorithm Main Function
 
+    With a pool (see signing_pool), r, the inverse 1/(x + y·r) and
+    (g1 · h0^r)^(1/(x + y·r)) come precomputed, and the online work is
+        A = (g1 · h0^r)^(1/(x + y·r)) · ∏_{i=1}^L h_i^{m_i/(x + y·r)}
+    i.e. hashing the messages and one MSM.
+
     Args:
         keypair (KeyPair): Key pair
         messages (List[str]): List of messages awaiting signature
+        pool (RandomnessPool | None): Precomputed randomness for this key pair
+        cache (CommitmentCache | None): Keeps the message commitment for
+            incremental update_attributes
 
     Returns:
         Tuple: Signature σ = (A, r)
@@ -54,17 +137,96 @@ def sign(keypair: KeyPair, messages: list[str]):
     # e.g., m_i = Hash(messages[i]) for i = 1, ..., L
     m_scalars = encode_attributes(messages)
 
+    if pool is not None:
+        if not pool.belongs_to(key_fingerprint(keypair.x, keypair.y)):
+            raise ValueError("Signing pool belongs to a different key pair")
+        r, inv, A = pool.take()
+        if m_scalars:
+            h_bases = keypair.h_bases[1 : len(m_scalars) + 1]
+            A = add(A, msm_g1(h_bases, [m * inv % curve_order for m in m_scalars]))
+        if cache is not None:
+            cache.put((A, r), g1_mul(A, keypair.x + keypair.y * r))  # U = A^(x + y·r)
+        return (A, r)
+
     # Generate random blinding factors
     r = rand_scalar()
 
     # Calculate signature components
-    A = _compute_A(keypair.x, keypair.y, r, keypair.h_bases, m_scalars)
+    U = _commitment(r, keypair.h_bases, m_scalars)
+    A = _root(keypair.x, keypair.y, r, U)
+
+    if cache is not None:
+        cache.put((A, r), U)
 
     return (A, r)
 
 
+def sign_batch(keypair: KeyPair, messages_list: list[list[str]]):
+    """
+    BBS+ Batch Signature Algorithm
+
+    Same output as calling sign once per message list, with the work shared:
+
+    1. The denominators x + y·r_i are inverted together (Montgomery's trick, one inversion)
+    2. Every distinct attribute value is hashed once
+    3. 1/(x + y·r_i) is folded into the MSM scalars, so A_i is a single fixed-base MSM
+       A_i = g1^{inv_i} · h0^{r_i·inv_i} · ∏_{k=1}^L h_k^{m_ik·inv_i}
+       over the key's bases, run from comb tables that all signatures share
+       (kept across calls, see _ISSUER_TABLES) for batches of SIGN_BATCH_TABLE_MIN or more
+
+    Args:
+        keypair (KeyPair): Key pair
+        messages_list (List[List[str]]): Message lists awaiting signature
+
+    Returns:
+        List[Tuple]: Signatures σ_i = (A_i, r_i)
+    """
+
+    # Hash each distinct attribute value once
+    cache = {}
+    m_scalars_list = []
+    for messages in messages_list:
+        scalars = []
+        for m in messages:
+            if m not in cache:
+                cache[m] = hash_to_scalar(m.encode())
+            scalars.append(cache[m])
+        m_scalars_list.append(scalars)
+
+    # Random blinding factors and all denominator inverses at once
+    r_list = [rand_scalar() for _ in messages_list]
+    inv_list = batch_invert([keypair.x + keypair.y * r for r in r_list], curve_order)
+
+    width = 2 + max((len(scalars) for scalars in m_scalars_list), default=0)
+    bases = [g1, keypair.h_bases[0]] + keypair.h_bases[1 : width - 1]
+    tables = None
+    if len(messages_list) >= SIGN_BATCH_TABLE_MIN:
+        for B in bases:
+            _ISSUER_TABLES.register(B)
+        tables = [_ISSUER_TABLES.table(B) for B in bases]
+        if None in tables:  # More bases than the registry holds
+            tables = None
+
+    signatures = []
+    for r, inv, m_scalars in zip(r_list, inv_list, m_scalars_list):
+        # Exponents [1, r, m1, ..., mL] scaled by 1/(x + y·r)
+        scalars = [inv, r * inv % curve_order] + [m * inv % curve_order for m in m_scalars]
+        if tables is not None:
+            A = comb_msm(tables[: len(scalars)], scalars, add, double)
+        else:
+            A = msm_g1(bases[: len(scalars)], scalars)
+        signatures.append((A, r))
+
+    return signatures
+
+
 def update_attributes(
-    keypair: KeyPair, sig, messages_old: list[str], updates: dict[int, str]
+    keypair: KeyPair,
+    sig,
+    messages_old: list[str],
+    updates: dict[int, str],
+    commitment=None,
+    cache: CommitmentCache | None = None,
 ):
     """
     Update message attribute function
@@ -72,11 +234,20 @@ def update_attributes(
     Update some message attributes without regenerating random numbers.
     Advantages: Maintain certain characteristics of signatures and support incremental updates.
 
+    When the message commitment U of sig is known (passed as commitment, or
+    found in cache), only the changed attributes are hashed:
+        U' = U * ∏_{i changed} h_i^(m'_i - m_i),  A_new = U'^(1/(x + y * r))
+    an MSM over the changed indices plus one scalar multiplication.
+    Otherwise U' is rebuilt from all messages.
+
     Args:
         keypair (KeyPair): Key pair
         sig (Tuple): Original signature (A_old, r)
         messages_old (List[str]): List of original messages
         updates (Dict[int, str]): Update mapping {index: new value}
+        commitment (Point2D | None): U of sig, from the issuer's own records
+        cache (CommitmentCache | None): Issuer cache to read U from and to
+            store U' of the new signature in
 
     Returns:
         Tuple: New signature (A_new, r)
@@ -84,14 +255,32 @@ def update_attributes(
 
     A_old, r = sig
 
-    # Update messages
-    messages_new = messages_old[:]
-    for idx, new_value in updates.items():
-        messages_new[idx] = new_value
-
-    # Recalculate A
-    m_scalars = encode_attributes(messages_new)
-    A_new = _compute_A(keypair.x, keypair.y, r, keypair.h_bases, m_scalars)
+    U = commitment
+    if U is None and cache is not None:
+        U = cache.get(sig)
+
+    if U is None:
+        # Update messages
+        messages_new = messages_old[:]
+        for idx, new_value in updates.items():
+            messages_new[idx] = new_value
+
+        # Recalculate the commitment from all messages
+        m_scalars = encode_attributes(messages_new)
+        U = _commitment(r, keypair.h_bases, m_scalars)
+    else:
+        # Shift the commitment by the changed attributes only
+        changed = sorted(i for i, v in updates.items() if v != messages_old[i])
+        if changed:
+            new_scalars = encode_attributes([updates[i] for i in changed])
+            old_scalars = encode_attributes([messages_old[i] for i in changed])
+            deltas = [m_new - m_old for m_new, m_old in zip(new_scalars, old_scalars)]
+            U = add(U, msm_g1([keypair.h_bases[i + 1] for i in changed], deltas))
+
+    A_new = _root(keypair.x, keypair.y, r, U)
+
+    if cache is not None:
+        cache.put((A_new, r), U)
 
     return (A_new, r)
 
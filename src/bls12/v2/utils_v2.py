@@ -5,7 +5,10 @@ Version: 0.1
 """
 
 import hashlib
-from ..params import curve_order, g1_mul, g1
+from ..params import curve_order, hash_to_g1 as _hash_to_g1
+
+# Domain separation tag of the message bases (RFC 9380 suite naming)
+H2G1_DST = b"BBS_PLUS_V2_BLS12381G1_XMD:SHA-256_SSWU_RO_"
 
 
 def hash_to_scalar(data: bytes) -> int:
@@ -33,6 +36,9 @@ def hash_to_g1(label: bytes):
     """
     Mapping to G1 groups
 
+    Functionality: RFC 9380 hash-to-curve (SSWU + 11-isogeny), so no one
+    knows the discrete logarithm of the result with respect to g1
+
     Args:
         label (bytes): Input label
 
@@ -40,7 +46,7 @@ def hash_to_g1(label: bytes):
         Point2D: G1 group elements
     """
 
-    return g1_mul(g1, hash_to_scalar(label))
+    return _hash_to_g1(label, H2G1_DST)
 
 
 def encode_attributes(attrs: list[str]) -> list[int]:
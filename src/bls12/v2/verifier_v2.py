@@ -4,7 +4,8 @@ BBS+ Verifier
 Version: v0.1
 """
 
-from ..params import g1, g2, add, g2_mul, msm_g1, pair
+from ..batch import batch_exponent, bisect_failures
+from ..params import g1, g2_prepared, neg, msm_g1, msm_g2, pairing_product_is_one
 from .utils_v2 import encode_attributes
 
 
@@ -50,12 +51,83 @@ def verify(pk: dict, sig: tuple, messages: list[str]):
 
     # Construct left side of the equation
     # i.e., e(A, X · Y^r)
-    Yr = g2_mul(Y, r)  # Y^r = g2^(y·r)
-    left_g2 = add(X, Yr)  # X · Y^r = g2^x · g2^(y·r) = g2^(x + y·r)
-    left = pair(A, left_g2)  # e(A, X · Y^r) -> e(A, g2^(x + y·r))
+    # Y^r runs from Y's comb table when the key was generated or decoded here
+    left_g2 = msm_g2([X, Y], [1, r])  # X · Y^r = g2^x · g2^(y·r) = g2^(x + y·r)
 
-    # Construct right side of the equation
-    # i.e., e(g1 · h0^r · ∏hi^{mi}, g2)
-    right = pair(msg_commit, g2)
+    # Move the right side over: e(A, X · Y^r) · e(msg_commit^{-1}, g2) = 1
+    # Both Miller loops share a single final exponentiation
+    return pairing_product_is_one([(A, left_g2), (neg(msg_commit), g2_prepared)])
 
-    return left == right
+
+def verify_batch(pk: dict, sigs: list, messages_list: list[list[str]]) -> list[bool]:
+    """
+    Batch verification of signatures under one public key
+
+    Formula: with random ρ_i, the product of the verify equations raised to ρ_i is
+        e(∑ρ_i·A_i, X) · e(∑ρ_i·r_i·A_i, Y) = e(g1^{∑ρ_i} · h0^{∑ρ_i·r_i} · ∏_k h_k^{∑ρ_i·m_ik}, g2)
+
+    Principle:
+    1. e(A_i, X · Y^{r_i}) = e(A_i, X) · e(A_i^{r_i}, Y), so the left sides collapse into two pairings
+    2. All message commitments share the bases [g1, h0, h1, ..., hL], so their
+       combination is a single MSM with one term per base
+    3. If some signature is invalid, the combined equation holds with
+       probability at most 2^-64 over the choice of ρ
+
+    A valid batch costs three pairings (one final exponentiation) plus the
+    G1 MSMs, whatever its size. If the combined check fails, bisection
+    isolates the invalid signatures, as in v1.verify_batch.
+
+    Args:
+        pk (Dict): public key (dict {X, Y, h_bases})
+        sigs (List[Tuple[Point2D, int]]): Signatures (A, r)
+        messages_list (List[List[str]]): Messages of every signature
+
+    Returns:
+        List[bool]: Validity of every signature; False as well for a signature
+            without a message list or with more messages than the key has bases
+    """
+
+    X = pk["X"]
+    Y = pk["Y"]
+    h_bases = pk["h_bases"]
+
+    valid = [False] * len(sigs)
+    terms = {}
+    for k, (sig, messages) in enumerate(zip(sigs, messages_list)):
+        if len(messages) < len(h_bases):
+            A, r = sig
+            terms[k] = (A, r, encode_attributes(messages))
+
+    def holds(indices) -> bool:
+        A_list = []
+        rho_list = []  # ρ_i, for ∑ρ_i·A_i
+        rho_r_list = []  # ρ_i·r_i, for ∑ρ_i·r_i·A_i
+        h_coeffs = [0] * len(h_bases)  # [∑ρ_i·r_i, ∑ρ_i·m_i1, ..., ∑ρ_i·m_iL]
+        g1_coeff = 0
+
+        for k in indices:
+            A, r, m_scalars = terms[k]
+            rho = batch_exponent()
+            A_list.append(A)
+            rho_list.append(rho)
+            rho_r_list.append(rho * r)
+            g1_coeff += rho
+            h_coeffs[0] += rho * r
+            for i, m in enumerate(m_scalars):
+                h_coeffs[i + 1] += rho * m
+
+        # Combined message commitment g1^{∑ρ_i} · ∏ h_k^{coeff_k}
+        msg_commit = msm_g1([g1] + list(h_bases), [g1_coeff] + h_coeffs)
+
+        return pairing_product_is_one(
+            [
+                (msm_g1(A_list, rho_list), X),
+                (msm_g1(A_list, rho_r_list), Y),
+                (neg(msg_commit), g2_prepared),
+            ]
+        )
+
+    failed = bisect_failures(terms, holds)
+    for k in terms:
+        valid[k] = k not in failed
+    return valid
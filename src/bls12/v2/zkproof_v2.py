@@ -11,12 +11,23 @@ from ..params import (
     g1_mul,
     g2_mul,
     add,
+    sub,
     msm_g1,
+    msm_g2,
     g1,
-    g2,
+    g2_prepared,
+    neg,
     pair,
+    pair_cached,
+    pairing_product,
+    pairing_product_is_one,
     curve_order,
+    gt_multi_pow,
+    gt_pow,
+    gt_to_bytes,
 )
+from ..batch import batch_exponent, bisect_failures
+from ..serialize import g1_to_bytes, g2_to_bytes
 from .utils_v2 import encode_attributes
 
 
@@ -75,10 +86,10 @@ def prove_disclosure(
     2. Commitment value computation:
        - T₁ = h₀^r̃ · ∏_{j∈H} h_j^m̃_j  (commitment in G1)
        - T₂ = Y^r̃                       (commitment in G2)
-       - T₃ = e(A, T₂)                   (pairing commitment for verification)
+       - T₃ = e(A, T₂) = e(A, Y)^r̃      (pairing commitment for verification)
 
     3. Fiat–Shamir challenge generation:
-       - c = Hash(A, T₁, T₂, T₃, {m_i}_{i∈D})
+       - c = Hash(A, T₁, T₂, T₃, {m_i}_{i∈D}), points and T₃ in their compressed encodings
 
     4. Schnorr response computation:
        - ẑ_r = r̃ + c·r         (response for r)
@@ -122,15 +133,15 @@ def prove_disclosure(
     # Compute T₂ = Y^r̃
     T2 = g2_mul(Y, r_tilde)
 
-    # Compute T₃ = e(A, T₂)
-    T3 = pair(A, T2)
+    # Compute T₃ = e(A, T₂) as e(A, Y)^r̃: a GT exponentiation of a cached pairing
+    T3 = gt_pow(pair_cached(A, Y), r_tilde)
 
     # ===== Step 3: Fiat–Shamir challenge generation =====
     challenge_input = [
-        A,
-        T1,
-        T2,
-        T3,
+        g1_to_bytes(A),
+        g1_to_bytes(T1),
+        g2_to_bytes(T2),
+        gt_to_bytes(T3),
         len(messages),
         tuple(sorted(disclosed_indices)),
         tuple(disclosed_msgs[i] for i in sorted(disclosed_indices)),
@@ -157,6 +168,23 @@ def prove_disclosure(
     return proof
 
 
+def _recompute_challenge(proof: Dict, T3) -> int:
+    """
+    Fiat–Shamir challenge of a proof, with T₃ = e(A, T₂) supplied by the caller.
+    """
+    disclosed_indices = sorted(proof["disclosed_indices"])
+    challenge_input = [
+        g1_to_bytes(proof["A"]),
+        g1_to_bytes(proof["T1"]),
+        g2_to_bytes(proof["T2"]),
+        gt_to_bytes(T3),
+        proof["total_messages"],
+        tuple(disclosed_indices),
+        tuple(proof["disclosed_messages"][i] for i in disclosed_indices),
+    ]
+    return _hash_to_challenge(*challenge_input)
+
+
 def verify_disclosure(pk: Dict, proof: Dict) -> bool:
     """
     BBS+ selective disclosure proof verification algorithm.
@@ -203,16 +231,7 @@ def verify_disclosure(pk: Dict, proof: Dict) -> bool:
 
     # ===== Step 1: Recompute the challenge value =====
     T3 = pair(A, T2)
-    challenge_input = [
-        A,
-        T1,
-        T2,
-        T3,
-        total_messages,
-        tuple(sorted(disclosed_indices)),
-        tuple(disclosed_messages[i] for i in sorted(disclosed_indices)),
-    ]
-    c_verify = _hash_to_challenge(*challenge_input)
+    c_verify = _recompute_challenge(proof, T3)
     if c != c_verify:
         print("Challenge value verification failed!")
         return False
@@ -224,10 +243,8 @@ def verify_disclosure(pk: Dict, proof: Dict) -> bool:
 
     # ===== Step 2: Main pairing equation verification =====
     # X^c · Y^{ẑ_r} · T₂^{-1}
-    X_c = g2_mul(X, c)
-    Y_zr = g2_mul(Y, z_r)
-    T2_neg = g2_mul(T2, curve_order - 1)
-    verify_g2 = add(add(X_c, Y_zr), T2_neg)
+    # X and Y use their comb tables (registered with the key); T₂^{-1} is a negation, not a multiplication by r - 1
+    verify_g2 = sub(msm_g2([X, Y], [c, z_r]), T2)
 
     # g₁^c · ∏_{i∈D} h_i^{c·m_i}
     disclosed_scalars = encode_attributes([disclosed_messages[i] for i in sorted(disclosed_indices)])
@@ -239,14 +256,107 @@ def verify_disclosure(pk: Dict, proof: Dict) -> bool:
     B_disclosed = msm_g1(B_bases, B_scalars)
 
     # (left_commit · T₁^{-1})
-    hidden_part = add(left_commit, g1_mul(T1, curve_order - 1))
+    hidden_part = sub(left_commit, T1)
     B = add(B_disclosed, hidden_part)
 
-    # Execute pairing verification
-    left_pairing = pair(g1_mul(A, c), verify_g2)
-    right_pairing = pair(B, g2_mul(g2, c))
-    if left_pairing != right_pairing:
+    # Execute pairing verification as e(A^c, ...) · e(B^{-c}, g₂) = 1,
+    # moving c onto the G1 side so the precomputed lines of g₂ can be used
+    if not pairing_product_is_one([(g1_mul(A, c), verify_g2), (neg(g1_mul(B, c)), g2_prepared)]):
         print("Pairing equation verification failed")
         return False
 
     return True
+
+
+def _disclosure_terms(proof: Dict, h_count: int) -> Tuple:
+    """
+    Coefficients of one proof's equation in the batch check.
+
+    Dividing the pairing equation of verify_disclosure by c (≠ 0) and
+    substituting T₃ = e(A, T₂) gives
+        e(A, X)^c · e(A, Y)^ẑ_r · e(B, g₂)^{-1} = T₃
+        B = g₁^c · h₀^ẑ_r · ∏_{i∈D} h_i^{c·m_i} · ∏_{j∈H} h_j^{ẑ_{m_j}} · T₁^{-1}
+
+    Returns:
+        Tuple: (c, ẑ_r, coefficients of [h₀, h₁, ..., h_L] in B)
+    """
+    c = proof["c"]
+    h_coeffs = [0] * h_count
+    h_coeffs[0] = proof["z_r"]
+    disclosed_indices = sorted(proof["disclosed_indices"])
+    disclosed_scalars = encode_attributes([proof["disclosed_messages"][i] for i in disclosed_indices])
+    for i, m in zip(disclosed_indices, disclosed_scalars):
+        h_coeffs[i + 1] = c * m
+    for i in proof["hidden_indices"]:
+        h_coeffs[i + 1] = proof["z_m"][i]
+    return c, proof["z_r"], h_coeffs
+
+
+def verify_disclosure_batch(pk: Dict, proofs: List[Dict]) -> List[bool]:
+    """
+    Batch verification of selective disclosure proofs under one public key.
+
+    ========== Batch Equation ==========
+
+    Every challenge is still recomputed individually (T₃ = e(A, T₂) is part
+    of the hash input). The pairing equations (see _disclosure_terms) are
+    raised to random 64-bit exponents ρ and multiplied:
+
+        e(∑ρ·c·A, X) · e(∑ρ·ẑ_r·A, Y) · e(∑ρ·B, g₂)^{-1} = ∏ T₃^ρ
+
+    with ∑ρ·B a single G1 MSM over [g₁, h₀, ..., h_L, T₁, ...]: three Miller
+    loops, one final exponentiation and a short GT multi-exponentiation
+    for the whole batch. If the combined check fails, bisection isolates
+    the invalid proofs.
+
+    Args:
+        pk: Public key dictionary
+        proofs: Zero-knowledge proof dictionaries
+
+    Returns:
+        List[bool]: Validity of every proof, as verify_disclosure would report it
+    """
+    X = pk["X"]
+    Y = pk["Y"]
+    h_bases = pk["h_bases"]
+
+    valid = [False] * len(proofs)
+    terms = {}
+    for k, proof in enumerate(proofs):
+        if not all(0 <= i < len(h_bases) - 1 for i in proof["disclosed_indices"] + proof["hidden_indices"]):
+            continue
+        T3 = pair(proof["A"], proof["T2"])
+        if proof["c"] != _recompute_challenge(proof, T3):
+            continue
+        terms[k] = (proof["A"], proof["T1"], T3) + _disclosure_terms(proof, len(h_bases))
+
+    def holds(indices) -> bool:
+        A_list, A_c, A_z = [], [], []
+        T1_list, T1_coeffs = [], []
+        T3_list, rhos = [], []
+        g1_coeff = 0
+        h_coeffs = [0] * len(h_bases)
+        for k in indices:
+            A, T1, T3, c, z_r, coeffs = terms[k]
+            rho = batch_exponent()
+            A_list.append(A)
+            A_c.append(rho * c)
+            A_z.append(rho * z_r)
+            T1_list.append(T1)
+            T1_coeffs.append(-rho)
+            T3_list.append(T3)
+            rhos.append(rho)
+            g1_coeff += rho * c
+            for i, coeff in enumerate(coeffs):
+                h_coeffs[i] += rho * coeff
+
+        B = msm_g1([g1] + list(h_bases) + T1_list, [g1_coeff] + h_coeffs + T1_coeffs)
+        left = pairing_product(
+            [(msm_g1(A_list, A_c), X), (msm_g1(A_list, A_z), Y), (neg(B), g2_prepared)]
+        )
+        return left == gt_multi_pow(T3_list, rhos)
+
+    failed = bisect_failures(terms, holds)
+    for k in terms:
+        valid[k] = k not in failed
+    return valid
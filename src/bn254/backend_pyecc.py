@@ -15,8 +15,13 @@ import secrets
 from typing import List, Union
 import mclbn256 as mcl
 from mclbn256 import G1 as _G1, G2 as _G2, Fr
-from ctypes import create_string_buffer
+from ctypes import byref, create_string_buffer
 from mclbn256 import lib as _lib
+import mclbn256.mclbn256 as _mcl_core  # the ctypes library handle lives here
+
+from bn254.optim.config import get_optim
+from bn254.optim.subgroup import batch_check
+from bn254.optim.wnaf import resolve_window, wnaf_msm, wnaf_mul
 
 # Your mcl binding does not require explicit init; keep compatibility,
 # do nothing if there is no init
@@ -207,14 +212,34 @@ def _mul_int_generic(P, k: int):
 
     return R
 
+def _add(A, B):
+    return A + B
+
+def _double(A):
+    return A + A
+
+def _neg(A):
+    return -A
+
+def _mul_wnaf(P, k: int, window: int | None = None):
+    """
+    Width-w NAF multiplication; the window comes from the argument, else
+    OptimConfig.window (see bn254.optim.config.set_optim), else the default.
+    """
+    k = int(k) % curve_order
+    if k == 0:
+        return _zero_like(P)
+    w = resolve_window(window, get_optim())
+    return wnaf_mul(P, k, _add, _double, _neg, w)
+
 def multiply(P, k: int):
     return _mul_int_generic(P, k)
 
-def g1_mul(P, k: int):
-    return _mul_int_generic(P, k)
+def g1_mul(P, k: int, window: int | None = None):
+    return _mul_wnaf(P, k, window)
 
-def g2_mul(Q, k: int):
-    return _mul_int_generic(Q, k)
+def g2_mul(Q, k: int, window: int | None = None):
+    return _mul_wnaf(Q, k, window)
 
 def msm_g1(bases: List[_G1], scalars: List[int]) -> _G1:
     """Naïve O(n) multi-scalar multiplication (can replace with Pippenger later)."""
@@ -223,6 +248,19 @@ def msm_g1(bases: List[_G1], scalars: List[int]) -> _G1:
         acc = add(acc, g1_mul(B, s))
     return acc or ZERO_G1
 
+def msm_g2(bases: List[_G2], scalars: List[int], window: int | None = None) -> _G2:
+    """
+    Simultaneous multi-exponentiation in G2 (Straus): the wNAF digits of
+    all scalars share one doubling chain instead of one chain per term.
+    """
+    terms = [(B, int(s) % curve_order) for B, s in zip(bases, scalars)]
+    terms = [(B, s) for B, s in terms if B is not None and s]
+    if not terms:
+        return ZERO_G2
+    w = resolve_window(window, get_optim())
+    R = wnaf_msm([B for B, _ in terms], [s for _, s in terms], _add, _double, _neg, w)
+    return R if R is not None else ZERO_G2
+
 # ────────────────────────────────────────────────────────────────
 # 4. Pairing
 # ────────────────────────────────────────────────────────────────
@@ -234,6 +272,121 @@ def pair(P: _G1, Q: _G2):
 # Legacy alias expected by some modules
 ecc_add = add
 
+# ────────────────────────────────────────────────────────────────
+# 4b. Negation, subtraction, doubling and the identity
+# ────────────────────────────────────────────────────────────────
+
+_IDENTITIES = {"g1": ZERO_G1, "g2": ZERO_G2}
+
+def neg(P):
+    """Point negation -P (None is accepted as the identity)."""
+    return None if P is None else -P
+
+def sub(P, Q):
+    """P - Q with one negation and one addition instead of a multiplication by r - 1."""
+    return add(P, neg(Q))
+
+def double(P):
+    """Point doubling 2·P (None is accepted as the identity)."""
+    return None if P is None else P + P
+
+def is_identity(P) -> bool:
+    """Whether P is the point at infinity (None or mcl's zero point)."""
+    return P is None or bool(P.zero())
+
+def identity(group: str = "g1"):
+    """Point at infinity of "g1" or "g2"; raises ValueError for other names."""
+    if group not in _IDENTITIES:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    return _IDENTITIES[group]
+
+# ────────────────────────────────────────────────────────────────
+# 4c. Subgroup membership (for points decoded from untrusted bytes)
+# ────────────────────────────────────────────────────────────────
+
+def _mcl_order(name: str) -> int:
+    """Field or group order reported by mcl for the curve it runs on."""
+    buf = create_string_buffer(128)
+    size = getattr(_mcl_core.lib, name)(buf, len(buf))
+    return int(buf.value[:size])
+
+def _smallest_prime_factor(n: int, bound: int = 1 << 16) -> int:
+    """Smallest prime factor of n, or bound if it has none below bound."""
+    d = 2
+    while d < bound:
+        if n % d == 0:
+            return d
+        d += 1
+    return bound
+
+# Smallest prime factor of the G2 cofactor h2 = 2p - r, read off the curve
+# mcl is initialised with rather than curve_order above: on mcl's BN254
+# (p = 1679…4723) h2 = 13 · 96757 · (71-digit composite), on alt_bn128
+# (BN_SNARK1) h2 = 10069 · 5864401 · 1875725156269 · (54-digit prime)
+_G2_COFACTOR_MIN_PRIME = _smallest_prime_factor(
+    2 * _mcl_order("mclBn_getFieldOrder") - _mcl_order("mclBn_getCurveOrder")
+)
+# valid_order() costs about as much as this many terms of mclBnG2_mulVec,
+# whose cost grows with the coefficient length (measured on batches of 200+:
+# 25 with coefficients below 13, 17 with coefficients below 10069)
+_G2_CHECK_COST = 25 if _G2_COFACTOR_MIN_PRIME < 256 else 17
+
+# Fr constants for the small combination coefficients, built on first use
+_SMALL_FR: list = []
+
+def _small_fr(k: int):
+    while len(_SMALL_FR) <= k:
+        f = Fr()
+        f.setInt(len(_SMALL_FR))
+        _SMALL_FR.append(f)
+    return _SMALL_FR[k]
+
+def _g2_combiner(points):
+    """
+    combine(points, coeffs) = ∑ coeffs[i]·points[i] through mclBnG2_mulVec,
+    with the point array built once for all rounds (Python loop if the
+    binding lacks mulVec).
+    """
+    mul_vec = getattr(_mcl_core.lib, "mclBnG2_mulVec", None)
+    if mul_vec is None:
+        def combine(pts, coeffs):
+            acc = ZERO_G2
+            for Q, k in zip(pts, coeffs):
+                if k:
+                    acc = acc + Q * _small_fr(k)
+            return acc
+        return combine
+
+    n = len(points)
+    array = (_G2 * n)(*points)
+
+    def combine(_pts, coeffs):
+        out = _G2()
+        mul_vec(byref(out), array, (Fr * n)(*[_small_fr(k) for k in coeffs]), n)
+        return out
+    return combine
+
+def in_subgroup(P, group: str = "g1") -> bool:
+    """Exact membership test of one point; raises ValueError for unknown groups."""
+    if group not in _IDENTITIES:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    return is_identity(P) or bool(P.valid_order())
+
+def batch_in_subgroup(points, group: str = "g1") -> bool:
+    """
+    Membership test of a batch: G1 (cofactor 1) only needs the curve
+    check, G2 goes through random linear combinations (optim/subgroup.py).
+    """
+    if group not in _IDENTITIES:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    points = [P for P in points if not is_identity(P)]
+    if group == "g1":
+        return all(P.valid() for P in points)
+    return batch_check(
+        points, lambda Q: bool(Q.valid_order()), _g2_combiner(points),
+        _G2_COFACTOR_MIN_PRIME, _G2_CHECK_COST,
+    )
+
 # ────────────────────────────────────────────────────────────────
 # 5. Hash-to-G1
 # ────────────────────────────────────────────────────────────────
@@ -265,7 +418,15 @@ __all__ = [
     "g1_mul",
     "g2_mul",
     "msm_g1",
+    "msm_g2",
     "add",
+    "neg",
+    "sub",
+    "double",
+    "is_identity",
+    "identity",
+    "in_subgroup",
+    "batch_in_subgroup",
     "pair",
     "ecc_add",
     "hash_to_g1",
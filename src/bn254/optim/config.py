@@ -5,13 +5,27 @@ from dataclasses import dataclass
 @dataclass
 class OptimConfig:
     """
-    Unified performance/implementation configuration. 
+    Unified performance/implementation configuration, read by the bn254 and
+    the bls12 backends (bls12.params re-exports it).
     Backends read parameters as needed; parameters that have no effect can be ignored.
     """
-    window: int | None = None          # MSM window size (used later for wNAF/fixed window)
+    window: int | None = None          # wNAF width of variable-base g1_mul/g2_mul (optim.wnaf.DEFAULT_WINDOW if None)
     precompute: bool = False           # Whether to enable precomputation tables
     threads: int = 1                   # Level of parallelism / number of threads
     batch: int = 1                     # Default batch size for benchmark/batch APIs
     seed: int = 42                     # Seed for reproducible experiments
     serialize_compressed: bool = True  # (Reserved) Serialization strategy
     profile: bool = False              # Whether to output detailed timing
+
+
+_GLOBAL_OPTIM: OptimConfig | None = None
+
+
+def set_optim(optim: OptimConfig | None) -> None:
+    """Install the configuration read by the curve backend (None = defaults)."""
+    global _GLOBAL_OPTIM
+    _GLOBAL_OPTIM = optim
+
+
+def get_optim() -> OptimConfig | None:
+    return _GLOBAL_OPTIM
@@ -0,0 +1,47 @@
+# bn254/optim/subgroup.py
+"""
+Batched subgroup membership checks.
+
+G1 of BN-254 has cofactor 1, so every point on the curve is a member; G2
+is the order-r subgroup of a twist with cofactor h2 = 2p - r. A batch is
+checked through random linear combinations S = ∑ ρi·Qi with ρi uniform in
+[0, q), q the smallest prime factor of h2 (13 on mcl's BN254, 10069 on
+alt_bn128): a point with a cofactor component (of order ≥ q) survives one
+round with probability at most 1/q, so the round is repeated until the
+error is below 2^-SUBGROUP_SECURITY (18 rounds for q = 13, 5 for q = 10069).
+The group-specific pieces (the exact single-point test and the linear
+combination) are passed in.
+"""
+from __future__ import annotations
+
+import math
+import secrets
+
+# Statistical security of the batched checks, in bits
+SUBGROUP_SECURITY = 64
+
+
+def batch_rounds(q: int, security: int = SUBGROUP_SECURITY) -> int:
+    """Rounds for an error below 2^-security with coefficients in [0, q)."""
+    return math.ceil(security / math.log2(q))
+
+
+def batch_check(points, check, combine, q: int, check_cost: float,
+                security: int = SUBGROUP_SECURITY) -> bool:
+    """
+    True iff every point is in the subgroup (up to a 2^-security error).
+
+    check(P) is the exact test of one point and costs check_cost times as
+    much as one term of combine(points, coeffs) = ∑ coeffs[i]·points[i];
+    batches too small to profit are checked point by point.
+    """
+    points = list(points)
+    n = len(points)
+    rounds = batch_rounds(q, security)
+    if rounds * (n + check_cost) >= n * check_cost:
+        return all(check(P) for P in points)
+    for _ in range(rounds):
+        coeffs = [secrets.randbelow(q) for _ in range(n)]
+        if not check(combine(points, coeffs)):
+            return False
+    return True
@@ -0,0 +1,121 @@
+# bn254/optim/wnaf.py
+"""
+Width-w NAF scalar multiplication, shared by the bn254 and bls12 backends.
+
+Every non-zero digit is odd with |d| < 2^(w-1) and is followed by at least
+w-1 zeros, so an n-bit scalar costs ~n doublings plus ~n/(w+1) additions
+from a table of 2^(w-2) odd multiples. Several scalars can share one
+doubling chain (Straus interleaving): bn254's msm_g2 and the GLV/GLS splits
+of bls12/endomorphism.py use it that way.
+
+Nothing here depends on the curve: the group law is passed in and None is
+the empty accumulator. The window comes from the call, else from
+OptimConfig.window (bn254.optim.config, read by both packages), else
+DEFAULT_WINDOW.
+"""
+from __future__ import annotations
+
+# Window used when neither the call nor OptimConfig.window picks one;
+# lowest total time over every backend in tests/benchmark_wnaf.py
+DEFAULT_WINDOW = 5
+
+# Accepted window range; w = 2 is the plain NAF
+MIN_WINDOW, MAX_WINDOW = 2, 8
+
+
+def wnaf_digits(k: int, w: int) -> list[int]:
+    """
+    Width-w NAF of k, least significant digit first.
+
+    Args:
+        k (int): Scalar, may be negative (all digits are then negated)
+        w (int): Window width ≥ 2
+
+    Returns:
+        List[int]: Digits d_i with k = ∑ d_i·2^i
+    """
+    sign = -1 if k < 0 else 1
+    k = abs(k)
+    full, half = 1 << w, 1 << (w - 1)
+    digits = []
+    while k:
+        if k & 1:
+            d = k & (full - 1)
+            if d >= half:
+                d -= full
+            k -= d
+        else:
+            d = 0
+        digits.append(sign * d)
+        k >>= 1
+    return digits
+
+
+def odd_multiples(P, w: int, add, double, normalize=None) -> list:
+    """
+    Table [P, 3P, 5P, ..., (2^(w-1) - 1)·P] of the odd multiples used by w-NAF.
+
+    ``normalize``, if given, is applied to the finished table (a batch
+    normalization, so that every later addition of a table entry is mixed).
+    """
+    table = [P]
+    if w > 2:
+        P2 = double(P)
+        for _ in range((1 << (w - 2)) - 1):
+            table.append(add(table[-1], P2))
+    return table if normalize is None else normalize(table)
+
+
+def wnaf_interleaved(tables, scalars, add, double, neg, w: int):
+    """
+    ∑ ki·Pi with one shared doubling chain over the w-NAF digits of every ki.
+
+    Args:
+        tables (List[List[Point]]): odd_multiples table of every Pi
+        scalars (List[int]): Scalars, negative ones allowed
+        add (Callable): Group addition
+        double (Callable): Group doubling
+        neg (Callable): Group negation
+        w (int): Window the tables were built for
+
+    Returns:
+        Point | None: ∑ ki·Pi, or None when every scalar is zero
+    """
+    nafs = [wnaf_digits(k, w) for k in scalars]
+    R = None
+    for i in range(max((len(d) for d in nafs), default=0) - 1, -1, -1):
+        if R is not None:
+            R = double(R)
+        for table, naf in zip(tables, nafs):
+            d = naf[i] if i < len(naf) else 0
+            if d:
+                T = table[d >> 1] if d > 0 else neg(table[-d >> 1])
+                R = T if R is None else add(R, T)
+    return R
+
+
+def wnaf_msm(points, scalars, add, double, neg, w: int = DEFAULT_WINDOW):
+    """∑ ki·Pi by Straus' method; returns None when every ki = 0."""
+    tables = [odd_multiples(P, w, add, double) for P in points]
+    return wnaf_interleaved(tables, scalars, add, double, neg, w)
+
+
+def wnaf_mul(P, k: int, add, double, neg, w: int = DEFAULT_WINDOW):
+    """k·P; returns None when k = 0."""
+    return wnaf_msm([P], [k], add, double, neg, w)
+
+
+def resolve_window(window: int | None, optim) -> int:
+    """
+    Explicit argument first, then optim.window, then DEFAULT_WINDOW.
+
+    Raises:
+        ValueError: If the chosen window is outside [MIN_WINDOW, MAX_WINDOW]
+    """
+    if window is None and optim is not None:
+        window = optim.window
+    if window is None:
+        return DEFAULT_WINDOW
+    if not MIN_WINDOW <= window <= MAX_WINDOW:
+        raise ValueError(f"wNAF window must be in [{MIN_WINDOW}, {MAX_WINDOW}], got {window}")
+    return window
@@ -7,13 +7,15 @@ BACKEND = os.getenv("BN254_BACKEND", "pyecc")
 if BACKEND == "mcl":
     # TODO: Once the mcl implementation is ready, update the import path to your mcl module
     from bn254.backend_mcl import (  # ← Placeholder; if unavailable, don't switch to mcl
-        g1_mul, g2_mul, g1, g2, curve_order, rand_scalar, add, pair, msm_g1
+        g1_mul, g2_mul, g1, g2, curve_order, rand_scalar, add, pair, msm_g1, msm_g2,
+        neg, sub, double, is_identity, identity, in_subgroup, batch_in_subgroup
     )
     BACKEND_NAME = "mcl"
 else:
     # For now, use pyecc and ensure that Fr initialization and _to_fr are fixed in backend_pyecc
     from bn254.backend_pyecc import (
-        g1_mul, g2_mul, g1, g2, curve_order, rand_scalar, add
+        g1_mul, g2_mul, g1, g2, curve_order, rand_scalar, add, msm_g2,
+        neg, sub, double, is_identity, identity, in_subgroup, batch_in_subgroup
     )
     BACKEND_NAME = "pyecc"
 
@@ -40,5 +42,6 @@ def _debug_backend():
 
 __all__ = [
     "g1_mul", "g2_mul", "g1", "g2", "curve_order", "rand_scalar",
-    "add", "pair", "msm_g1", "_debug_backend"
+    "add", "pair", "msm_g1", "msm_g2", "neg", "sub", "double", "is_identity",
+    "identity", "in_subgroup", "batch_in_subgroup", "_debug_backend"
 ]
@@ -0,0 +1,59 @@
+# bn254/utils/serialization.py
+"""
+Point serialization for the mcl backend.
+
+Points use mcl's compressed encoding (32-byte G1, 64-byte G2); mcl checks
+the curve equation when decoding but not subgroup membership. The decoders
+here add that check, batched over all points of one call, unless the bytes
+come from a trusted source (our own issuer), e.g.:
+
+    A_list = points_from_bytes(blobs, "g1")
+    pk = g2_from_bytes(data, trusted=True)
+"""
+from __future__ import annotations
+
+from mclbn256 import G1 as _G1, G2 as _G2
+
+from bn254.params import batch_in_subgroup
+
+G1_BYTES = 32
+G2_BYTES = 64
+
+_GROUPS = {"g1": (_G1, G1_BYTES), "g2": (_G2, G2_BYTES)}
+
+
+def point_to_bytes(P) -> bytes:
+    """Compressed mcl encoding of a G1 or G2 point."""
+    return bytes(P.serialize())
+
+
+def _decode(data: bytes, group: str):
+    if group not in _GROUPS:
+        raise ValueError(f"Unknown group {group!r}, expected 'g1' or 'g2'")
+    cls, size = _GROUPS[group]
+    if len(data) != size:
+        raise ValueError(f"{group} encoding must be {size} bytes, got {len(data)}")
+    # mcl raises ValueError for malformed and off-curve encodings
+    return cls.deserialize(bytes(data), size)
+
+
+def points_from_bytes(blobs, group: str = "g1", trusted: bool = False) -> list:
+    """
+    Decode several points of one group with a single batched subgroup check.
+
+    Raises:
+        ValueError: If an encoding is malformed, off the curve or (unless
+            trusted) outside the prime-order subgroup
+    """
+    points = [_decode(data, group) for data in blobs]
+    if not trusted and not batch_in_subgroup(points, group):
+        raise ValueError(f"Decoded {group} point is not in the prime-order subgroup")
+    return points
+
+
+def g1_from_bytes(data: bytes, trusted: bool = False):
+    return points_from_bytes([data], "g1", trusted)[0]
+
+
+def g2_from_bytes(data: bytes, trusted: bool = False):
+    return points_from_bytes([data], "g2", trusted)[0]
@@ -85,30 +85,25 @@ def get_h_bases(n: int):
 
 try:
     from bn254.optim.config import OptimConfig
+    from bn254.optim import config as _optim_config
 except Exception:
     OptimConfig = None  # Fallback to avoid breaking imports
-
-_GLOBAL_OPTIM = None
+    _optim_config = None
 
 
 def set_optim(optim):
     """
     Allow external (backend adapter) to set optimization parameters.
-    If v1 internally needs them, you can store these values into your 
-    existing global variables/context here. For example:
-        some_global.window = optim.window
-        some_global.enable_precompute = optim.precompute
-        some_global.threads = optim.threads
-
-    For now, we simply store a copy so that `_GLOBAL_OPTIM` can be directly
-    read later in v1 if needed.
+
+    The configuration is installed in bn254.optim.config, where the curve
+    backend reads it (e.g. optim.window selects the wNAF width of g1_mul/g2_mul).
     """
-    global _GLOBAL_OPTIM
-    _GLOBAL_OPTIM = optim
+    if _optim_config is not None:
+        _optim_config.set_optim(optim)
 
 
 def get_optim():
-    return _GLOBAL_OPTIM
+    return _optim_config.get_optim() if _optim_config is not None else None
 
 
 def build_U_and_ms(attrs):
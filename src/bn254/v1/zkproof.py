@@ -1,5 +1,5 @@
 from hashlib import sha256
-from ..params import rand_scalar, g1_mul, g2_mul, add, g1, g2, pair, curve_order
+from ..params import rand_scalar, g1_mul, g2_mul, add, sub, g1, g2, pair, curve_order
 from .utils import encode_attributes, get_h_bases
 
 
@@ -90,7 +90,7 @@ def verify_disclosure(pk, proof, total_attrs):
             term = g1_mul(h_bases[i], s_vec[i])
         msg_commit = add(msg_commit, term)
 
-    msg_commit = add(msg_commit, g1_mul(A, (-c) % curve_order))
+    msg_commit = sub(msg_commit, g1_mul(A, c))
 
     lhs = pair(A, add(pk, g2_mul(g2, e)))
     rhs = pair(msg_commit, g2)
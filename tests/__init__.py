@@ -1,3 +1,11 @@
+import sys
+from pathlib import Path
+
+# bn254, and the wNAF and config modules bls12 shares with it, import
+# themselves as the installed top-level package "bn254"; make that work
+# from a checkout too
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
 from .test_basic import test_sign_verify
 from .test_basic_v2 import test_sign_verify_v2
 
@@ -12,6 +20,9 @@ from .test_update_v2 import test_update_v2
 # from .test_update_bn254 import test_update_bn254
 from .benchmark import begin_bench as bench
 from .benchmark_v2 import begin_bench_v2 as bench_v2
+from .benchmark_msm import begin_bench_msm as bench_msm
+from .benchmark_wnaf import begin_bench_wnaf as bench_wnaf
+from .benchmark_pairing import begin_bench_pairing as bench_pairing
 
 __all__ = [
     "test_sign_verify",
@@ -25,4 +36,7 @@ __all__ = [
     #    "test_update_bn254",
     "bench",
     "bench_v2",
+    "bench_msm",
+    "bench_wnaf",
+    "bench_pairing",
 ]
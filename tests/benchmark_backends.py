@@ -0,0 +1,39 @@
+import timeit
+from src.bls12 import backend_jacobian, backend_pyecc
+from src.bls12.bigint import BIGINT_BACKEND
+
+BACKENDS = {"pyecc": backend_pyecc, "jacobian": backend_jacobian}
+
+
+def bench(backend, runs: int = 3):
+    k = backend.rand_scalar()
+    P = backend.g1_mul(backend.G1, backend.rand_scalar())  # not a registered fixed base
+    Q = backend.g2_mul(backend.G2, backend.rand_scalar())
+    bases = [backend.g1_mul(backend.G1, i + 2) for i in range(16)]
+    scalars = [backend.rand_scalar() for _ in bases]
+
+    cases = {
+        "g1_mul": lambda: backend.g1_mul(P, k),
+        "g2_mul": lambda: backend.g2_mul(Q, k),
+        "g1_mul (fixed g1)": lambda: backend.g1_mul(backend.G1, k),
+        "g2_mul (fixed g2)": lambda: backend.g2_mul(backend.G2, k),
+        "msm_g1 (n=16)": lambda: backend.msm_g1(bases, scalars),
+    }
+    return {name: timeit.timeit(fn, number=runs) / runs * 1e3 for name, fn in cases.items()}  # ms
+
+
+def begin_bench_backends():
+    print()
+    print("=" * 10 + " BLS12 backends " + "=" * 10)
+    print(f"big integers: {BIGINT_BACKEND}")
+    results = {name: bench(backend) for name, backend in BACKENDS.items()}
+    print(f"{'operation':18} | {'pyecc (ms)':>11} | {'jacobian (ms)':>13} | speedup")
+    print("-" * 19 + "+" + "-" * 13 + "+" + "-" * 15 + "+--------")
+    for op in results["pyecc"]:
+        a, b = results["pyecc"][op], results["jacobian"][op]
+        print(f"{op:18} | {a:11.3f} | {b:13.3f} | {a / b:6.2f}x")
+    print()
+
+
+if __name__ == "__main__":
+    begin_bench_backends()
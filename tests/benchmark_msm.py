@@ -0,0 +1,38 @@
+import timeit
+from src.bls12.backend_pyecc import G1, _endo_g1, add, double, g1_mul, glv_split_terms, rand_scalar
+from src.bls12.msm import PIPPENGER_THRESHOLD, msm_naive, msm_pippenger, pippenger_window
+
+
+def bench(n_terms: int, runs: int = 3):
+    # The two paths msm_g1 dispatches between: one GLV multiplication per
+    # base, or buckets over the GLV-split terms
+    bases = [g1_mul(G1, i + 2) for i in range(n_terms)]
+    scalars = [rand_scalar() for _ in range(n_terms)]
+    naive_t = timeit.timeit(lambda: msm_naive(bases, scalars, add, g1_mul), number=runs) / runs
+    bucket_t = timeit.timeit(
+        lambda: msm_pippenger(*glv_split_terms(bases, scalars, _endo_g1), add, double), number=runs
+    ) / runs
+    return naive_t * 1e3, bucket_t * 1e3  # ms
+
+
+def begin_bench_msm():
+    print()
+    print("=" * 10 + " BLS12 G1 MSM " + "=" * 10)
+    print("  n | window |  naive (ms) | pippenger (ms)")
+    print("----+--------+-------------+---------------")
+    crossover = None
+    for n in (1, 2, 3, 4, 5, 6, 8, 16, 32, 64):
+        naive, bucket = bench(n)
+        # First size from which the buckets win for every larger n
+        if bucket >= naive:
+            crossover = None
+        elif crossover is None:
+            crossover = n
+        print(f"{n:3} | {pippenger_window(2 * n, 128):6} | {naive:11.3f} | {bucket:13.3f}")
+
+    print(f"Measured crossover: n = {crossover} (PIPPENGER_THRESHOLD = {PIPPENGER_THRESHOLD})")
+    print()
+
+
+if __name__ == "__main__":
+    begin_bench_msm()
@@ -0,0 +1,51 @@
+import timeit
+
+from py_ecc import optimized_bls12_381 as ref
+from py_ecc.optimized_bls12_381 import optimized_pairing as ref_pairing
+
+from src.bls12 import pairing
+from src.bls12.bigint import BIGINT_BACKEND
+from src.bls12.fields import final_exponentiation, fq12_from_pyecc
+
+
+def _ms(fn, runs: int) -> float:
+    return timeit.timeit(fn, number=runs) / runs * 1e3
+
+
+def begin_bench_pairing(runs: int = 3):
+    a, b = 0x1234567, 0x89ABCDEF
+    P_ref, Q_ref = ref.multiply(ref.G1, a), ref.multiply(ref.G2, b)
+    P_aff, Q_aff = ref.normalize(P_ref), ref.normalize(Q_ref)
+    P = tuple(int(c) for c in P_aff)
+    Q = tuple(tuple(int(c) for c in coord.coeffs) for coord in Q_aff)
+    Q_prep = pairing.prepare_g2(Q)
+    f = ref_pairing.miller_loop(Q_ref, P_ref, final_exponentiate=False)
+    f_tower = fq12_from_pyecc(f)
+
+    assert pairing.pairing(P, Q) == ref.pairing(Q_ref, P_ref)
+
+    rows = [
+        ("miller loop", _ms(lambda: ref_pairing.miller_loop(Q_ref, P_ref, final_exponentiate=False), runs),
+         _ms(lambda: pairing.miller_loop([(P, Q_prep)]), runs)),
+        ("final exponentiation", _ms(lambda: ref.final_exponentiate(f), runs),
+         _ms(lambda: final_exponentiation(f_tower), runs)),
+        ("pair(P, Q)", _ms(lambda: ref.pairing(Q_ref, P_ref), runs),
+         _ms(lambda: pairing.pairing(P, Q), runs)),
+        ("pair(P, prepared Q)", None, _ms(lambda: pairing.pairing(P, Q_prep), runs)),
+    ]  # fmt: skip
+
+    print()
+    print("=" * 10 + " BLS12 pairing (ms) " + "=" * 10)
+    print(f"big integers: {BIGINT_BACKEND}")
+    print("operation            | py_ecc    | engine    | speedup")
+    print("---------------------+-----------+-----------+--------")
+    for name, t_ref, t_new in rows:
+        if t_ref is None:
+            print(f"{name:20} |         - | {t_new:9.2f} |       -")
+        else:
+            print(f"{name:20} | {t_ref:9.2f} | {t_new:9.2f} | {t_ref / t_new:6.1f}x")
+    print()
+
+
+if __name__ == "__main__":
+    begin_bench_pairing()
@@ -0,0 +1,62 @@
+import timeit
+
+from src.bls12 import backend_jacobian, backend_pyecc
+from bn254.optim.wnaf import DEFAULT_WINDOW, MAX_WINDOW, MIN_WINDOW
+
+WINDOWS = range(MIN_WINDOW, MAX_WINDOW + 1)
+
+
+def _bench_windows(mul, base, scalars, runs: int = 2):
+    return {
+        w: timeit.timeit(lambda: [mul(base, k, window=w) for k in scalars], number=runs) / (runs * len(scalars)) * 1e3
+        for w in WINDOWS
+    }  # ms
+
+
+def _print_sweep(title, rows):
+    print()
+    print("=" * 10 + f" {title} " + "=" * 10)
+    print("operation          | " + " | ".join(f"w={w:<5}" for w in WINDOWS) + " | best")
+    print("-------------------+" + "+".join("-" * 9 for _ in WINDOWS) + "+-----")
+    for name, times in rows.items():
+        best = min(times, key=times.get)
+        print(f"{name:18} | " + " | ".join(f"{times[w]:7.2f}" for w in WINDOWS) + f" | w={best}")
+
+
+def begin_bench_wnaf():
+    rows = {}
+    for name, backend in (("pyecc", backend_pyecc), ("jacobian", backend_jacobian)):
+        scalars = [backend.rand_scalar() for _ in range(3)]
+        P = backend.g1_mul(backend.G1, backend.rand_scalar())  # not a registered fixed base
+        Q = backend.g2_mul(backend.G2, backend.rand_scalar())
+        rows[f"{name} g1_mul"] = _bench_windows(backend.g1_mul, P, scalars)
+        rows[f"{name} g2_mul"] = _bench_windows(backend.g2_mul, Q, scalars)
+    _print_sweep("BLS12 wNAF window (ms)", rows)
+    all_rows = dict(rows)
+
+    try:
+        from bn254 import backend_pyecc as bn254
+    except ImportError as exc:
+        print(f"\nbn254 backend unavailable ({exc}); skipped")
+        bn254 = None
+    if bn254 is not None:
+        scalars = [bn254.rand_scalar() for _ in range(20)]
+        rows = {
+            "bn254 g1_mul": _bench_windows(bn254.g1_mul, bn254.g1_mul(bn254.G1, 12345), scalars, runs=5),
+            "bn254 g2_mul": _bench_windows(bn254.g2_mul, bn254.g2_mul(bn254.G2, 12345), scalars, runs=5),
+        }
+        _print_sweep("BN254 wNAF window (ms)", rows)
+        all_rows.update(rows)
+
+    # One window serves every backend: the one with the lowest total time,
+    # each operation weighted relative to its own best window
+    overall = {w: sum(times[w] / min(times.values()) for times in all_rows.values()) for w in WINDOWS}
+    best = min(overall, key=overall.get)
+    print()
+    print("relative total     | " + " | ".join(f"{overall[w]:7.2f}" for w in WINDOWS) + f" | w={best}")
+    print(f"Shared window: w = {best} (DEFAULT_WINDOW = {DEFAULT_WINDOW})")
+    print()
+
+
+if __name__ == "__main__":
+    begin_bench_wnaf()
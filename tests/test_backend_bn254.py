@@ -0,0 +1,136 @@
+import pytest
+
+# The bn254 modules import each other as the installed package "bn254", so
+# the tests do too (src.bn254.* would load a second copy of the backend)
+from bn254.backend_pyecc import (
+    _G2_COFACTOR_MIN_PRIME,
+    _mcl_order,
+    _mul_int_generic,
+    _mul_wnaf,
+    ZERO_G2,
+    add,
+    batch_in_subgroup,
+    curve_order,
+    double,
+    g1,
+    g1_mul,
+    g2,
+    g2_mul,
+    identity,
+    in_subgroup,
+    is_identity,
+    msm_g2,
+    neg,
+    rand_scalar,
+    sub,
+)
+from bn254.optim.config import OptimConfig, get_optim, set_optim
+from bn254.optim.wnaf import DEFAULT_WINDOW, resolve_window
+from bn254.utils.serialization import (
+    G1_BYTES,
+    G2_BYTES,
+    g1_from_bytes,
+    g2_from_bytes,
+    point_to_bytes,
+    points_from_bytes,
+)
+
+
+def _off_subgroup_g2():
+    # mcl decodes any x with a point on the twist; shifting the generator's
+    # x until one decodes lands outside G2 (the cofactor is ~2^254)
+    data = bytearray(point_to_bytes(g2))
+    while True:
+        data[0] = (data[0] + 1) % 256
+        try:
+            return points_from_bytes([bytes(data)], "g2", trusted=True)[0]
+        except ValueError:
+            continue
+
+
+def test_g2_cofactor_min_prime():
+    h2 = 2 * _mcl_order("mclBn_getFieldOrder") - _mcl_order("mclBn_getCurveOrder")
+    q = _G2_COFACTOR_MIN_PRIME
+    assert h2 % q == 0
+    assert all(h2 % d for d in range(2, q))
+
+
+def test_g2_off_subgroup_rejected():
+    bad = _off_subgroup_g2()
+    assert bad.valid() and not in_subgroup(bad, "g2")
+    # Large enough for batch_in_subgroup to take the batched path
+    good = [g2_mul(g2, rand_scalar()) for _ in range(80)]
+    assert batch_in_subgroup(good, "g2")
+    assert not batch_in_subgroup(good[:40] + [bad] + good[40:], "g2")
+    assert not batch_in_subgroup([bad], "g2")
+
+    blobs = [point_to_bytes(Q) for Q in good] + [point_to_bytes(bad)]
+    assert all(len(b) == G2_BYTES for b in blobs)
+    with pytest.raises(ValueError):
+        points_from_bytes(blobs, "g2")
+    assert len(points_from_bytes(blobs, "g2", trusted=True)) == 81
+
+
+def test_mul_wnaf_matches_generic():
+    P, Q = g1_mul(g1, 12345), g2_mul(g2, 67890)
+    for k in (0, 1, 2, curve_order - 1, rand_scalar(), rand_scalar()):
+        for w in (2, 4, 6, 8):
+            assert _mul_wnaf(P, k, w) == _mul_int_generic(P, k)
+            assert _mul_wnaf(Q, k, w) == _mul_int_generic(Q, k)
+        assert g1_mul(P, k) == _mul_int_generic(P, k)
+        assert g2_mul(Q, k) == _mul_int_generic(Q, k)
+
+
+def test_mul_wnaf_window_config():
+    P, k = g1_mul(g1, 3), rand_scalar()
+    try:
+        set_optim(OptimConfig(window=3))
+        assert resolve_window(None, get_optim()) == 3
+        assert g1_mul(P, k) == _mul_int_generic(P, k)
+        set_optim(OptimConfig(window=1))  # read by the backend, hence rejected
+        with pytest.raises(ValueError):
+            g1_mul(P, k)
+    finally:
+        set_optim(None)
+    assert resolve_window(None, get_optim()) == DEFAULT_WINDOW
+    with pytest.raises(ValueError):
+        g1_mul(P, k, window=1)
+
+
+def test_msm_g2_matches_generic():
+    bases = [g2_mul(g2, i + 2) for i in range(5)]
+    scalars = [0, 1, curve_order - 1, rand_scalar(), rand_scalar()]
+    expected = ZERO_G2
+    for Q, k in zip(bases, scalars):
+        expected = expected + _mul_int_generic(Q, k)
+    for w in (2, 5):
+        assert msm_g2(bases, scalars, window=w) == expected
+    assert msm_g2(bases + [None], scalars + [7]) == expected
+    assert msm_g2(bases[:1], [0]) == ZERO_G2
+    assert msm_g2([], []) == ZERO_G2
+
+
+def test_group_helpers():
+    P, Q = g1_mul(g1, 11), g1_mul(g1, 4)
+    assert add(P, neg(P)) == identity("g1")
+    assert sub(P, Q) == g1_mul(g1, 7)
+    assert double(P) == g1_mul(g1, 22)
+    assert is_identity(None) and is_identity(identity("g2")) and not is_identity(P)
+    assert neg(None) is None and double(None) is None
+    assert sub(P, None) == P
+    assert identity("g2") == ZERO_G2
+    with pytest.raises(ValueError):
+        identity("gt")
+
+
+def test_serialization_roundtrip():
+    P, Q = g1_mul(g1, rand_scalar()), g2_mul(g2, rand_scalar())
+    assert len(point_to_bytes(P)) == G1_BYTES
+    assert g1_from_bytes(point_to_bytes(P)) == P
+    assert g2_from_bytes(point_to_bytes(Q)) == Q
+    blobs = [point_to_bytes(g1_mul(g1, k)) for k in (1, 2, 3)]
+    assert points_from_bytes(blobs, "g1") == [g1_mul(g1, k) for k in (1, 2, 3)]
+    with pytest.raises(ValueError):
+        g1_from_bytes(point_to_bytes(P)[:-1])
+    with pytest.raises(ValueError):
+        points_from_bytes(blobs, "gt")
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+
+from src.bls12 import backend_jacobian as jac
+from src.bls12 import backend_pyecc as ref
+
+
+def test_jacobian_matches_affine():
+    k = 0x9E3779B97F4A7C15F39CC0605CEDC834
+    P, Q = jac.g1_mul(jac.G1, k), jac.g2_mul(jac.G2, k)
+    assert str(P) == str(ref.g1_mul(ref.G1, k))
+    assert str(Q) == str(ref.g2_mul(ref.G2, k))
+
+    # Unregistered bases take the double-and-add path
+    assert str(jac.g1_mul(P, 7)) == str(ref.g1_mul(ref.g1_mul(ref.G1, k), 7))
+    assert str(jac.ecc_add(P, jac.G1)) == str(ref.ecc_add(ref.g1_mul(ref.G1, k), ref.G1))
+
+    bases = [jac.g1_mul(jac.G1, i + 2) for i in range(5)]
+    scalars = [(i + 1) * k for i in range(5)]
+    ref_bases = [ref.g1_mul(ref.G1, i + 2) for i in range(5)]
+    assert str(jac.msm_g1(bases, scalars)) == str(ref.msm_g1(ref_bases, scalars))
+
+
+def test_jacobian_edge_cases():
+    P = jac.g1_mul(jac.G1, 5)
+    assert jac.g1_mul(P, jac.curve_order) == None  # noqa: E711
+    assert jac.ecc_add(P, jac.g1_mul(P, jac.curve_order - 1)) == None  # noqa: E711
+    assert jac.ecc_add(P, P) == jac.g1_mul(jac.G1, 10)
+    assert jac.ecc_add(None, P) is P
+    assert str(jac.msm_g1([], [])) == "None"
+
+    # Equal points in different Jacobian representations compare and hash equal
+    lam = P.z.__class__(3)
+    R = jac.JacobianPoint(P.x * lam * lam, P.y * lam * lam * lam, P.z * lam)
+    assert R == P and hash(R) == hash(P) and str(R) == str(P)
+
+
+def test_jacobian_protocol_flows():
+    env = dict(os.environ, BLS12_BACKEND="jacobian")
+    script = (
+        "import tests  # puts src/ on sys.path for the shared bn254.optim modules\n"
+        "from src.bls12.params import BACKEND_NAME; assert BACKEND_NAME == 'jacobian'\n"
+        "from src.bls12.v2.keygen_v2 import KeyPair\n"
+        "from src.bls12.v2.signer_v2 import sign\n"
+        "from src.bls12.v2.verifier_v2 import verify\n"
+        "kp = KeyPair.generate(2)\n"
+        "sig = sign(kp, ['a', 'b'])\n"
+        "assert verify(kp.get_pk(), sig, ['a', 'b'])\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", script], cwd=root, env=env, check=True)
+
+
+def test_jacobian_msm_g2():
+    Q = jac.g2_mul(jac.G2, 3)
+    assert str(jac.msm_g2([Q, jac.G2], [11, 2])) == str(ref.g2_mul(ref.G2, 35))
+    assert jac.msm_g2([Q], [jac.curve_order]) == None  # noqa: E711
+
+
+def test_group_helpers():
+    k = 0x1234567
+    for backend in (ref, jac):
+        P, Q = backend.g1_mul(backend.G1, k), backend.g2_mul(backend.G2, k)
+        assert backend.sub(P, backend.G1) == backend.g1_mul(backend.G1, k - 1)
+        assert backend.sub(Q, backend.G2) == backend.g2_mul(backend.G2, k - 1)
+        assert backend.double(P) == backend.g1_mul(backend.G1, 2 * k)
+        assert backend.is_identity(backend.sub(P, P))
+        assert backend.is_identity(backend.identity("g2"))
+        assert backend.ecc_add(P, backend.identity("g1")) == P
+        assert not backend.is_identity(backend.neg(P))
+
+
+def test_batch_normalize():
+    points = [jac.g1_mul(jac.G1, 0x1234567 * (i + 1)) for i in range(4)] + [jac.Z1, None]
+    normalized = jac.batch_normalize(points)
+    assert normalized == points
+    assert [str(P) for P in normalized] == [str(P) for P in points]
+    assert all(P.z == P.z.one() for P in normalized[:4])
+    # Mixed and general additions agree
+    assert jac.ecc_add(normalized[0], points[1]) == jac.ecc_add(points[0], points[1])
+    assert jac.ecc_add(normalized[0], normalized[0]) == jac.double(points[0])
+    Q = [jac.g2_mul(jac.G2, 0x89ABCDEF), jac.g2_mul(jac.G2, 0x1234567)]
+    assert jac.batch_normalize(Q) == Q
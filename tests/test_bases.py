@@ -0,0 +1,27 @@
+import threading
+
+from src.bls12.params import g1, g1_mul
+from src.bls12.v1.bases import BasisRegistry
+
+
+def test_bases_match_generator_multiples():
+    registry = BasisRegistry(preload=4)
+    assert registry.get(3) == [g1_mul(g1, i + 2) for i in range(3)]
+    assert len(registry) == 4
+    # Grows on demand, earlier bases unchanged
+    assert registry.get(11)[9:] == [g1_mul(g1, 11), g1_mul(g1, 12)]
+    assert registry.select([20, 0]) == [g1_mul(g1, 22), g1_mul(g1, 2)]
+    assert registry.get(0) == []
+
+
+def test_bases_concurrent_growth():
+    registry = BasisRegistry(preload=1)
+    results = []
+    threads = [threading.Thread(target=lambda n=n: results.append(registry.get(n))) for n in (5, 17, 9, 30)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    full = registry.get(30)
+    assert all(r == full[: len(r)] for r in results)
+    assert full[29] == g1_mul(g1, 31)
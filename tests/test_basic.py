@@ -1,4 +1,6 @@
-from src.bls12.v1 import KeyPair, sign, verify
+import pytest
+
+from src.bls12.v1 import KeyPair, sign, signing_pool, verify, verify_batch
 
 
 # This function tests the basic signing and verification process using BBS+.
@@ -10,3 +12,31 @@ def test_sign_verify():
     msgs = ["a", "b"]
     sig = sign(kp.sk, msgs)
     return verify(kp.pk, sig, msgs)
+
+
+def test_verify_batch():
+    kp1, kp2 = KeyPair.generate(), KeyPair.generate()
+    items = []
+    for i in range(6):
+        kp = kp1 if i % 3 else kp2
+        msgs = [f"m{i}", "x", "y"][: 1 + i % 3]
+        items.append((kp.pk, sign(kp.sk, msgs), msgs))
+    assert verify_batch(items) == [True] * 6
+    assert verify_batch([]) == []
+
+    # A wrong message and a signature checked against the other issuer's key
+    items[2] = (items[2][0], items[2][1], ["forged"] + items[2][2][1:])
+    items[4] = (kp2.pk, items[4][1], items[4][2])
+    assert verify_batch(items) == [True, True, False, True, False, True]
+
+
+def test_sign_with_pool():
+    kp = KeyPair.generate()
+    msgs = ["a", "b", "c"]
+    with signing_pool(kp.sk, depth=2) as pool:
+        assert str(kp.sk) not in repr(vars(pool))  # the pool keeps a fingerprint, not sk
+        for _ in range(3):  # more than the depth: falls back to inline items
+            assert verify(kp.pk, sign(kp.sk, msgs, pool=pool), msgs)
+        assert verify(kp.pk, sign(kp.sk, [], pool=pool), [])
+    with pytest.raises(ValueError):
+        sign(KeyPair.generate().sk, msgs, pool=pool)
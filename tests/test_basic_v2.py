@@ -1,4 +1,8 @@
-from src.bls12.v2 import KeyPair, sign, verify
+import pytest
+
+from src.bls12.v2 import KeyPair, sign, sign_batch, signing_pool, verify, verify_batch
+from src.bls12.v2.signer_v2 import SIGN_BATCH_TABLE_MIN, _compute_A
+from src.bls12.v2.utils_v2 import encode_attributes
 
 
 def test_sign_verify_v2():
@@ -6,3 +10,44 @@ def test_sign_verify_v2():
     msgs = ["a", "b"]
     sig = sign(kp, msgs)
     return verify(kp.get_pk(), sig, msgs)
+
+
+def test_verify_batch_v2():
+    kp = KeyPair.generate(4)
+    pk = kp.get_pk()
+    messages_list = [["a"], ["a", "b", "c"], ["x", "y", "z", "w"], []]
+    sigs = [sign(kp, msgs) for msgs in messages_list]
+    assert verify_batch(pk, sigs, messages_list) == [True] * 4
+    assert verify_batch(pk, [], []) == []
+
+    tampered = messages_list[:2] + [["x", "y", "z", "v"]] + messages_list[3:]
+    assert verify_batch(pk, sigs, tampered) == [True, True, False, True]
+    assert verify_batch(KeyPair.generate(4).get_pk(), sigs, messages_list) == [False] * 4
+
+    # More messages than the key has bases, and a signature without messages
+    too_long = messages_list[:1] + [["a", "b", "c", "d", "e"]] + messages_list[2:]
+    assert verify_batch(pk, sigs, too_long) == [True, False, True, True]
+    assert verify_batch(pk, sigs, messages_list[:3]) == [True, True, True, False]
+
+
+def test_sign_batch_v2():
+    kp = KeyPair.generate(3)
+    for n in (3, SIGN_BATCH_TABLE_MIN):
+        messages_list = [[f"m{i % 4}", "b", "c"][: 1 + i % 3] for i in range(n)]
+        sigs = sign_batch(kp, messages_list)
+        for (A, r), msgs in zip(sigs, messages_list):
+            # Same A as sign would produce for the same r
+            assert A == _compute_A(kp.x, kp.y, r, kp.h_bases, encode_attributes(msgs))
+            assert verify(kp.get_pk(), (A, r), msgs)
+    assert sign_batch(kp, []) == []
+
+
+def test_sign_with_pool_v2():
+    kp = KeyPair.generate(3)
+    pool = signing_pool(kp, depth=4, background=False)
+    pool.fill()
+    assert len(pool) == 4
+    for msgs in (["a", "b", "c"], ["a"], []):
+        assert verify(kp.get_pk(), sign(kp, msgs, pool=pool), msgs)
+    with pytest.raises(ValueError):
+        sign(KeyPair.generate(3), ["a"], pool=pool)
@@ -0,0 +1,46 @@
+from src.bls12 import backend_jacobian as jac
+from src.bls12.backend_pyecc import G1, G2, add, double, g1_mul, g2_mul, msm_g1, curve_order
+from src.bls12.endomorphism import BLS_X, GLV_LAMBDA, GLV_BETA, glv_decompose, glv_mul, gls_decompose
+from py_ecc.bls12_381 import multiply, neg
+
+jac_Q = jac.g2_mul(jac.G2, 77)
+
+
+def test_glv_constants():
+    assert GLV_LAMBDA * GLV_LAMBDA + GLV_LAMBDA + 1 == curve_order
+    assert (G1[0] * GLV_BETA, G1[1]) == multiply(G1, GLV_LAMBDA)
+
+
+def test_glv_decompose():
+    for k in (0, 1, GLV_LAMBDA, GLV_LAMBDA + 1, curve_order - 1, 0x9E3779B97F4A7C15F39CC0605CEDC834 << 100):
+        k1, k2 = glv_decompose(k)
+        assert (k1 + k2 * GLV_LAMBDA - k) % curve_order == 0
+        assert k1.bit_length() <= 128 and k2.bit_length() <= 128
+
+
+def test_glv_mul_matches_multiply():
+    P = multiply(G1, 77)
+    endo = lambda Q: (Q[0] * GLV_BETA, Q[1])
+    for k in (1, 2, GLV_LAMBDA, curve_order - 1, 0x9E3779B97F4A7C15F39CC0605CEDC834 << 100):
+        assert glv_mul(P, k, add, double, neg, endo) == multiply(P, k)
+    assert glv_mul(P, curve_order, add, double, neg, endo) is None
+    assert g1_mul(P, curve_order - 5) == multiply(P, curve_order - 5)
+    assert msm_g1([P, G1, P], [3, curve_order - 1, GLV_LAMBDA]) == add(
+        multiply(P, 3 + GLV_LAMBDA), multiply(G1, curve_order - 1)
+    )
+
+
+def test_gls_decompose():
+    for k in (0, 1, -BLS_X, curve_order - 1, 0x9E3779B97F4A7C15F39CC0605CEDC834 << 100):
+        digits = gls_decompose(k)
+        assert sum(a * (-BLS_X) ** i for i, a in enumerate(digits)) == k % curve_order
+        assert all(a.bit_length() <= 64 for a in digits)
+
+
+def test_gls_g2_mul_matches_multiply():
+    Q = multiply(G2, 77)
+    for k in (1, 2, -BLS_X, curve_order - 1, 0x9E3779B97F4A7C15F39CC0605CEDC834 << 100):
+        assert g2_mul(Q, k) == multiply(Q, k)
+        assert str(jac.g2_mul(jac_Q, k)) == str(multiply(Q, k))
+    assert g2_mul(Q, curve_order) is None
+    assert jac.g2_mul(jac_Q, curve_order) == None  # noqa: E711
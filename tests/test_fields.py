@@ -0,0 +1,51 @@
+import random
+
+from py_ecc.optimized_bls12_381 import FQ2, FQ12, field_modulus, final_exponentiate
+
+from src.bls12.fields import (
+    Fq2,
+    final_exponentiation,
+    fq12_frobenius,
+    fq12_from_pyecc,
+    fq12_inv,
+    fq12_mul,
+    fq12_sqr,
+    fq12_to_pyecc_coeffs,
+)
+
+
+def _rand_fq12(rng):
+    return FQ12([rng.randrange(field_modulus) for _ in range(12)])
+
+
+def _coeffs(f):
+    return [int(c) for c in f.coeffs]
+
+
+def test_fq12_matches_pyecc():
+    rng = random.Random(1)
+    a, b = _rand_fq12(rng), _rand_fq12(rng)
+    ta, tb = fq12_from_pyecc(a), fq12_from_pyecc(b)
+    assert fq12_to_pyecc_coeffs(ta) == _coeffs(a)
+    assert fq12_to_pyecc_coeffs(fq12_mul(ta, tb)) == _coeffs(a * b)
+    assert fq12_to_pyecc_coeffs(fq12_sqr(ta)) == _coeffs(a * a)
+    assert fq12_to_pyecc_coeffs(fq12_inv(ta)) == _coeffs(a.inv())
+    for k in (1, 2, 3):
+        assert fq12_to_pyecc_coeffs(fq12_frobenius(ta, k)) == _coeffs(a ** (field_modulus**k))
+
+
+def test_final_exponentiation_matches_pyecc():
+    a = _rand_fq12(random.Random(2))
+    assert fq12_to_pyecc_coeffs(final_exponentiation(fq12_from_pyecc(a))) == _coeffs(final_exponentiate(a))
+
+
+def test_fq2_class_matches_pyecc():
+    rng = random.Random(3)
+    x = FQ2([rng.randrange(field_modulus) for _ in range(2)])
+    y = FQ2([rng.randrange(field_modulus) for _ in range(2)])
+    X, Y = Fq2(*x.coeffs), Fq2(*y.coeffs)
+    assert (X * Y).coeffs == tuple((x * y).coeffs)
+    assert (X / Y).coeffs == tuple((x / y).coeffs)
+    assert (X - 3 * Y).coeffs == tuple((x - 3 * y).coeffs)
+    assert X.square() == X * X
+    assert X.conj() * X == Fq2(X.c0 * X.c0 + X.c1 * X.c1)
@@ -0,0 +1,30 @@
+import pytest
+
+from src.bls12.backend_pyecc import G1, G2, g1_mul, g2_mul, pair, pair_cached
+from src.bls12.gt import GT_BYTES, GT_ONE, gt_from_bytes, gt_inv, gt_mul, gt_pow, gt_to_bytes
+
+
+def test_gt_pow_matches_pairing():
+    k = 0x1234567890ABCDEF1234567890ABCDEF1234567890ABCDEF
+    e = pair(G1, G2)
+    assert gt_pow(e, k) == pair(g1_mul(G1, k), G2)
+    assert gt_pow(e, -k) == gt_inv(gt_pow(e, k))
+    assert gt_pow(e, 0) == GT_ONE
+    assert gt_mul(e, gt_inv(e)) == GT_ONE
+
+
+def test_pair_cached_power():
+    A, Y, r = g1_mul(G1, 0x1234567), g2_mul(G2, 0x89ABCDEF), 0x5555
+    assert gt_pow(pair_cached(A, Y), r) == pair(A, g2_mul(Y, r))
+
+
+def test_gt_encoding_roundtrip():
+    e = pair(g1_mul(G1, 0x1234567), G2)
+    data = gt_to_bytes(e)
+    assert len(data) == GT_BYTES
+    assert gt_from_bytes(data) == e
+    assert gt_from_bytes(gt_to_bytes(GT_ONE)) == GT_ONE
+    with pytest.raises(ValueError):
+        gt_from_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    with pytest.raises(ValueError):
+        gt_from_bytes(data[:-1])
@@ -0,0 +1,27 @@
+import hashlib
+
+from py_ecc.bls.hash_to_curve import hash_to_G1
+from py_ecc.optimized_bls12_381 import normalize
+
+from src.bls12.backend_jacobian import hash_to_g1 as hash_to_g1_jacobian, to_affine as to_affine_jacobian
+from src.bls12.backend_pyecc import hash_to_g1, in_subgroup, to_affine
+from src.bls12.hash_to_curve import hash_to_g1_affine
+
+DST = b"QUUX-V01-CS02-with-BLS12381G1_XMD:SHA-256_SSWU_RO_"
+
+
+def test_rfc9380_vector():
+    # RFC 9380, appendix J.9.1, msg = ""
+    assert hash_to_g1_affine(b"", DST) == (
+        0x052926ADD2207B76CA4FA57A8734416C8DC95E24501772C814278700EED6D1E4E8CF62D9C09DB0FAC349612B759E79A1,
+        0x08BA738453BFED09CB546DBB0783DBB3A5F1F566ED67BB6BE0E8C67E2E81A4CC68EE29813BB7994998F3EAE0C9C6A265,
+    )
+
+
+def test_hash_to_g1_matches_py_ecc():
+    for msg in (b"abc", b"BBS_PLUS_H0", b"a" * 200):
+        x, y = normalize(hash_to_G1(msg, DST, hashlib.sha256))
+        assert to_affine(hash_to_g1(msg, DST)) == (int(x), int(y))
+        assert to_affine_jacobian(hash_to_g1_jacobian(msg, DST)) == (int(x), int(y))
+    assert in_subgroup(hash_to_g1(b"abc", DST))
+    assert hash_to_g1(b"abc", DST) != hash_to_g1(b"abc", DST + b"2")
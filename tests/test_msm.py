@@ -0,0 +1,32 @@
+from py_ecc.bls12_381 import multiply
+
+from src.bls12.backend_pyecc import G1, G2, add, double, g1_mul, g2_mul, msm_g1, msm_g2, curve_order, register_fixed_g2
+from src.bls12.msm import msm_naive, msm_pippenger
+
+
+def test_msm_matches_naive():
+    bases = [g1_mul(G1, i + 2) for i in range(8)]
+    scalars = [(i + 1) * 0x9E3779B97F4A7C15F39CC0605CEDC834 % curve_order for i in range(8)]
+    expected = msm_naive(bases, scalars, add, g1_mul)
+    assert msm_g1(bases, scalars) == expected
+    for c in (1, 3, 7):
+        assert msm_pippenger(bases, scalars, add, double, window=c) == expected
+
+
+def test_msm_edge_cases():
+    P = g1_mul(G1, 5)
+    assert msm_g1([], []) is None
+    assert msm_g1([P, P], [0, curve_order]) is None
+    assert msm_g1([P, None, P], [3, 7, curve_order - 3]) is None
+    assert msm_g1([P, P, P], [1, 2, 3]) == g1_mul(P, 6)
+
+
+def test_msm_g2_matches_separate():
+    Q1, Q2, Q3 = (multiply(G2, i) for i in (3, 5, 7))
+    register_fixed_g2(Q3)
+    scalars = [0x9E3779B97F4A7C15F39CC0605CEDC834, curve_order - 1, 12345, 1]
+    expected = multiply(G2, (3 * scalars[0] + 5 * scalars[1] + 7 * scalars[2] + 1) % curve_order)
+    assert msm_g2([Q1, Q2, Q3, G2], scalars) == expected
+    assert msm_g2([Q1, Q2], [5, curve_order - 3]) is None
+    assert msm_g2([], []) is None
+    assert msm_g2([Q1], [10], window=2) == g2_mul(Q1, 10)
@@ -0,0 +1,41 @@
+from py_ecc.optimized_bls12_381 import FQ, FQ2, pairing
+
+from src.bls12.backend_pyecc import (
+    G1, G2, G2_PREPARED, g1_mul, g2_mul, neg, pair, pairing_product_is_one, prepare_g2, rand_scalar,
+    to_affine,
+)
+
+
+def _optimized(P):
+    # py_ecc.optimized_bls12_381 point (x, y, 1) from plain affine integers
+    x, y = to_affine(P)
+    F = FQ2 if isinstance(x, tuple) else FQ
+    return F(x), F(y), F.one()
+
+
+def test_pair_matches_py_ecc():
+    for _ in range(3):
+        P, Q = g1_mul(G1, rand_scalar()), g2_mul(G2, rand_scalar())
+        assert pair(P, Q) == pairing(_optimized(Q), _optimized(P))
+
+
+def test_pair_bilinear():
+    a, b = 0x1234567, 0x89ABCDEF
+    assert pair(g1_mul(G1, a), g2_mul(G2, b)) == pair(g1_mul(G1, a * b), G2)
+
+
+def test_pairing_product_is_one():
+    a, b = 0x1234567, 0x89ABCDEF
+    P, Q = g1_mul(G1, a), g2_mul(G2, b)
+    assert pairing_product_is_one([(P, Q), (neg(g1_mul(G1, a * b)), G2)])
+    assert not pairing_product_is_one([(P, Q), (neg(g1_mul(G1, a * b + 1)), G2)])
+    assert pairing_product_is_one([(P, None), (None, Q)])
+    assert pairing_product_is_one([])
+
+
+def test_prepared_g2_matches_point():
+    P, Q = g1_mul(G1, 0x1234567), g2_mul(G2, 0x89ABCDEF)
+    Q_prep = prepare_g2(Q)
+    assert pair(P, Q_prep) == pair(P, Q)
+    assert pair(P, G2_PREPARED) == pair(P, G2)
+    assert pairing_product_is_one([(P, Q_prep), (neg(g1_mul(P, 0x89ABCDEF)), G2_PREPARED)])
@@ -0,0 +1,41 @@
+from py_ecc.bls12_381 import add, double, multiply
+
+from src.bls12.backend_pyecc import G1, G2, curve_order, g2_mul, register_fixed_g2
+from src.bls12.precompute import FIXED_BUILD_AFTER, CombTable, FixedBaseRegistry
+
+
+def test_comb_table_matches_multiply():
+    table = CombTable(G1, add, double, teeth=4)
+    for k in (0, 1, 2, 0xDEADBEEF, curve_order - 1, 2**254 + 12345):
+        assert table.mul(k, add, double) == multiply(G1, k)
+
+
+def test_registry_is_lazy_and_bounded():
+    key = lambda P: (int(P[0]), int(P[1]))
+    registry = FixedBaseRegistry(add, double, key, teeth=3, max_bases=2)
+    P, Q, R = G1, double(G1), add(G1, double(G1))
+    for pt in (P, Q, R):
+        registry.register(pt)
+    assert len(registry) == 2
+    assert registry.mul(P, 5) is NotImplemented  # evicted as least recently used
+    assert registry._tables[key(Q)] is None  # registered, not built yet
+    assert registry.mul(Q, 7) == multiply(Q, 7)
+    assert registry._tables[key(Q)] is not None
+
+
+def test_registry_builds_after_repeated_use():
+    key = lambda P: (int(P[0]), int(P[1]))
+    registry = FixedBaseRegistry(add, double, key, teeth=3, build_after=2)
+    registry.register(G1)
+    assert registry.mul(G1, 5) is NotImplemented  # first use: variable-base path
+    assert registry._tables[key(G1)] is None
+    assert registry.mul(G1, 7) == multiply(G1, 7)
+    assert registry._tables[key(G1)] is not None
+
+
+def test_g2_mul_uses_registered_table():
+    Y = multiply(G2, 987654321)
+    register_fixed_g2(Y)
+    k = 0x1234567890ABCDEF1234567890ABCDEF
+    for _ in range(FIXED_BUILD_AFTER + 1):
+        assert g2_mul(Y, k) == multiply(Y, k)
@@ -1,4 +1,4 @@
-from src.bls12.v2 import KeyPair, sign, prove_disclosure, verify_disclosure
+from src.bls12.v2 import KeyPair, sign, prove_disclosure, verify_disclosure, verify_disclosure_batch
 
 
 def test_proof_v2():
@@ -7,3 +7,21 @@ def test_proof_v2():
     sig = sign(kp, msgs)
     proof = prove_disclosure(kp.get_pk(), sig, msgs, disclosed_indices=[1])
     return verify_disclosure(kp.get_pk(), proof)
+
+
+def test_proof_batch_v2():
+    kp = KeyPair.generate(4)
+    pk = kp.get_pk()
+    proofs = []
+    for k in range(5):
+        msgs = [f"m{k}", "b", "c", "d"][: 2 + k % 3]
+        proofs.append(prove_disclosure(pk, sign(kp, msgs), msgs, disclosed_indices=[0]))
+    assert verify_disclosure_batch(pk, proofs) == [True] * 5
+    assert verify_disclosure_batch(pk, []) == []
+
+    # A forged response passes the challenge check but not the pairing equation;
+    # a changed disclosed message breaks the challenge
+    proofs[1] = dict(proofs[1], z_r=(proofs[1]["z_r"] + 1))
+    proofs[3] = dict(proofs[3], disclosed_messages={0: "forged"})
+    assert verify_disclosure_batch(pk, proofs) == [True, False, True, False, True]
+    assert [verify_disclosure(pk, p) for p in proofs] == [True, False, True, False, True]
@@ -0,0 +1,95 @@
+import pytest
+from py_ecc.bls.point_compression import compress_G1, compress_G2
+from py_ecc.optimized_bls12_381 import G1 as REF_G1, G2 as REF_G2, multiply
+
+from src.bls12 import v1, v2
+from src.bls12.fields import fq_sqrt
+from src.bls12.params import (
+    add,
+    batch_in_subgroup,
+    from_affine,
+    g1,
+    g1_mul,
+    g2,
+    g2_mul,
+    identity,
+    in_subgroup,
+)
+from src.bls12.serialize import (
+    G1_BYTES,
+    G2_BYTES,
+    g1_from_bytes,
+    g1_to_bytes,
+    g2_from_bytes,
+    g2_to_bytes,
+)
+
+
+def test_points_match_zcash_format():
+    for k in (1, 7, 0x1234567890ABCDEF1234567890ABCDEF):
+        P, Q = g1_mul(g1, k), g2_mul(g2, k)
+        z1, z2 = compress_G2(multiply(REF_G2, k))
+        assert g1_to_bytes(P) == compress_G1(multiply(REF_G1, k)).to_bytes(G1_BYTES, "big")
+        assert g2_to_bytes(Q) == z1.to_bytes(48, "big") + z2.to_bytes(48, "big")
+        assert g1_from_bytes(g1_to_bytes(P)) == P
+        assert g2_from_bytes(g2_to_bytes(Q)) == Q
+    assert g1_from_bytes(g1_to_bytes(identity("g1"))) == identity("g1")
+    assert len(g2_to_bytes(identity("g2"))) == G2_BYTES
+
+
+def test_invalid_points_rejected():
+    data = g1_to_bytes(g1_mul(g1, 5))
+    with pytest.raises(ValueError):
+        g1_from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        g1_from_bytes(bytes([data[0] & 0x7F]) + data[1:])  # compression flag cleared
+    with pytest.raises(ValueError):
+        g1_from_bytes(bytes([0x80]) + bytes(46) + b"\x03")  # x = 3 is not on the curve
+
+
+def test_v1_layouts_roundtrip():
+    kp = v1.KeyPair.generate()
+    msgs = ["a", "b", "c"]
+    sig = v1.sign(kp.sk, msgs)
+    assert v1.keypair_from_bytes(v1.keypair_to_bytes(kp)) == kp
+    assert v1.signatures_from_bytes(v1.signatures_to_bytes([sig, sig])) == [sig, sig]
+    proof = v1.prove_disclosure(kp.pk, sig, msgs, [1])
+    decoded = v1.proof_from_bytes(v1.proof_to_bytes(proof))
+    assert decoded == proof
+    assert v1.verify_disclosure(v1.public_key_from_bytes(v1.public_key_to_bytes(kp.pk)), decoded, 3)
+
+
+def test_v2_layouts_roundtrip():
+    kp = v2.KeyPair.generate(3)
+    msgs = ["a", "b", "c"]
+    sig = v2.sign(kp, msgs)
+    assert v2.keypair_from_bytes(v2.keypair_to_bytes(kp)) == kp
+    assert v2.signature_from_bytes(v2.signature_to_bytes(sig)) == sig
+    pk = v2.public_key_from_bytes(v2.public_key_to_bytes(kp.get_pk()))
+    proof = v2.prove_disclosure(kp.get_pk(), sig, msgs, [0, 2])
+    decoded = v2.proof_from_bytes(v2.proof_to_bytes(proof))
+    assert decoded == proof
+    assert v2.verify_disclosure(pk, decoded)
+
+
+def _off_subgroup_g1():
+    # A point of E(Fq) outside G1: x = 4 gives y² = 68, a square mod p
+    return from_affine((4, int(fq_sqrt(68))), "g1")
+
+
+def test_subgroup_checks():
+    bad = g1_to_bytes(_off_subgroup_g1())
+    with pytest.raises(ValueError):
+        g1_from_bytes(bad)
+    assert not in_subgroup(g1_from_bytes(bad, trusted=True))
+
+    # Large enough for the random-combination path
+    good = [g1]
+    for _ in range(150):
+        good.append(add(good[-1], g1))
+    assert batch_in_subgroup(good)
+    assert not batch_in_subgroup(good + [add(good[0], _off_subgroup_g1())])
+    good2 = [g2]
+    for _ in range(80):
+        good2.append(add(good2[-1], g2))
+    assert batch_in_subgroup(good2, "g2")
@@ -1,4 +1,4 @@
-from src.bls12.v1 import KeyPair, sign, update_attributes, verify
+from src.bls12.v1 import CommitmentCache, KeyPair, sign, signing_pool, update_attributes, verify
 
 
 def test_update():
@@ -8,3 +8,22 @@ def test_update():
     sig2 = update_attributes(kp.sk, sig, msgs, {2: "m3*"})
     msgs[2] = "m3*"
     return verify(kp.pk, sig2, msgs)
+
+
+def test_update_incremental():
+    kp = KeyPair.generate()
+    cache = CommitmentCache()
+    msgs = ["m1", "m2", "m3", "m4"]
+    sig = sign(kp.sk, msgs, cache=cache)
+    sig2 = update_attributes(kp.sk, sig, msgs, {1: "m2*", 3: "m4"}, cache=cache)
+    msgs2 = ["m1", "m2*", "m3", "m4"]
+    assert sig2 == update_attributes(kp.sk, sig, msgs, {1: "m2*"})
+    assert verify(kp.pk, sig2, msgs2)
+
+    # Chained through the cache, and with a signature from a pool
+    sig3 = update_attributes(kp.sk, sig2, msgs2, {0: "m1*"}, cache=cache)
+    assert verify(kp.pk, sig3, ["m1*", "m2*", "m3", "m4"])
+    with signing_pool(kp.sk, depth=1, background=False) as pool:
+        sig4 = sign(kp.sk, msgs, pool=pool, cache=cache)
+    assert verify(kp.pk, update_attributes(kp.sk, sig4, msgs, {2: "x"}, cache=cache), ["m1", "m2", "x", "m4"])
+    assert len(cache) == 5
@@ -1,4 +1,4 @@
-from src.bls12.v2 import KeyPair, sign, update_attributes, verify
+from src.bls12.v2 import CommitmentCache, KeyPair, sign, signing_pool, update_attributes, verify
 
 
 def test_update_v2():
@@ -8,3 +8,20 @@ def test_update_v2():
     sig2 = update_attributes(kp, sig, msgs, {2: "m3*"})
     msgs[2] = "m3*"
     return verify(kp.get_pk(), sig2, msgs)
+
+
+def test_update_incremental_v2():
+    kp = KeyPair.generate(5)
+    cache = CommitmentCache()
+    msgs = ["m1", "m2", "m3", "m4"]
+    sig = sign(kp, msgs, cache=cache)
+    sig2 = update_attributes(kp, sig, msgs, {1: "m2*", 3: "m4"}, cache=cache)
+    msgs2 = ["m1", "m2*", "m3", "m4"]
+    assert sig2 == update_attributes(kp, sig, msgs, {1: "m2*"})
+    assert verify(kp.get_pk(), sig2, msgs2)
+
+    sig3 = update_attributes(kp, sig2, msgs2, {0: "m1*"}, cache=cache)
+    assert verify(kp.get_pk(), sig3, ["m1*", "m2*", "m3", "m4"])
+    with signing_pool(kp, depth=1, background=False) as pool:
+        sig4 = sign(kp, msgs, pool=pool, cache=cache)
+    assert verify(kp.get_pk(), update_attributes(kp, sig4, msgs, {2: "x"}, cache=cache), ["m1", "m2", "x", "m4"])
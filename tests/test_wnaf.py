@@ -0,0 +1,50 @@
+import pytest
+from py_ecc.bls12_381 import G1, G2, add, double, multiply, neg
+
+from bn254.optim.config import OptimConfig, get_optim, set_optim
+from bn254.optim.wnaf import DEFAULT_WINDOW, resolve_window, wnaf_digits, wnaf_mul
+from src.bls12 import params
+from src.bls12.backend_pyecc import g1_mul, g2_mul, curve_order
+
+
+def test_wnaf_digits():
+    for w in (2, 3, 5, 8):
+        for k in (1, 7, 0xDEADBEEF, curve_order - 1):
+            digits = wnaf_digits(k, w)
+            assert sum(d << i for i, d in enumerate(digits)) == k
+            assert all(d % 2 and abs(d) < 1 << (w - 1) for d in digits if d)
+            nonzero = [i for i, d in enumerate(digits) if d]
+            assert all(b - a >= w for a, b in zip(nonzero, nonzero[1:]))
+    assert sum(d << i for i, d in enumerate(wnaf_digits(-1234, 4))) == -1234
+
+
+def test_wnaf_mul_matches_multiply():
+    P = multiply(G1, 77)
+    k = 0x9E3779B97F4A7C15F39CC0605CEDC834 << 100
+    for w in (2, 4, 6):
+        assert wnaf_mul(P, k, add, double, neg, w) == multiply(P, k)
+        assert g1_mul(P, k, window=w) == multiply(P, k)
+    assert wnaf_mul(P, 0, add, double, neg) is None
+    Q = multiply(G2, 5)
+    assert g2_mul(Q, k, window=3) == multiply(Q, k)
+
+
+def test_window_resolution():
+    assert resolve_window(None, None) == DEFAULT_WINDOW
+    assert resolve_window(None, OptimConfig(window=6)) == 6
+    assert resolve_window(3, OptimConfig(window=6)) == 3
+    with pytest.raises(ValueError):
+        resolve_window(1, None)
+
+    # One knob for both curves: bls12 re-exports the bn254 configuration
+    assert params.set_optim is set_optim and params.OptimConfig is OptimConfig
+    previous = get_optim()
+    try:
+        set_optim(OptimConfig(window=2))
+        assert resolve_window(None, get_optim()) == 2
+        assert g1_mul(multiply(G1, 3), 1000) == multiply(G1, 3000)
+        set_optim(OptimConfig(window=1))  # read by the backend, hence rejected
+        with pytest.raises(ValueError):
+            g1_mul(multiply(G1, 3), 1000)
+    finally:
+        set_optim(previous)